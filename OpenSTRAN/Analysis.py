@@ -0,0 +1,160 @@
+from .Nodes import Nodes
+from .Members import Members
+from .Stats import SolveStats
+from .Submember import FORCE_KEYS
+from .Elements import ELEMENT_NODE_DOFS, element_dof_indices
+
+from dataclasses import dataclass, asdict
+
+import numpy as np
+
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisResult():
+    """Immutable results of one solve of a model.
+
+    Returned by :meth:`Model.analyze`, which leaves the model untouched, so
+    a model can be solved for several load cases at once on threads. The
+    arrays have the layout of the :class:`ResultStore` arrays of the same
+    name, so results can be enveloped with :func:`envelope`, and are
+    read-only.
+
+    :ivar member_offsets: (M+1,) array; the submembers of member ``k`` are
+        rows ``member_offsets[k-1]:member_offsets[k]``
+    :type member_offsets: numpy.ndarray
+    :ivar submember_forces: (S, 6, 2) array of end forces in the order of
+        :data:`FORCE_KEYS`
+    :type submember_forces: numpy.ndarray
+    :ivar node_displacements: (N, 6) array of [Ux, Uy, Uz, φx, φy, φz]
+        ordered by node ID
+    :type node_displacements: numpy.ndarray
+    :ivar node_reactions: (N, 6) array of [Rx, Ry, Rz, Rmx, Rmy, Rmz]
+        ordered by node ID, zero at mesh nodes
+    :type node_reactions: numpy.ndarray
+    :ivar stats: Timings and sizes collected by the solve
+    :type stats: SolveStats
+
+    :Example:
+
+        >>> with ThreadPoolExecutor() as executor:
+        ...     results = list(executor.map(frame.analyze, [dead, live]))
+        >>> results[0].member_forces(3, 'major axis moments')
+    """
+    member_offsets: np.ndarray
+    submember_forces: np.ndarray
+    node_displacements: np.ndarray
+    node_reactions: np.ndarray
+    stats: SolveStats
+
+    def __post_init__(self) -> None:
+        for array in (self.member_offsets, self.submember_forces,
+                      self.node_displacements, self.node_reactions):
+            array.setflags(write=False)
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    def member_forces(self, member_ID: int, force: str | None = None) -> np.ndarray:
+        """Return the end forces of every submember of a member.
+
+        :param member_ID: Member ID as assigned by :meth:`Members.addMember`
+        :type member_ID: int
+        :param force: One of :data:`FORCE_KEYS`, e.g. 'major axis moments'.
+            Defaults to None for all forces.
+        :type force: str | None
+        :returns: (n, 2) array of i and j end values for ``force``, or an
+            (n, 6, 2) array of all forces
+        :rtype: numpy.ndarray
+        :raises KeyError: If the member is not in the results
+        """
+        if not 1 <= member_ID < len(self.member_offsets):
+            raise KeyError(f"Member {member_ID} is not in the results.")
+        forces = self.submember_forces[
+            int(self.member_offsets[member_ID-1]):int(self.member_offsets[member_ID])]
+        if force is None:
+            return forces
+        return forces[:, FORCE_KEYS.index(force)]
+
+
+def recover_results(
+    nodes: Nodes,
+    members: Members,
+    displacements: np.ndarray,
+    nodal_forces: np.ndarray,
+    equivalent: bool,
+    stats: SolveStats
+) -> AnalysisResult:
+    """Compute member end forces and reactions without writing to the model.
+
+    The array counterpart of :meth:`Solver.recover_forces`: submembers are
+    recovered in batches of one release case and the results gathered into
+    new arrays, so the nodes and submembers are only read.
+
+    :param nodes: Collection of nodes in the solved model
+    :type nodes: Nodes
+    :param members: Collection of members in the solved model
+    :type members: Members
+    :param displacements: Global displacement vector, six entries per node
+    :type displacements: numpy.ndarray
+    :param nodal_forces: Global force vector ``K u``, six entries per node
+    :type nodal_forces: numpy.ndarray
+    :param equivalent: True if the model's own loads were solved, whose
+        equivalent nodal actions are removed from the results
+    :type equivalent: bool
+    :param stats: Statistics of the solve
+    :type stats: SolveStats
+    :returns: The results
+    :rtype: AnalysisResult
+    """
+    U = np.ravel(displacements)
+    submbrs = [s for mbr in members.members.values() for s in mbr.submembers.values()]
+    offsets = np.zeros(members.count + 1, dtype=np.int64)
+    np.cumsum([len(mbr.submembers) for mbr in members.members.values()], out=offsets[1:])
+
+    # Local end forces, one release case at a time.
+    forces = np.zeros((len(submbrs), len(FORCE_KEYS), 2))
+    groups: dict[tuple[bool, bool], list[int]] = {}
+    for k, submbr in enumerate(submbrs):
+        groups.setdefault((submbr.i_release, submbr.j_release), []).append(k)
+    for (i_release, j_release), rows in groups.items():
+        batch = [submbrs[k] for k in rows]
+        index = element_dof_indices(
+            [s.node_i.node_ID for s in batch], [s.node_j.node_ID for s in batch],
+            i_release, j_release)
+        T = np.array([s.transformation_matrix for s in batch])
+        Kl = np.array([s.Kl for s in batch])
+        local = np.einsum('kij,kj->ki', Kl, np.einsum('kij,kj->ki', T, U[index]))
+        # Released end forces stay zero.
+        dofs_i, dofs_j = ELEMENT_NODE_DOFS[(i_release, j_release)]
+        forces[np.ix_(rows, dofs_i, [0])] = local[:, :len(dofs_i), None]
+        forces[np.ix_(rows, dofs_j, [1])] = local[:, len(dofs_i):, None]
+
+    reactions = np.array(nodal_forces, dtype=float).reshape(-1, 6)
+    if equivalent:
+        forces -= np.array(
+            [[s.ENAs[key] for key in FORCE_KEYS] for s in submbrs], dtype=float
+        ).reshape(forces.shape)
+        reactions -= np.array(
+            [(n.eFx, n.eFy, n.eFz, n.eMx, n.eMy, n.eMz) for n in nodes.nodes.values()],
+            dtype=float
+        ).reshape(reactions.shape)
+    # Reactions are reported at the member end nodes that are not mesh nodes.
+    reported = np.zeros(nodes.count, dtype=bool)
+    reported[members.connectivity().ravel()] = True
+    reported &= ~np.array([n.mesh_node for n in nodes.nodes.values()], dtype=bool)
+    reactions[~reported] = 0.0
+
+    return AnalysisResult(
+        member_offsets=offsets,
+        submember_forces=forces,
+        node_displacements=U.reshape(-1, 6).copy(),
+        node_reactions=reactions,
+        stats=stats
+    )
@@ -0,0 +1,606 @@
+from .Sparse import CSRMatrix
+
+import numpy as np
+
+from typing import Any
+
+# Smallest block used by BandedCholesky. Narrower blocks add Python loop
+# iterations without saving meaningful work.
+MIN_BLOCK: int = 48
+
+# Block size of the substitutions of DenseCholesky.
+DENSE_BLOCK: int = 256
+
+# Most correction steps of mixed-precision iterative refinement.
+REFINEMENT_STEPS: int = 10
+
+# Pivots below this fraction of their diagonal entry are reported as small.
+PIVOT_TOLERANCE: float = 1e-8
+
+# Most solve pairs of the Hager-Higham condition number estimate.
+CONDITION_ITERATIONS: int = 5
+
+
+class BandedCholesky():
+    """Cholesky factorization of a symmetric positive definite banded matrix.
+
+    A matrix with half bandwidth ``b`` split into blocks of size ``s >= b``
+    is block tridiagonal, so it is factored one block at a time with LAPACK
+    on dense ``s x s`` blocks. Memory and work grow as ``n*s`` and ``n*s**2``
+    instead of ``n**2`` and ``n**3``. The factor may be held in single
+    precision for :func:`refine`.
+
+    :ivar size: Order of the matrix
+    :type size: int
+    :ivar block: Block size
+    :type block: int
+    :ivar diagonal: (nb, s, s) inverses of the lower Cholesky factors of the
+        diagonal blocks, so substitutions are matrix products
+    :type diagonal: numpy.ndarray
+    :ivar lower: (nb-1, s, s) factors of the blocks below the diagonal
+    :type lower: numpy.ndarray
+
+    :Example:
+
+        >>> factor = BandedCholesky(Ks)
+        >>> U = factor.solve(F)
+    """
+
+    def __init__(self, K: CSRMatrix, block: int | None = None, dtype: type = np.float64) -> None:
+        """Factor a matrix.
+
+        :param K: Symmetric positive definite matrix
+        :type K: CSRMatrix
+        :param block: Block size. Defaults to the half bandwidth or
+            :data:`MIN_BLOCK`, whichever is larger.
+        :type block: int | None
+        :param dtype: Floating point type of the factor. Defaults to float64.
+        :type dtype: type
+        :raises numpy.linalg.LinAlgError: If the matrix is not positive definite
+        """
+        n = K.shape[0]
+        s = max(block or K.bandwidth(), MIN_BLOCK)
+        s = max(min(s, n), 1)
+        nb = -(-n//s)
+        self.size = n
+        self.block = s
+        self.diagonal = np.zeros((nb, s, s), dtype=dtype)
+        self.lower = np.zeros((max(nb-1, 0), s, s), dtype=dtype)
+
+        # Scatter the lower triangle into the diagonal and sub-diagonal blocks.
+        on = K.rows >= K.indices
+        rows, cols, data = K.rows[on], K.indices[on], K.data[on]
+        bi, bj = rows//s, cols//s
+        if np.any(bi - bj > 1):
+            raise ValueError("The block size is smaller than the bandwidth.")
+        same = bi == bj
+        self.diagonal[bi[same], rows[same] % s, cols[same] % s] = data[same]
+        self.diagonal[bi[same], cols[same] % s, rows[same] % s] = data[same]
+        below = ~same
+        self.lower[bj[below], rows[below] % s, cols[below] % s] = data[below]
+        # Pad the last block with the identity.
+        padding = np.arange(n - (nb-1)*s, s)
+        self.diagonal[-1, padding, padding] = 1.0
+
+        for i in range(nb):
+            if i > 0:
+                self.diagonal[i] -= self.lower[i-1] @ self.lower[i-1].T
+            try:
+                self.diagonal[i] = np.linalg.inv(np.linalg.cholesky(self.diagonal[i]))
+            except np.linalg.LinAlgError:
+                raise np.linalg.LinAlgError(
+                    "The structure stiffness matrix is not positive definite; "
+                    "the model may be unstable."
+                ) from None
+            if i < nb-1:
+                self.lower[i] = self.lower[i] @ self.diagonal[i].T
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the factor."""
+        return self.diagonal.nbytes + self.lower.nbytes
+
+    @property
+    def pivots(self) -> np.ndarray:
+        """Pivots of the elimination, the squared diagonal of the Cholesky factor."""
+        inverse = np.diagonal(self.diagonal, axis1=1, axis2=2).ravel()[:self.size]
+        return 1/inverse.astype(float)**2
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve ``K x = b`` with the factor.
+
+        :param b: Right-hand side of length :attr:`size`, or (size, k)
+        :type b: numpy.ndarray
+        :returns: Solution with the shape of ``b``
+        :rtype: numpy.ndarray
+        """
+        b = np.asarray(b, dtype=float)
+        s, nb = self.block, len(self.diagonal)
+        x = np.zeros((nb*s,) + b.shape[1:], dtype=self.diagonal.dtype)
+        x[:self.size] = b
+        x = x.reshape((nb, s) + b.shape[1:])
+        for i in range(nb):
+            if i > 0:
+                x[i] -= self.lower[i-1] @ x[i-1]
+            x[i] = self.diagonal[i] @ x[i]
+        for i in reversed(range(nb)):
+            if i < nb-1:
+                x[i] -= self.lower[i].T @ x[i+1]
+            x[i] = self.diagonal[i].T @ x[i]
+        return x.reshape((nb*s,) + b.shape[1:])[:self.size].astype(float)
+
+
+class DenseCholesky():
+    """Cholesky factorization of a dense symmetric positive definite matrix.
+
+    Used by the 'dense' backend, in double precision or, with mixed
+    precision, held in single precision and refined with :func:`refine`.
+    Substitutions run in blocks of :data:`DENSE_BLOCK` rows with the
+    inverses of the diagonal blocks, so each costs matrix-vector products
+    only.
+
+    :ivar factor: (n, n) lower Cholesky factor
+    :type factor: numpy.ndarray
+    :ivar inverse: Inverses of the diagonal blocks of the factor
+    :type inverse: list[numpy.ndarray]
+    """
+
+    def __init__(self, K: np.ndarray, dtype: type = np.float64) -> None:
+        """Factor a matrix.
+
+        :param K: Symmetric positive definite matrix
+        :type K: numpy.ndarray
+        :param dtype: Floating point type of the factor. Defaults to float64.
+        :type dtype: type
+        :raises numpy.linalg.LinAlgError: If the matrix is not positive
+            definite in ``dtype``
+        """
+        self.factor = np.linalg.cholesky(np.asarray(K, dtype=dtype))
+        n = len(self.factor)
+        self._starts = list(range(0, n, DENSE_BLOCK)) + [n]
+        self.inverse = [
+            np.linalg.inv(self.factor[a:b, a:b])
+            for a, b in zip(self._starts[:-1], self._starts[1:])
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the factor."""
+        return self.factor.nbytes + sum(m.nbytes for m in self.inverse)
+
+    @property
+    def pivots(self) -> np.ndarray:
+        """Pivots of the elimination, the squared diagonal of the Cholesky factor."""
+        return np.diagonal(self.factor).astype(float)**2
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve ``K x = b`` with the factor.
+
+        :param b: Right-hand side vector or (n, k) matrix
+        :type b: numpy.ndarray
+        :returns: Solution with the shape of ``b``, in double precision
+        :rtype: numpy.ndarray
+        """
+        L = self.factor
+        y = np.asarray(b, dtype=L.dtype).copy()
+        for k, (a, e) in enumerate(zip(self._starts[:-1], self._starts[1:])):
+            y[a:e] = self.inverse[k] @ (y[a:e] - L[a:e, :a] @ y[:a])
+        for k in reversed(range(len(self.inverse))):
+            a, e = self._starts[k], self._starts[k+1]
+            y[a:e] = self.inverse[k].T @ (y[a:e] - L[e:, a:e].T @ y[e:])
+        return y.astype(float)
+
+
+def refine(
+    K: np.ndarray | CSRMatrix,
+    b: np.ndarray,
+    factor: Any,
+    steps: int = REFINEMENT_STEPS
+) -> tuple[np.ndarray, list[float], bool]:
+    """Solve ``K x = b`` by iterative refinement of a low precision solution.
+
+    Each step computes the residual in double precision and corrects the
+    solution with the low precision ``factor``. Refinement stops when a
+    correction no longer changes the solution in double precision or is
+    more than half the previous one. It has converged if the residual is
+    then at the rounding level of a double precision solve,
+    ``sqrt(n)*eps*max|K|*|x|``; otherwise ``K`` is too ill-conditioned for
+    the factor.
+
+    :param K: Symmetric positive definite matrix in double precision
+    :type K: numpy.ndarray | CSRMatrix
+    :param b: Right-hand side vector
+    :type b: numpy.ndarray
+    :param factor: Factorization of ``K`` whose ``solve`` returns doubles
+    :type factor: Any
+    :param steps: Most correction steps. Defaults to :data:`REFINEMENT_STEPS`.
+    :type steps: int
+    :returns: The solution, the relative residual norm of the initial
+        solution and after each correction, and True if refinement converged
+    :rtype: tuple[numpy.ndarray, list[float], bool]
+    """
+    shape = np.shape(b)
+    b = np.ravel(b).astype(float)
+    norm = np.linalg.norm(b) or 1.0
+    # The largest entry of a positive definite matrix lies on its diagonal.
+    scale = np.sqrt(len(b))*np.finfo(float).eps*np.max(K.diagonal(), initial=0.0)
+    x = np.ravel(factor.solve(b))
+    r = b - np.ravel(np.asarray(K @ x))
+    history = [float(np.linalg.norm(r)/norm)]
+    previous = np.inf
+    for _ in range(steps):
+        dx = np.ravel(factor.solve(r))
+        x += dx
+        r = b - np.ravel(np.asarray(K @ x))
+        history.append(float(np.linalg.norm(r)/norm))
+        change = np.max(np.abs(dx))
+        if change <= np.finfo(float).eps*np.max(np.abs(x)) or change > 0.5*previous:
+            break
+        previous = change
+    converged = bool(np.linalg.norm(r) <= scale*np.linalg.norm(x))
+    return x.reshape(shape), history, converged
+
+
+def condition_estimate(
+    K: np.ndarray | CSRMatrix,
+    factor: Any,
+    iterations: int = CONDITION_ITERATIONS
+) -> float:
+    """Estimate the 1-norm condition number of a symmetric matrix from its factor.
+
+    ``||K^-1||_1`` is estimated with Hager's method as refined by Higham
+    (LAPACK's ``xLACON``): a few solves with ``factor`` climb towards the
+    column of ``K^-1`` of largest norm, and an alternating-sign vector
+    guards against the estimate stalling. The result is a lower bound that
+    is usually within a factor of a few of the true condition number, at
+    the cost of a handful of substitutions.
+
+    :param K: Symmetric matrix
+    :type K: numpy.ndarray | CSRMatrix
+    :param factor: Factorization of ``K`` whose ``solve`` returns doubles
+    :type factor: Any
+    :param iterations: Most solve pairs. Defaults to :data:`CONDITION_ITERATIONS`.
+    :type iterations: int
+    :returns: Estimate of ``||K||_1 ||K^-1||_1``
+    :rtype: float
+    """
+    n = K.shape[0]
+    if n == 0:
+        return 1.0
+    if isinstance(K, CSRMatrix):
+        norm = np.max(np.bincount(K.rows, weights=np.abs(K.data), minlength=n))
+    else:
+        norm = np.max(np.sum(np.abs(np.asarray(K)), axis=0))
+
+    x = np.full(n, 1/n)
+    estimate, j = 0.0, -1
+    for k in range(iterations):
+        y = np.ravel(factor.solve(x))
+        new = float(np.sum(np.abs(y)))
+        if k > 0 and new <= estimate:
+            break
+        estimate = new
+        # K is symmetric, so K^-T is applied with the same factor.
+        z = np.ravel(factor.solve(np.where(y >= 0, 1.0, -1.0)))
+        previous, j = j, int(np.argmax(np.abs(z)))
+        if j == previous or np.abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+
+    alternating = (-1.0)**np.arange(n)*(1 + np.arange(n)/max(n-1, 1))
+    estimate = max(estimate, 2*float(np.sum(np.abs(factor.solve(alternating))))/(3*n))
+    return float(norm*estimate)
+
+
+def node_blocks(groups: np.ndarray) -> np.ndarray:
+    """Return the boundaries of the runs of equal values in ``groups``.
+
+    :param groups: (n,) node of each matrix row; rows of a node are adjacent
+    :type groups: numpy.ndarray
+    :returns: (nb+1,) start of each run followed by n
+    :rtype: numpy.ndarray
+    """
+    groups = np.asarray(groups)
+    return np.r_[np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]), len(groups)]
+
+
+class JacobiPreconditioner():
+    """Diagonal (Jacobi) preconditioner.
+
+    :ivar inverse: Reciprocal of the matrix diagonal, 1 where it is not positive
+    :type inverse: numpy.ndarray
+    """
+
+    def __init__(self, K: CSRMatrix, groups: np.ndarray | None = None) -> None:
+        """Build the preconditioner.
+
+        :param K: Symmetric positive definite matrix
+        :type K: CSRMatrix
+        :param groups: Unused; accepted for a uniform interface
+        :type groups: numpy.ndarray | None
+        """
+        diagonal = K.diagonal()
+        self.inverse = np.where(
+            diagonal > 0, 1/np.where(diagonal > 0, diagonal, 1), 1.0)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the preconditioner."""
+        return self.inverse.nbytes
+
+    def solve(self, r: np.ndarray) -> np.ndarray:
+        """Apply the preconditioner to a residual vector."""
+        return self.inverse*r
+
+
+class BlockJacobiPreconditioner():
+    """Block diagonal preconditioner with one dense block per node.
+
+    Each block couples the translations and rotations of a node, which
+    differ in scale by orders of magnitude, so it captures far more of the
+    matrix than the diagonal alone at the same cost per iteration.
+
+    :ivar starts: (nb+1,) first row of each block followed by the order
+    :type starts: numpy.ndarray
+    :ivar inverse: (nb, s, s) inverses of the blocks, padded with the identity
+    :type inverse: numpy.ndarray
+    """
+
+    def __init__(self, K: CSRMatrix, groups: np.ndarray) -> None:
+        """Build and invert the node blocks.
+
+        :param K: Symmetric positive definite matrix
+        :type K: CSRMatrix
+        :param groups: (n,) node of each row; rows of a node are adjacent
+        :type groups: numpy.ndarray
+        :raises numpy.linalg.LinAlgError: If a block is singular
+        """
+        self.starts = node_blocks(groups)
+        sizes = np.diff(self.starts)
+        nb, s = len(sizes), int(sizes.max(initial=1))
+        block = np.repeat(np.arange(nb), sizes)
+        position = np.arange(len(block)) - self.starts[block]
+        self._index = block*s + position
+
+        blocks = np.zeros((nb, s, s))
+        on = block[K.rows] == block[K.indices]
+        blocks[block[K.rows[on]], position[K.rows[on]], position[K.indices[on]]] = K.data[on]
+        k, j = np.nonzero(np.arange(s) >= sizes[:, None])
+        blocks[k, j, j] = 1.0
+        try:
+            self.inverse = np.linalg.inv(blocks)
+        except np.linalg.LinAlgError:
+            raise np.linalg.LinAlgError(
+                "A nodal block of the structure stiffness matrix is singular; "
+                "the model may be unstable."
+            ) from None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the preconditioner."""
+        return self.inverse.nbytes + self._index.nbytes
+
+    def solve(self, r: np.ndarray) -> np.ndarray:
+        """Apply the preconditioner to a residual vector."""
+        nb, s, _ = self.inverse.shape
+        x = np.zeros(nb*s)
+        x[self._index] = r
+        return np.einsum('kij,kj->ki', self.inverse, x.reshape(nb, s)).ravel()[self._index]
+
+
+class IncompleteCholesky():
+    """Block incomplete Cholesky preconditioner without fill, BIC(0).
+
+    The factor ``L`` keeps the node block sparsity of the lower triangle of
+    ``K``; fill outside it is dropped. Blocks are factored and applied one
+    node at a time, so each iteration costs a Python loop over the nodes in
+    addition to the matrix product. It pays off on ill-conditioned models,
+    such as finely meshed members, where Jacobi needs many iterations.
+
+    If the incomplete factorization breaks down, it is repeated with the
+    diagonal blocks scaled by ``1 + shift`` for increasing shifts.
+
+    :ivar starts: (nb+1,) first row of each block followed by the order
+    :type starts: numpy.ndarray
+    :ivar shift: Diagonal shift the factorization succeeded with
+    :type shift: float
+    """
+
+    def __init__(self, K: CSRMatrix, groups: np.ndarray) -> None:
+        """Factor the matrix incompletely.
+
+        :param K: Symmetric positive definite matrix
+        :type K: CSRMatrix
+        :param groups: (n,) node of each row; rows of a node are adjacent
+        :type groups: numpy.ndarray
+        :raises numpy.linalg.LinAlgError: If the factorization breaks down
+            even with a large diagonal shift
+        """
+        self.starts = node_blocks(groups)
+        nb = len(self.starts) - 1
+        block = np.repeat(np.arange(nb), np.diff(self.starts))
+
+        # Gather the dense blocks of the lower triangle, row block by row block.
+        bi, bj = block[K.rows], block[K.indices]
+        lower = bi >= bj
+        rows, cols, data = K.rows[lower], K.indices[lower], K.data[lower]
+        key = bi[lower]*nb + bj[lower]
+        order = np.argsort(key, kind='stable')
+        rows, cols, data, key = rows[order], cols[order], data[order], key[order]
+        first = np.r_[np.flatnonzero(np.r_[True, key[1:] != key[:-1]]), len(key)]
+        A: dict[tuple[int, int], np.ndarray] = {}
+        pattern: list[list[int]] = [[] for _ in range(nb)]
+        for a, b in zip(first[:-1].tolist(), first[1:].tolist()):
+            I, J = divmod(int(key[a]), nb)
+            si, sj = self.starts[I], self.starts[J]
+            dense = np.zeros((self.starts[I+1] - si, self.starts[J+1] - sj))
+            np.add.at(dense, (rows[a:b] - si, cols[a:b] - sj), data[a:b])
+            A[(I, J)] = dense
+            if I != J:
+                pattern[I].append(J)
+
+        self.shift = 0.0
+        while True:
+            try:
+                self._factor(A, pattern, nb)
+                break
+            except np.linalg.LinAlgError:
+                if self.shift >= 1.0:
+                    raise np.linalg.LinAlgError(
+                        "Incomplete Cholesky factorization broke down; the "
+                        "model may be unstable."
+                    ) from None
+                self.shift = max(2*self.shift, 1e-3)
+
+    def _factor(self, A: dict[tuple[int, int], np.ndarray], pattern: list[list[int]], nb: int) -> None:
+        """Compute the factor blocks and the arrays used by :meth:`solve`."""
+        L: dict[tuple[int, int], np.ndarray] = {}
+        inverse: list[np.ndarray] = []
+        members = [set(p) for p in pattern]
+        for I in range(nb):
+            for J in pattern[I]:
+                S = A[(I, J)].copy()
+                for k in sorted(members[I] & members[J]):
+                    S -= L[(I, k)] @ L[(J, k)].T
+                L[(I, J)] = S @ inverse[J].T
+            D = A[(I, I)].copy()
+            if self.shift:
+                D += self.shift*np.diag(np.diag(D))
+            for J in pattern[I]:
+                D -= L[(I, J)] @ L[(I, J)].T
+            inverse.append(np.linalg.inv(np.linalg.cholesky(D)))
+
+        # Block rows of L for the forward and block columns for the backward
+        # substitution, with the matrix rows they act on.
+        def rows_of(blocks: list[int]) -> np.ndarray:
+            return np.concatenate([np.arange(self.starts[k], self.starts[k+1]) for k in blocks]) \
+                if blocks else np.zeros(0, dtype=np.int64)
+
+        below: list[list[int]] = [[] for _ in range(nb)]
+        for I in range(nb):
+            for J in pattern[I]:
+                below[J].append(I)
+        self._inverse = inverse
+        self._forward = [
+            (rows_of(pattern[I]), np.hstack([L[(I, J)] for J in pattern[I]]) if pattern[I] else None)
+            for I in range(nb)
+        ]
+        self._backward = [
+            (rows_of(below[J]), np.vstack([L[(I, J)] for I in below[J]]).T if below[J] else None)
+            for J in range(nb)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the factor."""
+        return sum(m.nbytes for m in self._inverse) + sum(
+            m.nbytes + index.nbytes
+            for index, m in self._forward + self._backward if m is not None)
+
+    def solve(self, r: np.ndarray) -> np.ndarray:
+        """Apply the preconditioner, ``(L L^T)^-1 r``, to a residual vector."""
+        starts = self.starts.tolist()
+        y = np.zeros(len(r))
+        for I, (index, off) in enumerate(self._forward):
+            t = r[starts[I]:starts[I+1]]
+            if off is not None:
+                t = t - off @ y[index]
+            y[starts[I]:starts[I+1]] = self._inverse[I] @ t
+        x = np.zeros(len(r))
+        for J in reversed(range(len(self._backward))):
+            index, off = self._backward[J]
+            t = y[starts[J]:starts[J+1]]
+            if off is not None:
+                t = t - off @ x[index]
+            x[starts[J]:starts[J+1]] = self._inverse[J].T @ t
+        return x
+
+
+# Preconditioners of :func:`conjugate_gradient` by name.
+PRECONDITIONERS: dict[str, type] = {
+    'jacobi': JacobiPreconditioner,
+    'block_jacobi': BlockJacobiPreconditioner,
+    'incomplete_cholesky': IncompleteCholesky,
+}
+
+
+def conjugate_gradient(
+    K: CSRMatrix,
+    b: np.ndarray,
+    tol: float = 1e-10,
+    maxiter: int | None = None,
+    preconditioner: Any = None,
+    x0: np.ndarray | None = None
+) -> tuple[np.ndarray, list[float]]:
+    """Solve ``K x = b`` with the preconditioned conjugate gradient method.
+
+    :param K: Symmetric positive definite matrix
+    :type K: CSRMatrix
+    :param b: Right-hand side vector
+    :type b: numpy.ndarray
+    :param tol: Convergence tolerance on the relative residual norm
+    :type tol: float
+    :param maxiter: Maximum iterations. Defaults to ten times the matrix order.
+    :type maxiter: int | None
+    :param preconditioner: Object whose ``solve(r)`` applies the inverse of
+        the preconditioner, one of :data:`PRECONDITIONERS`. Defaults to
+        :class:`JacobiPreconditioner`.
+    :type preconditioner: Any
+    :param x0: Initial guess, e.g. the solution of a previous analysis.
+        Defaults to zero.
+    :type x0: numpy.ndarray | None
+    :returns: The solution and the relative residual of the initial guess
+        and after each iteration
+    :rtype: tuple[numpy.ndarray, list[float]]
+    :raises numpy.linalg.LinAlgError: If the iteration does not converge
+    """
+    shape = np.shape(b)
+    b = np.ravel(b).astype(float)
+    n = len(b)
+    maxiter = 10*n if maxiter is None else maxiter
+    if preconditioner is None:
+        preconditioner = JacobiPreconditioner(K)
+
+    x = np.zeros(n) if x0 is None else np.ravel(x0).astype(float)
+    norm = np.linalg.norm(b)
+    if norm == 0:
+        return np.zeros(n).reshape(shape), [0.0]
+    r = b - K @ x if x0 is not None else b.copy()
+    history = [float(np.linalg.norm(r)/norm)]
+    if history[-1] < tol:
+        return x.reshape(shape), history
+    z = preconditioner.solve(r)
+    p = z.copy()
+    rz = r @ z
+    for _ in range(maxiter):
+        Ap = K @ p
+        alpha = rz/(p @ Ap)
+        x += alpha*p
+        r -= alpha*Ap
+        history.append(float(np.linalg.norm(r)/norm))
+        if history[-1] < tol:
+            return x.reshape(shape), history
+        z = preconditioner.solve(r)
+        rz, rz_old = r @ z, rz
+        p = z + rz/rz_old*p
+    raise np.linalg.LinAlgError(
+        f"Conjugate gradient did not converge in {maxiter} iterations "
+        f"(relative residual {history[-1]:.3e})."
+    )
+
+
+def sparse_direct(K: CSRMatrix, b: np.ndarray) -> np.ndarray:
+    """Solve ``K x = b`` with SciPy's sparse LU factorization.
+
+    :param K: Square matrix
+    :type K: CSRMatrix
+    :param b: Right-hand side
+    :type b: numpy.ndarray
+    :returns: Solution with the shape of ``b``
+    :rtype: numpy.ndarray
+    :raises ImportError: If SciPy is not installed
+    """
+    from scipy.sparse.linalg import spsolve
+    x = spsolve(K.to_scipy().tocsc(), np.asarray(b, dtype=float))
+    return np.reshape(x, np.shape(b))
@@ -0,0 +1,422 @@
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of element degrees of freedom for each (i_release, j_release) case.
+ELEMENT_DOF: dict[tuple[bool, bool], int] = {
+    (False, False): 12,
+    (True, False): 10,
+    (False, True): 10,
+    (True, True): 6,
+}
+
+# Nodal degrees of freedom of the i and j ends of an element for each
+# (i_release, j_release) case, in the order of the element matrices.
+# Released ends keep the translations and the torsional rotation.
+ELEMENT_NODE_DOFS: dict[tuple[bool, bool], tuple[tuple[int, ...], tuple[int, ...]]] = {
+    (False, False): ((0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5)),
+    (True, False): ((0, 1, 2, 3), (0, 1, 2, 3, 4, 5)),
+    (False, True): ((0, 1, 2, 3, 4, 5), (0, 1, 2, 3)),
+    (True, True): ((0, 1, 2), (0, 1, 2)),
+}
+
+# Direction cosines of an element axis with global X below this are taken
+# as zero: a released end is then not stiff in the global x rotation.
+AXIS_TOLERANCE: float = 1e-6
+
+# Elements built at a time by element_matrices, which bounds the size of its
+# temporary arrays and is the work given to each thread.
+ELEMENT_CHUNK: int = 4096
+
+# Nodal degrees of freedom numbered by the solver in each model mode.
+FRAME_DOFS: tuple[int, ...] = (0, 1, 2, 3, 4, 5)
+TRUSS_DOFS: tuple[int, ...] = (0, 1, 2)
+
+# In-plane nodal degrees of freedom of planar models: the two in-plane
+# translations and the rotation about the normal of the plane.
+PLANE_DOFS: dict[str, tuple[int, ...]] = {
+    'xy': (0, 1, 5),
+    'yz': (1, 2, 3),
+    'zx': (0, 2, 4),
+}
+
+
+def node_dofs(truss: bool = False, plane: str | None = None) -> tuple[int, ...]:
+    """Return the nodal degrees of freedom numbered in a model.
+
+    Indices refer to the six nodal degrees of freedom (0-2 translations and
+    3-5 rotations about global X, Y and Z).
+
+    :param truss: True for a truss model, which numbers translations only
+    :type truss: bool
+    :param plane: 'xy', 'yz' or 'zx' for a planar model, which numbers the
+        in-plane degrees of freedom only
+    :type plane: str | None
+    :returns: Numbered degrees of freedom of every node, ascending
+    :rtype: tuple[int, ...]
+    :raises ValueError: If ``plane`` is not recognized
+    """
+    dofs = TRUSS_DOFS if truss else FRAME_DOFS
+    if plane is None:
+        return dofs
+    if plane not in PLANE_DOFS:
+        raise ValueError(
+            f"Unknown plane '{plane}'; expected one of {', '.join(PLANE_DOFS)}."
+        )
+    return tuple(n for n in dofs if n in PLANE_DOFS[plane])
+
+
+def node_incidence(connectivity: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the node-to-element incidence table of a structure.
+
+    :param connectivity: (m, 2) array of zero-based node indices, as returned
+        by :meth:`Members.connectivity`
+    :type connectivity: numpy.ndarray
+    :param count: Number of nodes
+    :type count: int
+    :returns: (count+1,) offsets and (2m,) element ends; the ends at node
+        ``k`` are ``ends[offsets[k]:offsets[k+1]]``, each ``2*element + end``
+        with end 0 for the i and 1 for the j node, in element order
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    nodes = np.asarray(connectivity, dtype=np.int64).reshape(-1, 2).ravel()
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(nodes, minlength=count), out=offsets[1:])
+    return offsets, np.argsort(nodes, kind='stable')
+
+
+def active_dofs(
+    connectivity: np.ndarray,
+    releases: np.ndarray,
+    count: int,
+    dofs: tuple[int, ...] = FRAME_DOFS,
+    cosines: np.ndarray | None = None
+) -> np.ndarray:
+    """Mark the nodal degrees of freedom that some element is stiff in.
+
+    A degree of freedom is active if it is one of ``dofs`` and an element
+    end at the node keeps it (see :data:`ELEMENT_NODE_DOFS`), found from
+    :func:`node_incidence`. A released end keeps the torsional rotation,
+    which only reaches the global x rotation through the direction cosine
+    of the element axis (see :func:`element_rotation_matrices`), so it is
+    not kept where that cosine is zero. The rotations of a node where every
+    element end is released, and every degree of freedom of a node without
+    elements, are inactive.
+
+    :param connectivity: (m, 2) array of zero-based node indices, as returned
+        by :meth:`Members.connectivity`
+    :type connectivity: numpy.ndarray
+    :param releases: (m, 2) release flags at the i and j ends, as returned by
+        :meth:`Members.releases`
+    :type releases: numpy.ndarray
+    :param count: Number of nodes
+    :type count: int
+    :param dofs: Numbered nodal degrees of freedom, as from :func:`node_dofs`
+    :type dofs: tuple[int, ...]
+    :param cosines: (m,) direction cosine of each element axis with global
+        X, as returned by :meth:`Members.axis_cosines`. Defaults to None
+        for released ends that keep the global x rotation.
+    :type cosines: numpy.ndarray | None
+    :returns: (count, 6) mask of the active degrees of freedom of each node
+    :rtype: numpy.ndarray
+    """
+    # Degrees of freedom kept at each end, indexed by release case and end.
+    table = np.zeros((2, 2, 2, 6), dtype=bool)
+    for (i_release, j_release), ends in ELEMENT_NODE_DOFS.items():
+        for end, kept in enumerate(ends):
+            table[int(i_release), int(j_release), end, list(kept)] = True
+    releases = np.asarray(releases, dtype=bool).reshape(-1, 2)
+    kept = table[releases[:, 0].astype(int), releases[:, 1].astype(int)].reshape(-1, 6)
+    if cosines is not None:
+        twisting = np.abs(np.asarray(cosines, dtype=float)) > AXIS_TOLERANCE
+        kept[:, 3] &= ~releases.ravel() | np.repeat(twisting, 2)
+
+    offsets, ends = node_incidence(connectivity, count)
+    active = np.zeros((count, 6), dtype=bool)
+    attached = offsets[:-1] < offsets[1:]
+    if np.any(attached):
+        active[attached] = np.logical_or.reduceat(
+            kept[ends], offsets[:-1][attached], axis=0)
+    active[:, [n not in dofs for n in range(6)]] = False
+    return active
+
+
+def element_dof_positions(i_release: bool, j_release: bool, dofs: tuple[int, ...]) -> np.ndarray:
+    """Return the rows of an element matrix that act on numbered nodal DOFs.
+
+    Selecting these rows and columns of a global element stiffness matrix
+    gives the element matrix of a model numbering only ``dofs``, e.g. the
+    6x6 in-plane frame element of a planar model.
+
+    :param i_release: Release flag at node i
+    :type i_release: bool
+    :param j_release: Release flag at node j
+    :type j_release: bool
+    :param dofs: Numbered nodal degrees of freedom, as from :func:`node_dofs`
+    :type dofs: tuple[int, ...]
+    :returns: Ascending element matrix row indices
+    :rtype: numpy.ndarray
+    """
+    dofs_i, dofs_j = ELEMENT_NODE_DOFS[(i_release, j_release)]
+    return np.flatnonzero([n in dofs for n in dofs_i + dofs_j])
+
+
+def element_dof_indices(
+    node_i: np.ndarray,
+    node_j: np.ndarray,
+    i_release: bool,
+    j_release: bool
+) -> np.ndarray:
+    """Return the global degree of freedom indices of a batch of elements.
+
+    Matches the placement used by :meth:`Solver.AddMemberToKp`.
+
+    :param node_i: (k,) array of i node IDs
+    :type node_i: numpy.ndarray
+    :param node_j: (k,) array of j node IDs
+    :type node_j: numpy.ndarray
+    :param i_release: Release flag at node i shared by the batch
+    :type i_release: bool
+    :param j_release: Release flag at node j shared by the batch
+    :type j_release: bool
+    :returns: (k, n) array of zero-based indices where n is the element DOF count
+    :rtype: numpy.ndarray
+    """
+    dofs_i, dofs_j = ELEMENT_NODE_DOFS[(i_release, j_release)]
+    node_i = np.asarray(node_i, dtype=np.int64).reshape(-1, 1)
+    node_j = np.asarray(node_j, dtype=np.int64).reshape(-1, 1)
+    return np.hstack((
+        6*(node_i-1) + np.array(dofs_i),
+        6*(node_j-1) + np.array(dofs_j)
+    ))
+
+
+def rotation_matrices(xi: np.ndarray, xj: np.ndarray) -> np.ndarray:
+    """Build the 3x3 local-to-global rotation matrices for a batch of elements.
+
+    Vectorized equivalent of :meth:`SubMember.build_rotation_matrix`. The
+    columns of each matrix are the local x, y and z unit vectors in the global
+    reference frame.
+
+    :param xi: (k, 3) array of i node coordinates
+    :type xi: numpy.ndarray
+    :param xj: (k, 3) array of j node coordinates
+    :type xj: numpy.ndarray
+    :returns: (k, 3, 3) array of rotation matrices
+    :rtype: numpy.ndarray
+    """
+    xi = np.asarray(xi, dtype=float).reshape(-1, 3)
+    xj = np.asarray(xj, dtype=float).reshape(-1, 3)
+    d = xj - xi
+    length = np.sqrt(np.einsum('ij,ij->i', d, d))
+    local_x = d/length[:, None]
+
+    # Vertical members use a reference point offset in the negative global x
+    # direction, all others one offset in the positive global y direction.
+    vertical = (np.abs(d[:, 0]) < 0.001) & (np.abs(d[:, 2]) < 0.001)
+    offset = np.where(vertical[:, None], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+    vector_in_plane = 0.5*d + offset
+
+    # Gram-Schmidt process for the local y-axis.
+    local_y = vector_in_plane - \
+        np.einsum('ij,ij->i', vector_in_plane, local_x)[:, None]*local_x
+    local_y = local_y/np.sqrt(np.einsum('ij,ij->i', local_y, local_y))[:, None]
+    local_z = np.cross(local_x, local_y)
+
+    return np.stack((local_x, local_y, local_z), axis=2)
+
+
+def element_rotation_matrices(rotation: np.ndarray, i_release: bool, j_release: bool) -> np.ndarray:
+    """Expand 3x3 rotation matrices to element (block diagonal) rotation matrices.
+
+    Vectorized equivalent of the matrix returned by
+    :meth:`SubMember.build_rotation_matrix` for a single release case. The
+    transpose of each matrix is the element transformation matrix.
+
+    :param rotation: (k, 3, 3) array from :func:`rotation_matrices`
+    :type rotation: numpy.ndarray
+    :param i_release: Release flag at node i shared by the batch
+    :type i_release: bool
+    :param j_release: Release flag at node j shared by the batch
+    :type j_release: bool
+    :returns: (k, n, n) array where n is the element DOF count
+    :rtype: numpy.ndarray
+    """
+    n = ELEMENT_DOF[(i_release, j_release)]
+    T = np.zeros((len(rotation), n, n))
+    if not i_release and not j_release:
+        blocks = [0, 3, 6, 9]
+    elif i_release and not j_release:
+        blocks = [0, 4, 7]
+        T[:, 3, 3] = rotation[:, 0, 0]
+    elif not i_release and j_release:
+        blocks = [0, 3, 6]
+        T[:, 9, 9] = rotation[:, 0, 0]
+    else:
+        blocks = [0, 3]
+    for b in blocks:
+        T[:, b:b+3, b:b+3] = rotation
+    return T
+
+
+def local_stiffness_matrices(
+    E: np.ndarray,
+    Izz: np.ndarray,
+    Iyy: np.ndarray,
+    A: np.ndarray,
+    G: np.ndarray,
+    J: np.ndarray,
+    l: np.ndarray,
+    i_release: bool,
+    j_release: bool
+) -> np.ndarray:
+    """Build local stiffness matrices for a batch of elements.
+
+    Vectorized equivalent of :meth:`SubMember.build_stiffness_matrix` for a
+    single release case. Lengths are given in feet and converted to inches.
+
+    :param E: Young's modulus in ksi
+    :type E: numpy.ndarray
+    :param Izz: Strong axis moment of inertia in in^4
+    :type Izz: numpy.ndarray
+    :param Iyy: Weak axis moment of inertia in in^4
+    :type Iyy: numpy.ndarray
+    :param A: Cross-sectional area in in^2
+    :type A: numpy.ndarray
+    :param G: Shear modulus in ksi
+    :type G: numpy.ndarray
+    :param J: Polar moment of inertia in in^4
+    :type J: numpy.ndarray
+    :param l: Element lengths in feet
+    :type l: numpy.ndarray
+    :param i_release: Release flag at node i shared by the batch
+    :type i_release: bool
+    :param j_release: Release flag at node j shared by the batch
+    :type j_release: bool
+    :returns: (k, n, n) array where n is the element DOF count
+    :rtype: numpy.ndarray
+    """
+    E, Izz, Iyy, A, G, J, l = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (E, Izz, Iyy, A, G, J, l)])
+    l = l*12
+    n = ELEMENT_DOF[(i_release, j_release)]
+    K = np.zeros((len(l), n, n))
+
+    a = E*A/l
+    t = G*J/l
+
+    # Upper triangle entries as (row, column, value); mirrored below.
+    if not i_release and not j_release:
+        entries = [
+            (0, 0, a), (0, 6, -a), (6, 6, a),
+            (3, 3, t), (3, 9, -t), (9, 9, t),
+            (1, 1, 12*E*Izz/l**3), (1, 5, 6*E*Izz/l**2),
+            (1, 7, -12*E*Izz/l**3), (1, 11, 6*E*Izz/l**2),
+            (5, 5, 4*E*Izz/l), (5, 7, -6*E*Izz/l**2), (5, 11, 2*E*Izz/l),
+            (7, 7, 12*E*Izz/l**3), (7, 11, -6*E*Izz/l**2),
+            (11, 11, 4*E*Izz/l),
+            (2, 2, 12*E*Iyy/l**3), (2, 4, -6*E*Iyy/l**2),
+            (2, 8, -12*E*Iyy/l**3), (2, 10, -6*E*Iyy/l**2),
+            (4, 4, 4*E*Iyy/l), (4, 8, 6*E*Iyy/l**2), (4, 10, 2*E*Iyy/l),
+            (8, 8, 12*E*Iyy/l**3), (8, 10, 6*E*Iyy/l**2),
+            (10, 10, 4*E*Iyy/l),
+        ]
+    elif i_release and not j_release:
+        entries = [
+            (0, 0, a), (0, 4, -a), (4, 4, a),
+            (3, 3, t), (3, 7, -t), (7, 7, t),
+            (1, 1, 3*E*Izz/l**3), (1, 5, -3*E*Izz/l**3),
+            (1, 9, 3*E*Izz/l**2),
+            (5, 5, 3*E*Izz/l**3), (5, 9, -3*E*Izz/l**2),
+            (9, 9, 3*E*Izz/l),
+            (2, 2, 3*E*Iyy/l**3), (2, 6, -3*E*Iyy/l**3),
+            (2, 8, -3*E*Iyy/l**2),
+            (6, 6, 3*E*Iyy/l**3), (6, 8, 3*E*Iyy/l**2),
+            (8, 8, 3*E*Iyy/l),
+        ]
+    elif not i_release and j_release:
+        entries = [
+            (0, 0, a), (0, 6, -a), (6, 6, a),
+            (3, 3, t), (3, 9, -t), (9, 9, t),
+            (1, 1, 3*E*Izz/l**3), (1, 5, 3*E*Izz/l**2),
+            (1, 7, -3*E*Izz/l**3),
+            (5, 5, 3*E*Izz/l), (5, 7, -3*E*Izz/l**2),
+            (7, 7, 3*E*Izz/l**3),
+            (2, 2, 3*E*Iyy/l**3), (2, 4, -3*E*Iyy/l**2),
+            (2, 8, -3*E*Iyy/l**3),
+            (4, 4, 3*E*Iyy/l), (4, 8, 3*E*Iyy/l**2),
+            (8, 8, 3*E*Iyy/l**3),
+        ]
+    else:
+        entries = [(0, 0, a), (0, 3, -a), (3, 3, a)]
+
+    for row, col, value in entries:
+        K[:, row, col] = value
+        K[:, col, row] = value
+    return K
+
+
+def global_stiffness_matrices(Kl: np.ndarray, T: np.ndarray) -> np.ndarray:
+    """Transform a batch of local stiffness matrices to the global frame.
+
+    :param Kl: (k, n, n) local stiffness matrices
+    :type Kl: numpy.ndarray
+    :param T: (k, n, n) global-to-local transformation matrices, i.e. the
+        transpose of :func:`element_rotation_matrices`
+    :type T: numpy.ndarray
+    :returns: (k, n, n) array of T^T Kl T
+    :rtype: numpy.ndarray
+    """
+    return np.einsum('kji,kjl,klm->kim', T, Kl, T, optimize=True)
+
+
+def element_matrices(
+    rotation: np.ndarray,
+    lengths: np.ndarray,
+    properties: np.ndarray,
+    i_release: bool,
+    j_release: bool,
+    workers: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the rotation and stiffness matrices of a batch of elements.
+
+    Combines :func:`element_rotation_matrices`, :func:`local_stiffness_matrices`
+    and :func:`global_stiffness_matrices` over chunks of
+    :data:`ELEMENT_CHUNK` elements. With ``workers`` the chunks are built on
+    a thread pool; NumPy releases the GIL in the array arithmetic, so chunks
+    run concurrently. The result is the same as a serial build.
+
+    :param rotation: (k, 3, 3) array from :func:`rotation_matrices`
+    :type rotation: numpy.ndarray
+    :param lengths: (k,) element lengths in feet
+    :type lengths: numpy.ndarray
+    :param properties: (k, 6) array of E, Izz, Iyy, A, G and J
+    :type properties: numpy.ndarray
+    :param i_release: Release flag at node i shared by the batch
+    :type i_release: bool
+    :param j_release: Release flag at node j shared by the batch
+    :type j_release: bool
+    :param workers: Number of threads, None or 1 to build serially.
+        Defaults to None.
+    :type workers: int | None
+    :returns: (k, n, n) element rotation, local stiffness and global
+        stiffness matrices
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    properties = np.asarray(properties, dtype=float).reshape(-1, 6)
+
+    def build(rows: slice) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        R = element_rotation_matrices(rotation[rows], i_release, j_release)
+        Kl = local_stiffness_matrices(
+            *properties[rows].T, lengths[rows], i_release, j_release)
+        return R, Kl, global_stiffness_matrices(Kl, R.transpose(0, 2, 1))
+
+    chunks = [slice(start, start+ELEMENT_CHUNK)
+              for start in range(0, len(lengths), ELEMENT_CHUNK)] or [slice(0, 0)]
+    if workers and workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(build, chunks))
+    else:
+        parts = [build(rows) for rows in chunks]
+    R, Kl, Kg = zip(*parts)
+    return np.concatenate(R), np.concatenate(Kl), np.concatenate(Kg)
@@ -0,0 +1,191 @@
+from .ResultStore import ResultStore
+from .Analysis import AnalysisResult
+from .Submember import FORCE_KEYS
+
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+
+from itertools import islice
+from typing import Any, Iterable, Sequence
+
+# Load combinations combined and reduced at a time by envelope, which bounds
+# its memory to this many copies of one load case's results.
+ENVELOPE_CHUNK: int = 64
+
+# Enveloped results and the ResultStore array each is combined from.
+ENVELOPE_RESULTS: dict[str, str] = {
+    'forces': 'submember_forces',
+    'displacements': 'node_displacements',
+    'reactions': 'node_reactions',
+}
+
+
+@dataclass(slots=True)
+class Envelope():
+    """Running extremes of results over a set of load combinations.
+
+    Every dictionary is keyed by 'forces', 'displacements' and 'reactions',
+    whose arrays have the layout of :attr:`ResultStore.submember_forces`,
+    :attr:`ResultStore.node_displacements` and
+    :attr:`ResultStore.node_reactions`. Ties are governed by the first
+    combination reaching the extreme.
+
+    :ivar maximum: Largest value of each result
+    :type maximum: dict[str, numpy.ndarray]
+    :ivar minimum: Smallest value of each result
+    :type minimum: dict[str, numpy.ndarray]
+    :ivar governing_max: Zero-based index of the combination giving the maximum
+    :type governing_max: dict[str, numpy.ndarray]
+    :ivar governing_min: Zero-based index of the combination giving the minimum
+    :type governing_min: dict[str, numpy.ndarray]
+    :ivar member_offsets: (M+1,) array; the submembers of member ``k`` are
+        rows ``member_offsets[k-1]:member_offsets[k]`` of the force arrays
+    :type member_offsets: numpy.ndarray
+    :ivar combinations: Number of combinations reduced so far
+    :type combinations: int
+
+    :Example:
+
+        >>> env = envelope([dead, live], [[1.4, 0.0], [1.2, 1.6]])
+        >>> Mmax, Mmin, kmax, kmin = env.member_forces(3, 'major axis moments')
+    """
+    maximum: dict[str, np.ndarray] = field(default_factory=dict[str, np.ndarray])
+    minimum: dict[str, np.ndarray] = field(default_factory=dict[str, np.ndarray])
+    governing_max: dict[str, np.ndarray] = field(default_factory=dict[str, np.ndarray])
+    governing_min: dict[str, np.ndarray] = field(default_factory=dict[str, np.ndarray])
+    member_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    combinations: int = 0
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    def update(self, name: str, values: np.ndarray, first: int) -> None:
+        """Reduce the results of a chunk of combinations into the envelope.
+
+        :param name: One of :data:`ENVELOPE_RESULTS`
+        :type name: str
+        :param values: (c, ...) results of ``c`` consecutive combinations
+        :type values: numpy.ndarray
+        :param first: Index of the first combination of the chunk
+        :type first: int
+        :returns: None
+        :rtype: None
+        """
+        if name not in self.maximum:
+            shape = values.shape[1:]
+            self.maximum[name] = np.full(shape, -np.inf)
+            self.minimum[name] = np.full(shape, np.inf)
+            self.governing_max[name] = np.full(shape, -1, dtype=np.int64)
+            self.governing_min[name] = np.full(shape, -1, dtype=np.int64)
+        for extreme, governing, reduce, pick, better in (
+            (self.maximum, self.governing_max, np.max, np.argmax, np.greater),
+            (self.minimum, self.governing_min, np.min, np.argmin, np.less),
+        ):
+            value = reduce(values, axis=0)
+            replace = better(value, extreme[name])
+            extreme[name] = np.where(replace, value, extreme[name])
+            governing[name] = np.where(
+                replace, pick(values, axis=0) + first, governing[name])
+
+    def member_forces(
+        self,
+        member_ID: int,
+        force: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the envelope of one end force over the submembers of a member.
+
+        :param member_ID: Member ID as assigned by :meth:`Members.addMember`
+        :type member_ID: int
+        :param force: One of :data:`FORCE_KEYS`, e.g. 'major axis moments'
+        :type force: str
+        :returns: (n, 2) arrays of the i and j end maximum, minimum, and the
+            combinations governing them
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        :raises KeyError: If the member is not in the envelope
+        """
+        if not 1 <= member_ID < len(self.member_offsets):
+            raise KeyError(f"Member {member_ID} is not in the envelope.")
+        rows = slice(int(self.member_offsets[member_ID-1]), int(self.member_offsets[member_ID]))
+        k = FORCE_KEYS.index(force)
+        return (
+            self.maximum['forces'][rows, k],
+            self.minimum['forces'][rows, k],
+            self.governing_max['forces'][rows, k],
+            self.governing_min['forces'][rows, k]
+        )
+
+
+def envelope(
+    cases: Sequence[ResultStore | AnalysisResult],
+    combinations: np.ndarray | Iterable[Sequence[float]],
+    chunk: int = ENVELOPE_CHUNK
+) -> Envelope:
+    """Envelope the results of linear load combinations of load cases.
+
+    Each load case is solved once and stored, e.g. with
+    ``Model.solve(store=...)``, or analyzed with :meth:`Model.analyze`.
+    Combinations are read ``chunk`` at a time, so they may come from a
+    generator: each chunk is formed as the factored sum of the case
+    results, reduced into the running extremes and dropped.
+    Memory is bounded by the chunk size however many combinations there are.
+
+    :param cases: Stored results of each load case, or results returned by
+        :meth:`Model.analyze`, all of the same model
+    :type cases: Sequence[ResultStore | AnalysisResult]
+    :param combinations: Load factors of each combination, one row of
+        ``len(cases)`` factors per combination
+    :type combinations: numpy.ndarray | Iterable[Sequence[float]]
+    :param chunk: Combinations reduced at a time. Defaults to :data:`ENVELOPE_CHUNK`.
+    :type chunk: int
+    :returns: Extremes of every submember end force, node displacement and
+        reaction, and the combinations governing them
+    :rtype: Envelope
+    :raises ValueError: If there are no cases, the cases are of different
+        models, a combination does not have one factor per case, or
+        ``chunk`` is less than 1
+
+    :Example:
+
+        >>> frame.solve(store='dead.results')
+        >>> ...
+        >>> frame.solve(store='live.results')
+        >>> env = envelope(
+        ...     [ResultStore.open('dead.results'), ResultStore.open('live.results')],
+        ...     [[1.4, 0.0], [1.2, 1.6], [0.9, 0.0]])
+        >>> env.maximum['reactions'][0], env.governing_max['reactions'][0]
+    """
+    if not cases:
+        raise ValueError("Expected the results of at least one load case.")
+    if chunk < 1:
+        raise ValueError(f"Expected a chunk of at least one combination, got {chunk}.")
+    for attr in ENVELOPE_RESULTS.values():
+        if len({getattr(case, attr).shape for case in cases}) > 1:
+            raise ValueError("Load case results are not of the same model.")
+
+    result = Envelope(member_offsets=np.array(cases[0].member_offsets))
+    rows = iter(combinations)
+    while True:
+        factors = np.array(list(islice(rows, chunk)), dtype=float)
+        if not len(factors):
+            break
+        if factors.ndim != 2 or factors.shape[1] != len(cases):
+            raise ValueError(
+                f"Expected {len(cases)} load factors per combination, got {factors.shape[1:]}."
+            )
+        for name, attr in ENVELOPE_RESULTS.items():
+            shape = getattr(cases[0], attr).shape
+            values = np.zeros((len(factors), *shape))
+            for k, case in enumerate(cases):
+                # Cases absent from the whole chunk are not read
+                if np.any(factors[:, k]):
+                    values += factors[:, k].reshape(-1, *[1]*len(shape)) * \
+                        np.asarray(getattr(case, attr))
+            result.update(name, values, result.combinations)
+        result.combinations += len(factors)
+    return result
@@ -0,0 +1,258 @@
+from .Nodes import Nodes
+from .Members import Members
+from .Elements import ELEMENT_DOF, active_dofs, node_dofs, element_dof_positions
+from .Sparse import OPERATOR_CHUNK, reverse_cuthill_mckee
+from .Stats import sparsity
+from .Backends import MIN_BLOCK
+from .Substructure import SUBSTRUCTURES
+
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+
+import importlib.util
+import os
+from typing import Any
+
+# Linear solver backends in order of preference for small models.
+BACKENDS: tuple[str, ...] = ('dense', 'banded', 'sparse', 'iterative', 'matrix_free', 'substructure')
+
+# Largest number of free degrees of freedom solved densely by 'auto'.
+DENSE_DOF_LIMIT: int = 2000
+
+# Environment variable overriding the default memory budget, in bytes.
+BUDGET_VARIABLE: str = 'OPENSTRAN_MEMORY_BUDGET'
+
+
+class MemoryBudgetError(MemoryError):
+    """Raised when no permitted solver backend fits in the memory budget."""
+
+
+def default_memory_budget() -> int:
+    """Return the memory budget used when none is given.
+
+    The ``OPENSTRAN_MEMORY_BUDGET`` environment variable (bytes) takes
+    precedence, otherwise half of the physical memory, or 4 GiB where that
+    cannot be determined.
+
+    :returns: Budget in bytes
+    :rtype: int
+    """
+    if os.environ.get(BUDGET_VARIABLE):
+        return int(float(os.environ[BUDGET_VARIABLE]))
+    try:
+        return os.sysconf('SC_PHYS_PAGES')*os.sysconf('SC_PAGE_SIZE')//2
+    except (AttributeError, ValueError, OSError):
+        return 4*1024**3
+
+
+def sparse_available() -> bool:
+    """Return True if SciPy is installed for the 'sparse' backend."""
+    return importlib.util.find_spec('scipy') is not None
+
+
+@dataclass(slots=True)
+class Estimate():
+    """Predicted size and cost of solving a model, per solver backend.
+
+    Computed from node, submember and connectivity counts only; nothing is
+    assembled. Memory figures are peak bytes of the arrays each backend
+    allocates and flops are rough operation counts of the factorization
+    (for 'iterative' and 'matrix_free', of an assumed ``10*sqrt(free_DoF)``
+    iterations).
+
+    :ivar nodes: Number of nodes
+    :type nodes: int
+    :ivar elements: Number of submembers
+    :type elements: int
+    :ivar nDoF: Total degrees of freedom
+    :type nDoF: int
+    :ivar free_DoF: Unrestrained degrees of freedom
+    :type free_DoF: int
+    :ivar nnz: Structural nonzeros of the free stiffness matrix
+    :type nnz: int
+    :ivar bandwidth: Half bandwidth in node ID order
+    :type bandwidth: int
+    :ivar rcm_bandwidth: Half bandwidth after reverse Cuthill-McKee ordering
+    :type rcm_bandwidth: int
+    :ivar memory: Peak bytes per backend
+    :type memory: dict[str, int]
+    :ivar flops: Floating point operations per backend
+    :type flops: dict[str, float]
+    :ivar budget: Memory budget in bytes the backend was selected against
+    :type budget: int
+    :ivar backend: Backend 'auto' selects, or '' if none fits the budget
+    :type backend: str
+
+    :Example:
+
+        >>> frame.estimate().memory['dense']
+    """
+    nodes: int = 0
+    elements: int = 0
+    nDoF: int = 0
+    free_DoF: int = 0
+    nnz: int = 0
+    bandwidth: int = 0
+    rcm_bandwidth: int = 0
+    memory: dict[str, int] = field(default_factory=dict[str, int])
+    flops: dict[str, float] = field(default_factory=dict[str, float])
+    budget: int = 0
+    backend: str = ''
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    def fits(self, backend: str) -> bool:
+        """Return True if ``backend`` is estimated to fit in the budget."""
+        return self.memory[backend] <= self.budget
+
+    def select(self, backend: str = 'auto') -> str:
+        """Choose a backend, or check a requested one against the budget.
+
+        'auto' solves small models densely, narrow-banded models with
+        :class:`BandedCholesky`, other models with SciPy's sparse solver if
+        installed, and falls back to conjugate gradients, assembled or
+        matrix-free. 'substructure' is only used when requested.
+
+        :param backend: 'auto' or one of :data:`BACKENDS`
+        :type backend: str
+        :returns: The backend to use
+        :rtype: str
+        :raises ValueError: If ``backend`` is not recognized
+        :raises ImportError: If 'sparse' is requested without SciPy installed
+        :raises MemoryBudgetError: If the backend does not fit in the budget
+        """
+        if backend == 'auto':
+            if self.backend:
+                return self.backend
+            raise MemoryBudgetError(self.message('every backend'))
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}'; expected 'auto' or one of {', '.join(BACKENDS)}."
+            )
+        if backend == 'sparse' and not sparse_available():
+            raise ImportError(
+                "The 'sparse' backend requires SciPy: pip install OpenSTRAN[sparse]"
+            )
+        if not self.fits(backend):
+            raise MemoryBudgetError(self.message(f"the '{backend}' backend"))
+        return backend
+
+    def message(self, subject: str) -> str:
+        """Describe why ``subject`` does not fit in the memory budget."""
+        needs = ', '.join(
+            f"{name} {size/1024**2:,.0f} MiB" for name, size in self.memory.items())
+        return (
+            f"Solving {self.free_DoF:,} free degrees of freedom with {subject} "
+            f"exceeds the memory budget of {self.budget/1024**2:,.0f} MiB "
+            f"(estimated: {needs}). Raise the budget with memory_budget= or "
+            f"{BUDGET_VARIABLE}, or reduce the mesh density."
+        )
+
+
+def estimate(
+    nodes: Nodes,
+    members: Members,
+    memory_budget: int | None = None,
+    substructures: int = SUBSTRUCTURES
+) -> Estimate:
+    """Estimate the size and cost of solving a model without assembling it.
+
+    :param nodes: Collection of nodes in the structural model
+    :type nodes: Nodes
+    :param members: Collection of members in the structural model
+    :type members: Members
+    :param memory_budget: Budget in bytes. Defaults to :func:`default_memory_budget`.
+    :type memory_budget: int | None
+    :param substructures: Number of substructures of the 'substructure'
+        backend. Defaults to :data:`SUBSTRUCTURES`.
+    :type substructures: int
+    :returns: The estimate, including the backend 'auto' would select
+    :rtype: Estimate
+    """
+    budget = default_memory_budget() if memory_budget is None else int(memory_budget)
+
+    # Count the numbered and restrained degrees of freedom as the solver
+    # does: the active ones of each node and the supported among them.
+    dofs = node_dofs(members.truss, nodes.plane)
+    d = len(dofs)
+    connectivity = members.connectivity()
+    active = active_dofs(connectivity, members.releases(), nodes.count, dofs,
+                         members.axis_cosines())
+    restraint = np.array([node.restraint for node in nodes.nodes.values()],
+                         dtype=bool).reshape(-1, 6)
+    n = int(np.count_nonzero(active))
+    f = n - int(np.count_nonzero(active & restraint))
+    sizes = {case: len(element_dof_positions(*case, dofs)) for case in ELEMENT_DOF}
+    triplets = 0
+    for mbr in members.members.values():
+        for submbr in mbr.submembers.values():
+            triplets += sizes[(submbr.i_release, submbr.j_release)]**2
+
+    full_nnz, bandwidth = sparsity(connectivity, d)
+    nnz = int(full_nnz*(f/(nodes.count*d))**2) if nodes.count else 0
+    if len(connectivity):
+        rank = np.empty(nodes.count, dtype=np.int64)
+        rank[reverse_cuthill_mckee(connectivity, nodes.count)] = np.arange(nodes.count)
+        rcm_bandwidth = d*int(np.max(np.abs(
+            rank[connectivity[:, 0]] - rank[connectivity[:, 1]]))) + d - 1
+    else:
+        rcm_bandwidth = 0
+    s = min(max(rcm_bandwidth, MIN_BLOCK), max(f, 1))
+
+    # Triplet arrays and their sort, then the full and reduced CSR matrices.
+    # Layouts without every rotation are assembled from triplets for every backend.
+    assembly = 48*triplets + 32*(full_nnz + nnz)
+    memory = {
+        'dense': 8*(n*n + n*f + 3*f*f) + (assembly if n < 6*nodes.count else 0),
+        'banded': assembly + 16*f*s,
+        'sparse': assembly + 24*f*s,
+        'iterative': assembly + 64*f,
+        # Element indices, rotations and local matrices, shared by the
+        # submembers of a member, plus the batch temporaries.
+        'matrix_free': 208*len(connectivity) + 48*nodes.count +
+        1152*min(3*members.count, len(connectivity)) +
+        4608*min(OPERATOR_CHUNK, len(connectivity)) + 64*f,
+        # Banded interior factors and their coupling to an interface of
+        # about one band per cut, then the dense interface matrix.
+        'substructure': assembly + 32*f*s + 8*((substructures-1)*s)**2,
+    }
+    iterations = 10*int(np.sqrt(f))
+    flops = {
+        'dense': 2/3*f**3,
+        'banded': 7/3*f*s**2,
+        'sparse': float(f*s**2),
+        'iterative': 2.0*nnz*iterations,
+        'matrix_free': 864.0*len(connectivity)*iterations,
+        'substructure': 19/3*f*s**2 + 2/3*((substructures-1)*s)**3,
+    }
+
+    result = Estimate(
+        nodes=nodes.count,
+        elements=len(connectivity),
+        nDoF=n,
+        free_DoF=f,
+        nnz=nnz,
+        bandwidth=bandwidth,
+        rcm_bandwidth=rcm_bandwidth,
+        memory=memory,
+        flops=flops,
+        budget=budget
+    )
+
+    if f <= DENSE_DOF_LIMIT and result.fits('dense'):
+        result.backend = 'dense'
+    elif result.fits('banded') and 4*s <= f:
+        result.backend = 'banded'
+    elif sparse_available() and result.fits('sparse'):
+        result.backend = 'sparse'
+    else:
+        result.backend = next(
+            (b for b in ('banded', 'iterative', 'matrix_free', 'dense') if result.fits(b)), '')
+    return result
@@ -1,13 +1,70 @@
 from .Nodes import Nodes
 from .Node import Node
-from .Submember import SubMember
+from .Submember import SubMember, FORCE_KEYS
+from .Elements import (
+    ELEMENT_DOF,
+    ELEMENT_NODE_DOFS,
+    element_dof_positions,
+    element_matrices,
+    element_rotation_matrices,
+    rotation_matrices
+)
 import numpy as np
-from math import sqrt
+from math import factorial, sqrt
+import time
 
-from typing import Any
+from typing import Any, Self
 
 from dataclasses import dataclass, field, asdict
 
+# Distance in feet within which an adaptive mesh reuses an existing node.
+SPLIT_TOLERANCE: float = 1e-6
+
+
+def load_integral(
+    loads: np.ndarray,
+    component: int,
+    n: np.ndarray,
+    x: np.ndarray,
+    order: int
+) -> np.ndarray:
+    """Integrate span loads repeatedly from node i of their submember.
+
+    Loads are summed as singularity functions: a point load P at xp
+    contributes ``P<x-xp>^(order-1)/(order-1)!`` and a linearly varying
+    load from x1 to x2 the difference of its ramps at x1 and x2.
+
+    :param loads: (k, 9) span loads as rows of [submember, x1, x2, q1x, q1y,
+        q1z, q2x, q2y, q2z], see :meth:`Member.span_results`
+    :type loads: numpy.ndarray
+    :param component: Local load component, 0 for x, 1 for y and 2 for z
+    :type component: int
+    :param n: (s,) zero-based submember of each station
+    :type n: numpy.ndarray
+    :param x: (s,) distance of each station from node i of its submember, in feet
+    :type x: numpy.ndarray
+    :param order: Number of integrations, 1 for the resultant
+    :type order: int
+    :returns: (s,) integral at each station
+    :rtype: numpy.ndarray
+    """
+    if not len(loads):
+        return np.zeros(len(x))
+    x1, x2 = loads[:, 1], loads[:, 2]
+    q1, q2 = loads[:, 3+component], loads[:, 6+component]
+    span = x2 - x1
+    point = span == 0
+    slope = np.divide(q2-q1, span, out=np.zeros_like(span), where=~point)
+
+    def ramp(a: np.ndarray, p: int) -> np.ndarray:
+        d = x[:, None] - a
+        return np.where(d >= 0, np.maximum(d, 0)**p/factorial(p), 0.0)
+
+    distributed = q1*ramp(x1, order) + slope*ramp(x1, order+1) - \
+        q2*ramp(x2, order) - slope*ramp(x2, order+1)
+    values = np.where(point, q1*ramp(x1, order-1), distributed)
+    return np.sum((n[:, None] == loads[:, 0])*values, axis=1)
+
 
 @dataclass(slots=True)
 class Member():
@@ -40,13 +97,21 @@ class Member():
     :vartype G: float
     :ivar J: Polar moment of inertia in in^4.
     :vartype J: float
-    :ivar mesh: Number of discretizations (submembers) along the member span.
-    :vartype mesh: int
+    :ivar mesh: Number of discretizations (submembers) along the member span, or
+                'adaptive' to place mesh nodes only at brace points, result stations
+                and load application points.
+    :vartype mesh: int | str
     :ivar bracing: Lateral bracing configuration. Can be 'continuous', 'quarter', 'third',
                    'midspan', or a list of bracing locations along the span.
     :vartype bracing: str | list[float]
     :ivar shape: Cross-sectional shape identifier.
     :vartype shape: str
+    :ivar refine: Adaptive meshes only. Distributed loads are divided so that no
+                  loaded submember is longer than ``length/refine``.
+    :vartype refine: int
+    :ivar stations: Adaptive meshes only. Result stations as percentages of the
+                    span (0-100%) that get a mesh node.
+    :vartype stations: list[float]
     :ivar length: Calculated length of the member (in).
     :vartype length: float
     :ivar Cb: Lateral-torsional buckling coefficient.
@@ -55,6 +120,16 @@ class Member():
     :vartype count: int
     :ivar submembers: Dictionary of submembers indexed by creation order.
     :vartype submembers: dict[int, SubMember]
+    :ivar diagram_cache: Submember results and span loads gathered by
+                         :meth:`span_results`, cleared when the model is solved or loaded.
+    :vartype diagram_cache: dict[str, numpy.ndarray]
+    :ivar split_time: Wall time in seconds spent in :meth:`split`, e.g. placing
+                      mesh nodes at loads applied to an adaptive mesh.
+    :vartype split_time: float
+    :ivar spilled: True if the results of the last solve were written to a
+                   :class:`ResultStore` by ``Model.solve(store=...)`` instead of
+                   being held by the submembers.
+    :vartype spilled: bool
     """
 
     nodes: Nodes
@@ -68,14 +143,20 @@ class Member():
     A: float
     G: float
     J: float
-    mesh: int
+    mesh: int | str
     bracing: str | list[float]
     shape: str
+    refine: int = 1
+    stations: list[float] = field(default_factory=list[float])
     length: float = field(init=False)
     Cb: float = field(init=False)
     count: int = 0
     submembers: dict[int, SubMember] = field(
         default_factory=dict[int, SubMember])
+    diagram_cache: dict[str, np.ndarray] = field(
+        default_factory=dict[str, np.ndarray])
+    split_time: float = 0.0
+    spilled: bool = False
 
     def __post_init__(self) -> None:
         """Initialize the member after dataclass instantiation.
@@ -90,60 +171,89 @@ class Member():
         # Calculate the member length based on the node coordinates
         self.length = self.calculate_length(self.node_i, self.node_j)
 
-        j: Node = self.node_i
-        for i, node in enumerate(
-            self.add_mesh(self.nodes, self.node_i,
-                          self.node_j, self.mesh, self.length)
-        ):
-            if i+1 == 1:
-                i = self.node_i
-                j = node
-
-                self.add_submember(
-                    i,
-                    j,
-                    self.i_release,
-                    False,
-                    self.E,
-                    self.Ixx,
-                    self.Iyy,
-                    self.A,
-                    self.G,
-                    self.J)
-
-            elif i+1 < self.mesh:
-                i = j
-                j = node
-
-                self.add_submember(
-                    i,
-                    j,
-                    False,
-                    False,
-                    self.E,
-                    self.Ixx,
-                    self.Iyy,
-                    self.A,
-                    self.G,
-                    self.J
-                )
-
-            else:
-                i = j
-                j = self.node_j
-
-                self.add_submember(
-                    i,
-                    j,
-                    False,
-                    self.j_release,
-                    self.E,
-                    self.Ixx,
-                    self.Iyy,
-                    self.A,
-                    self.G,
-                    self.J
-                )
+        if self.mesh == 'adaptive':
+            # Start from a single submember and split it where needed
+            self.add_submember(
+                self.node_i,
+                self.node_j,
+                self.i_release,
+                self.j_release,
+                self.E,
+                self.Ixx,
+                self.Iyy,
+                self.A,
+                self.G,
+                self.J
+            )
+            for location in self.brace_points() + [self.length*station/100 for station in self.stations]:
+                self.split(location)
+            return
+
+        # Submembers run between consecutive mesh nodes; the last mesh node
+        # is at node j.
+        mesh_nodes = self.add_mesh(self.nodes, self.node_i,
+                                   self.node_j, self.mesh, self.length)
+        self.add_submembers([self.node_i, *mesh_nodes[:-1], self.node_j])
+
+    @classmethod
+    def from_submembers(
+        cls,
+        nodes: Nodes,
+        node_i: Node,
+        node_j: Node,
+        i_release: bool,
+        j_release: bool,
+        E: float,
+        Ixx: float,
+        Iyy: float,
+        A: float,
+        G: float,
+        J: float,
+        mesh: int | str,
+        bracing: str | list[float],
+        shape: str,
+        submembers: list[SubMember],
+        refine: int = 1,
+        stations: list[float] | None = None
+    ) -> Self:
+        """Create a member from existing submembers without meshing.
+
+        Bypasses :meth:`__post_init__` so that no mesh nodes are searched for
+        or added and no submember is rebuilt. Used to restore saved models.
+
+        :param submembers: Submembers in order from node i to node j
+        :type submembers: list[SubMember]
+        :param refine: Refinement of distributed loads on adaptive meshes. Defaults to 1.
+        :type refine: int
+        :param stations: Result stations of adaptive meshes. Defaults to None.
+        :type stations: list[float] | None
+        :returns: A new Member owning ``submembers``
+        :rtype: Self
+        """
+        mbr = object.__new__(cls)
+        mbr.nodes = nodes
+        mbr.node_i = node_i
+        mbr.node_j = node_j
+        mbr.i_release = i_release
+        mbr.j_release = j_release
+        mbr.E = E
+        mbr.Ixx = Ixx
+        mbr.Iyy = Iyy
+        mbr.A = A
+        mbr.G = G
+        mbr.J = J
+        mbr.mesh = mesh
+        mbr.bracing = bracing
+        mbr.shape = shape
+        mbr.refine = refine
+        mbr.stations = list(stations or [])
+        mbr.length = mbr.calculate_length(node_i, node_j)
+        mbr.count = len(submembers)
+        mbr.submembers = {n+1: submbr for n, submbr in enumerate(submembers)}
+        mbr.diagram_cache = {}
+        mbr.split_time = 0.0
+        mbr.spilled = False
+        return mbr
 
     def calculate_length(self, node_i: Node, node_j: Node) -> float:
         """Calculate the length of the member using the Euclidean distance formula.
@@ -276,6 +386,181 @@ class Member():
         )
         self.submembers[self.count] = submbr
 
+    def add_submembers(self, chain: list[Node]) -> None:
+        """Add submembers between consecutive nodes of a chain in one batch.
+
+        Equivalent to :meth:`add_submember` for every pair of consecutive
+        nodes, with the member releases at the ends of the chain, but the
+        geometry and stiffness matrices are built per release case by
+        :func:`element_matrices` instead of element by element.
+
+        :param chain: Nodes from node i to node j of the member
+        :type chain: list[Node]
+        :returns: None
+        :rtype: None
+        """
+        xyz = np.array([node.coordinates.coordinates for node in chain], dtype=float)
+        d = xyz[1:] - xyz[:-1]
+        lengths = np.sqrt(np.einsum('ij,ij->i', d, d))
+        rotation = rotation_matrices(xyz[:-1], xyz[1:])
+        releases = np.zeros((len(d), 2), dtype=bool)
+        releases[0, 0] = self.i_release
+        releases[-1, 1] = self.j_release
+        properties = (self.E, self.Ixx, self.Iyy, self.A, self.G, self.J)
+
+        submbrs: list[SubMember | None] = [None]*len(d)
+        for i_release, j_release in ELEMENT_DOF:
+            index = np.flatnonzero(
+                (releases[:, 0] == i_release) & (releases[:, 1] == j_release))
+            if len(index) == 0:
+                continue
+            R, Kl, Kg = element_matrices(
+                rotation[index], lengths[index],
+                np.tile(properties, (len(index), 1)), i_release, j_release)
+            for n, k in enumerate(index.tolist()):
+                submbrs[k] = SubMember.from_matrices(
+                    chain[k], chain[k+1], i_release, j_release, *properties,
+                    float(lengths[k]), R[n], Kl[n], Kg[n])
+        for submbr in submbrs:
+            assert submbr is not None
+            self.count += 1
+            self.submembers[self.count] = submbr
+
+    def brace_points(self) -> list[float]:
+        """Return the lateral brace point locations along the member span.
+
+        :returns: Distances from node i in feet, none for continuous bracing
+        :rtype: list[float]
+        :raises ValueError: If ``bracing`` is not a recognized configuration
+        """
+        divisions = {'continuous': 1, 'midspan': 2, 'third': 3, 'quarter': 4}
+        if isinstance(self.bracing, list):
+            return [float(location) for location in self.bracing]
+        if self.bracing not in divisions:
+            raise ValueError(
+                "Must be 'continuous', 'quarter','third','midspan' or an array of locations"
+            )
+        n = divisions[self.bracing]
+        return [self.length*k/n for k in range(1, n)]
+
+    def split(self, location: float) -> Node:
+        """Split the submember spanning a location with a new mesh node.
+
+        The submember is replaced by two submembers that keep its section
+        properties and end releases, its equivalent nodal actions are removed
+        from its nodes and its span loads are applied again to the two parts.
+        Locations within :data:`SPLIT_TOLERANCE` of an existing node are not
+        split.
+
+        :param location: Distance from node i in feet
+        :type location: float
+        :returns: The node at ``location``
+        :rtype: Node
+        :raises ValueError: If ``location`` is outside the member
+        """
+        # Splits nest through the span loads applied again to the parts, so
+        # the outermost call sets the total rather than adding to it
+        split_time = self.split_time
+        start = time.perf_counter()
+        node = self._split(location)
+        self.split_time = split_time + time.perf_counter() - start
+        return node
+
+    def _split(self, location: float) -> Node:
+        """Split the submember spanning a location, see :meth:`split`.
+
+        :param location: Distance from node i in feet
+        :type location: float
+        :returns: The node at ``location``
+        :rtype: Node
+        :raises ValueError: If ``location`` is outside the member
+        """
+        submbrs = list(self.submembers.values())
+        l1 = 0.0
+        for n, submbr in enumerate(submbrs):
+            l2 = l1 + submbr.length
+            if abs(location - l1) <= SPLIT_TOLERANCE:
+                return submbr.node_i
+            if abs(location - l2) <= SPLIT_TOLERANCE:
+                return submbr.node_j
+            if l1 < location < l2:
+                break
+            l1 = l2
+        else:
+            raise ValueError(
+                f"Location {location} ft is outside the member span of {self.length} ft."
+            )
+
+        # Add a mesh node at the location
+        start = self.node_i.coordinates
+        end = self.node_j.coordinates
+        scalar = location/self.length
+        node = self.nodes.add_node(
+            start.x + scalar*(end.x - start.x),
+            start.y + scalar*(end.y - start.y),
+            start.z + scalar*(end.z - start.z),
+            mesh_node=True
+        )
+
+        # Remove the equivalent nodal actions of the submember from its nodes
+        R = submbr.rotation_matrix[0:3, 0:3]
+        for end_node, k in ((submbr.node_i, 0), (submbr.node_j, 1)):
+            forces = np.r_[
+                R @ [submbr.ENAs[key][k] for key in FORCE_KEYS[:3]],
+                R @ [submbr.ENAs[key][k] for key in FORCE_KEYS[3:]]
+            ]
+            for name, value in zip(('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz'), forces.tolist()):
+                setattr(end_node, name, getattr(end_node, name) - value)
+                setattr(end_node, 'e' + name, getattr(end_node, 'e' + name) - value)
+
+        # Replace the submember by two submembers in span order
+        self.submembers = {}
+        self.count = 0
+        for other in submbrs[:n]:
+            self.count += 1
+            self.submembers[self.count] = other
+        for i, j, i_release, j_release in (
+            (submbr.node_i, node, submbr.i_release, False),
+            (node, submbr.node_j, False, submbr.j_release)
+        ):
+            self.add_submember(
+                i,
+                j,
+                i_release,
+                j_release,
+                submbr.E,
+                submbr.Ixx,
+                submbr.Iyy,
+                submbr.A,
+                submbr.G,
+                submbr.J
+            )
+            # Keep the orientation of the member; the axes of a short part
+            # built from its own nodes may differ by the vertical member check
+            part = self.submembers[self.count]
+            part.rotation_matrix = element_rotation_matrices(
+                submbr.rotation_matrix[None, 0:3, 0:3], i_release, j_release)[0]
+            part.transformation_matrix = part.rotation_matrix.T
+            part.Kg = part.transformation_matrix.T.dot(
+                part.Kl).dot(part.transformation_matrix)
+        for other in submbrs[n+1:]:
+            self.count += 1
+            self.submembers[self.count] = other
+        self.diagram_cache.clear()
+
+        # Apply the span loads of the submember to its parts
+        for x1, x2, *q in submbr.loads:
+            loc1 = (l1 + x1)/self.length*100
+            loc2 = (l1 + x2)/self.length*100
+            for k, direction in enumerate('xyz'):
+                if q[k] == 0 and q[3+k] == 0:
+                    continue
+                if x1 == x2:
+                    self.add_point_load(q[k], direction, loc1)
+                else:
+                    self.add_distributed_load(q[k], q[3+k], direction, loc1, loc2)
+        return node
+
     def calculate_Cb(self) -> float:
         """
         Calculate the lateral-torsional buckling coefficient (Cb) for the member.
@@ -424,6 +709,223 @@ class Member():
         self.Cb = min(min(Cb), 3)
         return self.Cb
 
+    def span_results(self) -> dict[str, np.ndarray]:
+        """Gather the submember results used by :meth:`diagram` and :meth:`deflected_shape`.
+
+        The arrays are built once per solve and kept in :attr:`diagram_cache`:
+        'start' and 'length' of each submember in feet, its end 'forces' at
+        node i, its local end 'translations' at nodes i and j in inches, the
+        axial and bending 'rigidity' EA, EIzz and EIyy, the 3x3 'rotation'
+        from local to global axes and the span 'loads' of every submember as
+        rows of [submember, x1, x2, q1x, q1y, q1z, q2x, q2y, q2z].
+
+        :returns: The cached arrays
+        :rtype: dict[str, numpy.ndarray]
+        :raises ValueError: If the model has not been solved, or its results
+            were spilled to a :class:`ResultStore`
+        """
+        cache = self.diagram_cache
+        if not cache:
+            submbrs = list(self.submembers.values())
+            if any(len(submbr.results['axial']) != 2 for submbr in submbrs):
+                if self.spilled:
+                    raise ValueError(
+                        "The results of this member were spilled by solve(store=...); "
+                        "read its end forces from Model.results or solve without a store "
+                        "for results along members."
+                    )
+                raise ValueError("Solve the model before requesting results along members.")
+            lengths = np.array([submbr.length for submbr in submbrs])
+            cache['start'] = np.r_[0.0, np.cumsum(lengths)[:-1]]
+            cache['length'] = lengths
+            cache['forces'] = np.array(
+                [[submbr.results[key][0] for key in FORCE_KEYS] for submbr in submbrs],
+                dtype=float)
+            cache['translations'] = np.array([
+                np.ravel(submbr.results['displacements'])[
+                    element_dof_positions(submbr.i_release, submbr.j_release, (0, 1, 2))]
+                for submbr in submbrs], dtype=float)
+            cache['rigidity'] = np.array(
+                [[submbr.E*submbr.A, submbr.E*submbr.Ixx, submbr.E*submbr.Iyy]
+                 for submbr in submbrs], dtype=float)
+            cache['rotation'] = np.array(
+                [submbr.rotation_matrix[0:3, 0:3] for submbr in submbrs], dtype=float)
+            cache['loads'] = np.array(
+                [[n, *load] for n, submbr in enumerate(submbrs) for load in submbr.loads],
+                dtype=float).reshape(-1, 9)
+        return cache
+
+    def locate(self, stations: np.ndarray | list[float] | None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the submember and the position on it of stations along the member.
+
+        :param stations: Locations as percentages of the member span (0-100%).
+                         Defaults to 101 evenly spaced stations.
+        :type stations: numpy.ndarray | list[float] | None
+        :returns: Locations in feet from node i, the zero-based submember of
+                  each station and the distance in feet from its node i
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+        if stations is None:
+            stations = np.linspace(0, 100, 101)
+        x = self.length*np.asarray(stations, dtype=float)/100
+        start = self.span_results()['start']
+        n = np.clip(np.searchsorted(start, x, side='right')-1, 0, len(start)-1)
+        return x, n, x - start[n]
+
+    def diagram(self, name: str, stations: np.ndarray | list[float] | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate an internal force diagram at arbitrary stations along the member.
+
+        Internal forces are computed in closed form on each submember from its
+        end forces at node i and the span loads applied to it, so no re-meshing
+        or re-solving is needed for a finer diagram. Values follow the sign of
+        the end forces at node i: the diagram starts at ``results[name][0]`` of
+        the first submember and ends at ``-results[name][1]`` of the last. The
+        submember end forces and loads are gathered once and cached until the
+        next solve.
+
+        :param name: Internal force, one of 'axial', 'shear', 'transverse shear',
+                     'torsional moments', 'minor axis moments' or 'major axis moments'.
+        :type name: str
+        :param stations: Locations as percentages of the member span (0-100%).
+                         Defaults to 101 evenly spaced stations.
+        :type stations: numpy.ndarray | list[float] | None
+        :returns: Locations in feet from node i and the internal forces there, in
+                  kips or kip-in.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        :raises ValueError: If ``name`` is not a force, or the model has not been
+            solved or its results were spilled to a :class:`ResultStore`.
+
+        :Example:
+
+            >>> frame.solve()
+            >>> x, Mz = M1.diagram('major axis moments', stations=np.linspace(0, 100, 201))
+        """
+        if name not in FORCE_KEYS:
+            raise ValueError(
+                f"Unknown diagram '{name}'; expected one of {', '.join(FORCE_KEYS)}."
+            )
+        x, n, xi = self.locate(stations)
+        cache = self.span_results()
+        forces, loads = cache['forces'], cache['loads']
+
+        # Load component integrated by the diagram
+        key = FORCE_KEYS.index(name)
+        component = (0, 1, 2, None, 2, 1)[key]
+
+        # Moments are in kip-in and member positions in feet
+        values = forces[n, key].copy()
+        if key in (0, 1, 2):
+            values += load_integral(loads, component, n, xi, 1)
+        elif key == 4:
+            values += 12*(xi*forces[n, 2] + load_integral(loads, component, n, xi, 2))
+        elif key == 5:
+            values -= 12*(xi*forces[n, 1] + load_integral(loads, component, n, xi, 2))
+        return x, values
+
+    def deflected_shape(
+        self,
+        stations: np.ndarray | list[float] | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the deflected shape at arbitrary stations along the member.
+
+        On each submember the translations are the cubic Hermite interpolation
+        of its end displacements and rotations plus the particular solution of
+        its span loads. They are integrated in closed form from the curvature
+        of :meth:`diagram` and the end translations, which also holds at
+        released ends whose rotations are not numbered. No re-meshing or
+        re-solving is needed for a smooth shape.
+
+        :param stations: Locations as percentages of the member span (0-100%).
+                         Defaults to 101 evenly spaced stations.
+        :type stations: numpy.ndarray | list[float] | None
+        :returns: Locations in feet from node i, and (n, 3) translations in
+                  inches along the local x, y, z axes of the member and along
+                  the global X, Y, Z axes.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        :raises ValueError: If the model has not been solved, or its results
+            were spilled to a :class:`ResultStore`.
+
+        :Example:
+
+            >>> frame.solve()
+            >>> x, local, world = M1.deflected_shape(stations=np.linspace(0, 100, 201))
+        """
+        x, n, xi = self.locate(stations)
+        cache = self.span_results()
+        forces, loads, lengths = cache['forces'], cache['loads'], cache['length']
+        translations, rigidity = cache['translations'], cache['rigidity']
+
+        def flexibility(r: np.ndarray) -> np.ndarray:
+            # Truss members have no bending stiffness and no curvature
+            return np.divide(1, r, out=np.zeros_like(r), where=r != 0)
+
+        def shape(t: np.ndarray) -> np.ndarray:
+            # Displacements integrated from the internal forces, in inches,
+            # at distances t in feet from node i of each submember
+            u = -12*(t*forces[n, 0] + load_integral(loads, 0, n, t, 2))
+            v = -forces[n, 5]*t**2/2 + 2*forces[n, 1]*t**3 + \
+                12*load_integral(loads, 1, n, t, 4)
+            w = forces[n, 4]*t**2/2 + 2*forces[n, 2]*t**3 + \
+                12*load_integral(loads, 2, n, t, 4)
+            scale = np.array([1.0, 144.0, 144.0])*flexibility(rigidity[n])
+            return np.column_stack((u, v, w))*scale
+
+        # Add the rigid body motion matching the end translations
+        end = shape(lengths[n])
+        ratio = (xi/lengths[n])[:, None]
+        local = shape(xi) + translations[n, 0:3] + \
+            ratio*(translations[n, 3:6] - translations[n, 0:3] - end)
+        world = np.einsum('nij,nj->ni', cache['rotation'][n], local)
+        return x, local, world
+
+    def max_deflection(
+        self,
+        stations: np.ndarray | list[float] | None = None,
+        chord: bool = True
+    ) -> tuple[float, float]:
+        """
+        Return the largest transverse deflection and its span/deflection ratio.
+
+        By default deflections are measured from the chord between the
+        displaced member ends, as for serviceability limits such as L/360 on
+        spans supported at both ends. The chord follows the free end of a
+        cantilever, so its tip deflection is not included; pass
+        ``chord=False`` to measure the transverse displacement from the
+        undeformed member axis instead. Both use the deflected shape of
+        :meth:`deflected_shape` at the given stations.
+
+        :param stations: Locations as percentages of the member span (0-100%).
+                         Defaults to 1001 evenly spaced stations.
+        :type stations: numpy.ndarray | list[float] | None
+        :param chord: True to measure from the chord between the displaced
+                      ends, False to measure from the undeformed member axis,
+                      e.g. for cantilevers. Defaults to True.
+        :type chord: bool
+        :returns: The deflection in inches and the member length over it, or
+                  infinity if the member does not deflect.
+        :rtype: tuple[float, float]
+        :raises ValueError: If the model has not been solved, or its results
+            were spilled to a :class:`ResultStore`.
+
+        :Example:
+
+            >>> frame.solve()
+            >>> delta, ratio = M1.max_deflection()
+            >>> ratio >= 360
+            >>> tip, ratio = cantilever.max_deflection(chord=False)
+        """
+        if stations is None:
+            stations = np.linspace(0, 100, 1001)
+        x, local, _ = self.deflected_shape(np.r_[0.0, 100.0, stations])
+        ends, local, x = local[0:2], local[2:], x[2:]
+        if chord:
+            local = local - (ends[0] + (x/self.length)[:, None]*(ends[1] - ends[0]))
+        delta = float(np.max(np.hypot(*local[:, 1:3].T), initial=0.0))
+        ratio = 12*self.length/delta if delta > 0 else np.inf
+        return delta, ratio
+
     def add_point_load(self, mag: float, direction: str, location: float) -> None:
         """
         Apply a concentrated point load to the member.
@@ -446,6 +948,10 @@ class Member():
         # Convert location from percentage to absolute distance
         location = self.length*(location/100)
 
+        # Adaptive meshes place a node at the load
+        if self.mesh == 'adaptive':
+            self.split(location)
+
         # Instantiate a variable measuring distance along the member
         l1 = 0
 
@@ -520,7 +1026,7 @@ class Member():
                     a = submbr.length - b
 
                     # Transform the global force vector to local coordinates
-                    FL = np.matmul(transformation_matrix, fg)
+                    FL = np.matmul(transformation_matrix.T, fg)
 
                     # Extract local axial force
                     axial = FL[0]
@@ -531,6 +1037,10 @@ class Member():
                     # Extract local transverse force
                     t = FL[2]
 
+                    # Record the load for the internal force diagrams
+                    submbr.loads.append([a, a, *FL.tolist(), 0.0, 0.0, 0.0])
+                    self.diagram_cache.clear()
+
                     # Calculate equivalent nodal actions
                     if submbr.i_release == True and submbr.j_release == False:
                         # instantiate an array to hold equivalent nodal actions
@@ -548,7 +1058,7 @@ class Member():
                             (3*submbr.length**2-a**2)/(2*submbr.length**3)
                         f_local[8, 0] = t*a*b * \
                             (a+submbr.length)/(2*submbr.length**2)
-                        f_local[9, 0] = v*a*b * \
+                        f_local[9, 0] = -v*a*b * \
                             (a+submbr.length)/(2*submbr.length**2)
 
                     elif submbr.i_release == False and submbr.j_release == True:
@@ -562,7 +1072,7 @@ class Member():
                             (3*submbr.length**2-b**2)/(2*submbr.length**3)
                         f_local[4, 0] = -t*b*a * \
                             (b+submbr.length)/(2*submbr.length**2)
-                        f_local[5, 0] = -v*b*a * \
+                        f_local[5, 0] = v*b*a * \
                             (b+submbr.length)/(2*submbr.length**2)
                         f_local[6, 0] = axial*a/(submbr.length)
                         f_local[7, 0] = v*a**2 * \
@@ -570,6 +1080,17 @@ class Member():
                         f_local[8, 0] = t*a**2 * \
                             (b+2*submbr.length)/(2*submbr.length**3)
 
+                    elif submbr.i_release == True and submbr.j_release == True:
+                        # Instantiate an array to hold equivalent nodal actions
+                        f_local = np.zeros([6, 1])
+
+                        f_local[0, 0] = axial*b/(submbr.length)
+                        f_local[1, 0] = v*b/(submbr.length)
+                        f_local[2, 0] = t*b/(submbr.length)
+                        f_local[3, 0] = axial*a/(submbr.length)
+                        f_local[4, 0] = v*a/(submbr.length)
+                        f_local[5, 0] = t*a/(submbr.length)
+
                     else:
                         # Instantiate an array to hold equivalent nodal actions
                         f_local = np.zeros([12, 1])
@@ -579,18 +1100,22 @@ class Member():
                         f_local[1, 0] = v*b**2*(3*a+b)/submbr.length**3
                         f_local[2, 0] = t*b**2*(3*a+b)/submbr.length**3
                         f_local[4, 0] = -t*a*b**2/submbr.length**2
-                        f_local[5, 0] = -v*a*b**2/submbr.length**2
+                        f_local[5, 0] = v*a*b**2/submbr.length**2
 
                         # Forces at node j
                         f_local[6, 0] = axial*a/(submbr.length)
                         f_local[7, 0] = v*a**2*(a+3*b)/submbr.length**3
                         f_local[8, 0] = t*a**2*(a+3*b)/submbr.length**3
                         f_local[10, 0] = t*a**2*b/submbr.length**2
-                        f_local[11, 0] = v*a**2*b/submbr.length**2
+                        f_local[11, 0] = -v*a**2*b/submbr.length**2
+
+                    # Convert the moments from kip-ft to the kip-in of the
+                    # element forces.
+                    f_local[element_dof_positions(
+                        submbr.i_release, submbr.j_release, (3, 4, 5))] *= 12
 
                     # Transform the local force vector to the global reference plane
-                    transformation_matrix = np.matrix(submbr.rotation_matrix)
-                    f_global = transformation_matrix.I*f_local
+                    f_global = np.matmul(submbr.rotation_matrix, f_local)
 
                     # Add the equivalent nodal forces and moments to each node
                     if submbr.i_release == True and submbr.j_release == False:
@@ -622,7 +1147,7 @@ class Member():
                         submbr.ENAs['shear'][1] += f_local[5, 0]
                         submbr.ENAs['transverse shear'][0] += f_local[2, 0]
                         submbr.ENAs['transverse shear'][1] += f_local[6, 0]
-                        submbr.ENAs['minor axis moments'][0] += f_local[8, 0]
+                        submbr.ENAs['minor axis moments'][1] += f_local[8, 0]
                         submbr.ENAs['major axis moments'][1] += f_local[9, 0]
 
                     elif submbr.i_release == False and submbr.j_release == True:
@@ -655,7 +1180,29 @@ class Member():
                         submbr.ENAs['transverse shear'][0] += f_local[2, 0]
                         submbr.ENAs['transverse shear'][1] += f_local[8, 0]
                         submbr.ENAs['minor axis moments'][0] += f_local[4, 0]
-                        submbr.ENAs['major axis moments'][1] += f_local[5, 0]
+                        submbr.ENAs['major axis moments'][0] += f_local[5, 0]
+
+                    elif submbr.i_release == True and submbr.j_release == True:
+                        submbr.node_i.Fx += f_global[0, 0]
+                        submbr.node_i.Fy += f_global[1, 0]
+                        submbr.node_i.Fz += f_global[2, 0]
+                        submbr.node_j.Fx += f_global[3, 0]
+                        submbr.node_j.Fy += f_global[4, 0]
+                        submbr.node_j.Fz += f_global[5, 0]
+
+                        submbr.node_i.eFx += f_global[0, 0]
+                        submbr.node_i.eFy += f_global[1, 0]
+                        submbr.node_i.eFz += f_global[2, 0]
+                        submbr.node_j.eFx += f_global[3, 0]
+                        submbr.node_j.eFy += f_global[4, 0]
+                        submbr.node_j.eFz += f_global[5, 0]
+
+                        submbr.ENAs['axial'][0] += f_local[0, 0]
+                        submbr.ENAs['axial'][1] += f_local[3, 0]
+                        submbr.ENAs['shear'][0] += f_local[1, 0]
+                        submbr.ENAs['shear'][1] += f_local[4, 0]
+                        submbr.ENAs['transverse shear'][0] += f_local[2, 0]
+                        submbr.ENAs['transverse shear'][1] += f_local[5, 0]
 
                     else:
                         submbr.node_i.Fx += f_global[0, 0]
@@ -726,6 +1273,13 @@ class Member():
         loc1 = self.length*(loc1/100)
         loc2 = self.length*(loc2/100)
 
+        # Adaptive meshes place nodes at the ends of the load and divide it
+        # where the moment diagram curves
+        if self.mesh == 'adaptive':
+            grid = [self.length*k/self.refine for k in range(1, self.refine)]
+            for location in [loc1, *(x for x in grid if loc1 < x < loc2), loc2]:
+                self.split(location)
+
         # Calculate the slope of the trapezoidal load
         m = (Mag2-Mag1)/(loc2-loc1)
 
@@ -813,12 +1367,18 @@ class Member():
                 )
 
             # Transform the global force vector to local coordinates
-            FL1 = np.matmul(transformation_matrix, fg1)
-            FL2 = np.matmul(transformation_matrix, fg2)
+            FL1 = np.matmul(transformation_matrix.T, fg1)
+            FL2 = np.matmul(transformation_matrix.T, fg2)
+
+            # Record the load for the internal force diagrams
+            if lw > 0:
+                submbr.loads.append([a, a+lw, *FL1.tolist(), *FL2.tolist()])
+                self.diagram_cache.clear()
 
             # Extract local axial force
             a1 = FL1[0]
             a2 = FL2[0]
+            am = (a1+a2)/2
 
             # Extract local shearing force
             v1 = FL1[1]
@@ -832,10 +1392,21 @@ class Member():
             td = t2 - t1
             tm = (t1+t2)/2
 
-            if submbr.i_release == False and submbr.j_release == False:
-                # Instantiate a local force vector
-                f_local = np.zeros([12, 1])
+            # First moments of the load about node i and about node j
+            ai = a*lw*am+(lw**2*(2*a2+a1))/6
+            vi = a*lw*vm+(lw**2*(2*v2+v1))/6
+            ti = a*lw*tm+(lw**2*(2*t2+t1))/6
+            vj = b*lw*vm+(lw**2*(2*v1+v2))/6
+            tj = b*lw*tm+(lw**2*(2*t1+t2))/6
+
+            # Instantiate a local force vector
+            f_local = np.zeros([12, 1])
 
+            # Axial forces
+            f_local[6, 0] = ai/l
+            f_local[0, 0] = lw*am-f_local[6, 0]
+
+            if submbr.i_release == False and submbr.j_release == False:
                 # Calculate the geometric constants
                 s1 = 10*((l**2+a**2)*(l+a)-(a**2+b**2)*(a-b)-l*b*(l+b)-a**3)
                 s2 = lw*(l*(2*l+a+b)-3*(a-b)**2-2*a*b)
@@ -843,83 +1414,73 @@ class Member():
                 s4 = 10*l*lw**2-10*lw*a*(l-3*b)-9*lw**3
 
                 # forces at node j
-                f_local[6, 0] = (a1+a2)*submbr.length/2  # axial
                 f_local[7, 0] = (lw*(s1*vm+s2*vd))/(20*l**3)  # normal shear
                 f_local[8, 0] = (lw*(s1*tm+s2*td)) / \
                     (20*l**3)  # transverse shear
-                f_local[10, 0] = -(lw*(s3*tm+s4*td)) / \
+                f_local[10, 0] = (lw*(s3*tm+s4*td)) / \
                     (120*l**2)  # minor axis moment
                 f_local[11, 0] = -(lw*(s3*vm+s4*vd)) / \
                     (120*l**2)  # major axis moment
 
                 # Forces at node i
-                vj = f_local[7, 0]  # Normal shear force at node j
-                tj = f_local[8, 0]  # Transverse shear force at node j
-                mj = f_local[10, 0]  # Minor axis moment at node j
-                Mj = f_local[11, 0]  # Major axis moment at node j
-
-                f_local[0, 0] = (a1+a2)*submbr.length/2  # axial
-                f_local[1, 0] = lw*vm-vj  # normal shear
-                f_local[2, 0] = lw*tm-tj  # transverse shear
-                f_local[4, 0] = mj+tj*l-a*lw*tm - \
-                    (lw**2*(2*t2+t1))/6  # minor axis moment
-                f_local[5, 0] = Mj+vj*l-a*lw*vm - \
-                    (lw**2*(2*v2+v1))/6  # major axis moment
+                f_local[1, 0] = lw*vm-f_local[7, 0]  # normal shear
+                f_local[2, 0] = lw*tm-f_local[8, 0]  # transverse shear
+                f_local[4, 0] = f_local[8, 0]*l-f_local[10, 0] - \
+                    ti  # minor axis moment
+                f_local[5, 0] = vi-f_local[11, 0] - \
+                    f_local[7, 0]*l  # major axis moment
 
             elif submbr.i_release == True and submbr.j_release == False:
-                # Instantiate a local force vector
-                f_local = np.zeros([12, 1])
-
                 s1 = 40*l*(2*l**2-lw**2)+10*lw * \
                     (lw**2-2*b**2)-40*b*(l-a)*(2*l+a)
                 s2 = lw*(3*lw**2-10*l*(lw+2*b)+10*b*(b+lw))
 
-                # Forces at node i
-                f_local[0, 0] = (a1+a2)*submbr.length/2  # axial
-                f_local[1, 0] = (lw*(s1*vm+s2*vd))/(80*l**3)  # normal shear
-                f_local[2, 0] = (lw*(s1*tm+s2*td)) / \
+                # forces at node j
+                f_local[7, 0] = (lw*(s1*vm-s2*vd))/(80*l**3)  # normal shear
+                f_local[8, 0] = (lw*(s1*tm-s2*td)) / \
                     (80*l**3)  # transverse shear
-                f_local[4, 0] = 0  # minor axis moment
-                f_local[5, 0] = 0  # major axis moment
+                f_local[10, 0] = f_local[8, 0]*l-ti  # minor axis moment
+                f_local[11, 0] = vi-f_local[7, 0]*l  # major axis moment
 
+                # Forces at node i
+                f_local[1, 0] = lw*vm-f_local[7, 0]  # normal shear
+                f_local[2, 0] = lw*tm-f_local[8, 0]  # transverse shear
+
+            elif submbr.i_release == True and submbr.j_release == True:
                 # forces at node j
-                f_local[6, 0] = (a1+a2)*submbr.length/2  # axial
-                f_local[7, 0] = lw*vm-f_local[1, 0]  # normal shear
-                f_local[8, 0] = lw*vm-f_local[2, 0]  # transverse shear
-                f_local[10, 0] = f_local[8, 0]*l-b*lw*tm - \
-                    (lw**2*(2*t2+t1))/6  # minor axis moment
-                f_local[11, 0] = f_local[7, 0]*l-b*lw*vm - \
-                    (lw**2*(2*v2+v1))/6  # major axis moment
+                f_local[7, 0] = vi/l  # normal shear
+                f_local[8, 0] = ti/l  # transverse shear
+
+                # Forces at node i
+                f_local[1, 0] = lw*vm-f_local[7, 0]  # normal shear
+                f_local[2, 0] = lw*tm-f_local[8, 0]  # transverse shear
 
             else:
-                # Instantiate a local force vector
                 # (submbr.i_release == False and submbr.j_release == True)
-                f_local = np.zeros([12, 1])
-
                 s1 = 40*l*(2*l**2-lw**2)+10*lw * \
                     (lw**2-2*a**2)-40*a*(l-b)*(2*l+b)
                 s2 = lw*(3*lw**2-10*l*(lw+2*a)+10*a*(a+lw))
 
                 # Forces at node i
-                f_local[0, 0] = (a1+a2)*submbr.length/2  # axial
                 f_local[1, 0] = (lw*(s1*vm+s2*vd))/(80*l**3)  # normal shear
                 f_local[2, 0] = (lw*(s1*tm+s2*td)) / \
                     (80*l**3)  # transverse shear
-                f_local[4, 0] = f_local[2, 0]*l-a*lw*tm - \
-                    (lw**2*(2*t2+t1))/6  # minor axis moment
-                f_local[5, 0] = f_local[1, 0]*l-a*lw*vm - \
-                    (lw**2*(2*v2+v1))/6  # major axis moment
+                f_local[4, 0] = tj-f_local[2, 0]*l  # minor axis moment
+                f_local[5, 0] = f_local[1, 0]*l-vj  # major axis moment
 
                 # Forces at node j
-                f_local[6, 0] = (a1+a2)*submbr.length/2  # Axial
                 f_local[7, 0] = lw*vm-f_local[1, 0]  # Normal shear
-                f_local[8, 0] = lw*vm-f_local[2, 0]  # Transverse shear
-                f_local[10, 0] = 0  # Minor axis moment
-                f_local[11, 0] = 0  # Major axis moment
+                f_local[8, 0] = lw*tm-f_local[2, 0]  # Transverse shear
+
+            # Keep the rows of the element degrees of freedom and convert
+            # the moments from kip-ft to the kip-in of the element forces.
+            dofs_i, dofs_j = ELEMENT_NODE_DOFS[(submbr.i_release, submbr.j_release)]
+            f_local = f_local[np.r_[dofs_i, 6 + np.array(dofs_j)]]
+            f_local[element_dof_positions(
+                submbr.i_release, submbr.j_release, (3, 4, 5))] *= 12
 
             # Transform the local force vector to the global reference plane
-            transformation_matrix = np.matrix(submbr.rotation_matrix)
-            f_global = transformation_matrix.I*f_local
+            f_global = np.matmul(submbr.rotation_matrix, f_local)
 
             # Add the equivalent nodal forces and moments to each node
             if submbr.i_release == True and submbr.j_release == False:
@@ -951,7 +1512,7 @@ class Member():
                 submbr.ENAs['shear'][1] += f_local[5, 0]
                 submbr.ENAs['transverse shear'][0] += f_local[2, 0]
                 submbr.ENAs['transverse shear'][1] += f_local[6, 0]
-                submbr.ENAs['minor axis moments'][0] += f_local[8, 0]
+                submbr.ENAs['minor axis moments'][1] += f_local[8, 0]
                 submbr.ENAs['major axis moments'][1] += f_local[9, 0]
 
             elif submbr.i_release == False and submbr.j_release == True:
@@ -984,7 +1545,29 @@ class Member():
                 submbr.ENAs['transverse shear'][0] += f_local[2, 0]
                 submbr.ENAs['transverse shear'][1] += f_local[8, 0]
                 submbr.ENAs['minor axis moments'][0] += f_local[4, 0]
-                submbr.ENAs['major axis moments'][1] += f_local[5, 0]
+                submbr.ENAs['major axis moments'][0] += f_local[5, 0]
+
+            elif submbr.i_release == True and submbr.j_release == True:
+                submbr.node_i.Fx += f_global[0, 0]
+                submbr.node_i.Fy += f_global[1, 0]
+                submbr.node_i.Fz += f_global[2, 0]
+                submbr.node_j.Fx += f_global[3, 0]
+                submbr.node_j.Fy += f_global[4, 0]
+                submbr.node_j.Fz += f_global[5, 0]
+
+                submbr.node_i.eFx += f_global[0, 0]
+                submbr.node_i.eFy += f_global[1, 0]
+                submbr.node_i.eFz += f_global[2, 0]
+                submbr.node_j.eFx += f_global[3, 0]
+                submbr.node_j.eFy += f_global[4, 0]
+                submbr.node_j.eFz += f_global[5, 0]
+
+                submbr.ENAs['axial'][0] += f_local[0, 0]
+                submbr.ENAs['axial'][1] += f_local[3, 0]
+                submbr.ENAs['shear'][0] += f_local[1, 0]
+                submbr.ENAs['shear'][1] += f_local[4, 0]
+                submbr.ENAs['transverse shear'][0] += f_local[2, 0]
+                submbr.ENAs['transverse shear'][1] += f_local[5, 0]
 
             else:
                 submbr.node_i.Fx += f_global[0, 0]
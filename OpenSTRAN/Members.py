@@ -1,9 +1,14 @@
 from .Member import Member
+from .Truss import Truss
 from .Nodes import Nodes
 from .Node import Node
+from .Sections import section_table
 
 from dataclasses import dataclass, field, asdict
 
+import numpy as np
+
+import time
 from typing import Any
 
 
@@ -17,10 +22,18 @@ class Members():
     :type count: int
     :ivar members: Mapping of member ID to Member object
     :type members: dict[int, Member]
+    :ivar build_time: Wall time in seconds spent creating and meshing members;
+        see :attr:`mesh_time`
+    :type build_time: float
+    :ivar truss: True if the model is a truss, which only accepts
+        :class:`Truss` members and is solved for nodal translations only
+    :type truss: bool
     """
     nodes: Nodes
     count: int = 0
     members: dict[int, Member] = field(default_factory=dict[int, Member])
+    build_time: float = 0.0
+    truss: bool = False
 
     def properties(self) -> dict[str, Any]:
         """Return the dataclass properties as a dictionary.
@@ -30,6 +43,104 @@ class Members():
         """
         return asdict(self)
 
+    @property
+    def mesh_time(self) -> float:
+        """Wall time in seconds spent meshing, including splits made by loads."""
+        return self.build_time + sum(mbr.split_time for mbr in self.members.values())
+
+    def connectivity(self) -> np.ndarray:
+        """Return the submember connectivity as an (m, 2) array of node indices.
+
+        Rows follow member order and then submember order, which is the order
+        used by every per-element result array in the package. Indices are
+        zero-based (``node_ID - 1``) so they address rows of
+        :meth:`Nodes.coordinate_array` directly.
+
+        :returns: Array of [i, j] node indices for each submember
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [
+                (submbr.node_i.node_ID - 1, submbr.node_j.node_ID - 1)
+                for mbr in self.members.values()
+                for submbr in mbr.submembers.values()
+            ],
+            dtype=np.int64
+        ).reshape(-1, 2)
+
+    def releases(self) -> np.ndarray:
+        """Return the submember end releases as an (m, 2) boolean array.
+
+        Rows are in the order of :meth:`connectivity`.
+
+        :returns: Array of [i_release, j_release] for each submember
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [
+                (submbr.i_release, submbr.j_release)
+                for mbr in self.members.values()
+                for submbr in mbr.submembers.values()
+            ],
+            dtype=bool
+        ).reshape(-1, 2)
+
+    def axis_cosines(self) -> np.ndarray:
+        """Return the direction cosine of each submember axis with global X.
+
+        Rows are in the order of :meth:`connectivity`. A released submember
+        end is stiff in the global x rotation only through this cosine (see
+        :func:`active_dofs`).
+
+        :returns: Array of the cosine for each submember
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [
+                submbr.rotation_matrix[0, 0]
+                for mbr in self.members.values()
+                for submbr in mbr.submembers.values()
+            ],
+            dtype=float
+        )
+
+    def section_properties(
+        self,
+        shape: str,
+        Ixx: float | None = None,
+        Iyy: float | None = None,
+        A: float | None = None,
+        J: float | None = None
+    ) -> tuple[float, float, float, float]:
+        """Fill in section properties left as None from the shapes table.
+
+        :param shape: AISC manual label, case-insensitive
+        :type shape: str
+        :returns: Ixx, Iyy, A and J
+        :rtype: tuple[float, float, float, float]
+        :raises ValueError: If a property is not given and ``shape`` is not in
+            the shapes table or does not define it
+        """
+        if None not in (Ixx, Iyy, A, J):
+            return Ixx, Iyy, A, J
+        table = section_table()
+        if shape not in table:
+            raise ValueError(
+                f"Shape '{shape}' not found in the AISC shapes database."
+            )
+        record = table.row(shape)
+        values = []
+        for value, column in ((Ixx, 'Ix'), (Iyy, 'Iy'), (A, 'A'), (J, 'J')):
+            if value is None:
+                value = float(record[column])
+                if np.isnan(value):
+                    raise ValueError(
+                        f"Shape '{shape}' does not define {column}; pass it explicitly."
+                    )
+            values.append(value)
+        Ixx, Iyy, A, J = values
+        return Ixx, Iyy, A, J
+
     def addMember(
         self,
         node_i: Node,
@@ -37,17 +148,22 @@ class Members():
         i_release: bool = False,
         j_release: bool = False,
         E: float = 29000.0,
-        Ixx: float = 88.6,
-        Iyy: float = 2.36,
-        A: float = 4.16,
+        Ixx: float | None = None,
+        Iyy: float | None = None,
+        A: float | None = None,
         G: float = 12000.0,
-        J: float = 0.0704,
-        mesh: int = 50,
+        J: float | None = None,
+        mesh: int | str = 50,
         bracing: str = "continuous",
         shape: str = "W12x14",
+        refine: int = 1,
+        stations: list[float] | None = None,
     ) -> Member:
         """Add a member to the model.
 
+        Section properties left as None are taken from ``shape`` in the AISC
+        shapes table (see :func:`section_table`); explicit values override it.
+
         :param node_i: Start node of the member
         :type node_i: Node
         :param node_j: End node of the member
@@ -58,32 +174,55 @@ class Members():
         :type j_release: bool
         :param E: Young's modulus in ksi. Defaults to 29000.0.
         :type E: float
-        :param Ixx: Moment of inertia about the strong axis in in^4. Defaults to 88.6.
-        :type Ixx: float
-        :param Iyy: Moment of inertia about the weak axis in in^4. Defaults to 2.36.
-        :type Iyy: float
-        :param A: Cross-sectional area in in^2. Defaults to 4.16.
-        :type A: float
+        :param Ixx: Moment of inertia about the strong axis in in^4. Defaults to Ix of ``shape``.
+        :type Ixx: float | None
+        :param Iyy: Moment of inertia about the weak axis in in^4. Defaults to Iy of ``shape``.
+        :type Iyy: float | None
+        :param A: Cross-sectional area in in^2. Defaults to A of ``shape``.
+        :type A: float | None
         :param G: Shear modulus in ksi. Defaults to 12000.0.
         :type G: float
-        :param J: Polar moment of inertia in in^4. Defaults to 0.0704.
-        :type J: float
-        :param mesh: Number of discretizations per member. Defaults to 50.
-        :type mesh: int
+        :param J: Polar moment of inertia in in^4. Defaults to J of ``shape``.
+        :type J: float | None
+        :param mesh: Number of discretizations per member, or 'adaptive' to place
+            mesh nodes only at brace points, ``stations`` and load application
+            points. Defaults to 50.
+        :type mesh: int | str
         :param bracing: Bracing type (e.g., "continuous"). Defaults to "continuous".
         :type bracing: str
-        :param shape: Section shape name (e.g., "W12x14"). Defaults to "W12x14".
+        :param shape: AISC manual label (e.g., "W12x14", case-insensitive). Defaults to "W12x14".
         :type shape: str
+        :param refine: With an adaptive mesh, divide distributed loads so no loaded
+            submember is longer than the member length over ``refine``. Defaults to 1.
+        :type refine: int
+        :param stations: With an adaptive mesh, result stations as percentages of
+            the span (0-100%) that get a mesh node. Defaults to None.
+        :type stations: list[float] | None
         :returns: The created Member instance
         :rtype: Member
+        :raises ValueError: If a property is not given and ``shape`` is not in
+            the shapes table or does not define it, if ``mesh`` is neither a
+            positive integer nor 'adaptive', or if the model is a truss
 
         :Example:
 
             >>> M1 = frame.members.addMember(N1, N2)
-            >>> M2 = frame.members.addMember(N2, N3)
+            >>> M2 = frame.members.addMember(N2, N3, shape="W14x22")
+            >>> M3 = frame.members.addMember(N3, N4, mesh='adaptive', stations=[50])
         """
+        if self.truss:
+            raise ValueError(
+                "A truss model only accepts truss members; use addTruss."
+            )
+        if mesh != 'adaptive' and not (isinstance(mesh, (int, np.integer)) and mesh >= 1):
+            raise ValueError(
+                f"Mesh must be a positive number of submembers or 'adaptive', got {mesh!r}."
+            )
+        Ixx, Iyy, A, J = self.section_properties(shape, Ixx, Iyy, A, J)
+
         self.count += 1
 
+        start = time.perf_counter()
         member = Member(
             self.nodes,
             node_i,
@@ -98,8 +237,71 @@ class Members():
             J,
             mesh,
             bracing,
+            shape,
+            refine,
+            list(stations or [])
+        )
+        self.build_time += time.perf_counter() - start
+        # Splits while meshing are already timed above
+        member.split_time = 0.0
+
+        self.members[self.count] = member
+        return member
+
+    def addTruss(
+        self,
+        node_i: Node,
+        node_j: Node,
+        E: float = 29000.0,
+        A: float | None = None,
+        shape: str = "W12x14",
+    ) -> Truss:
+        """Add an axial-only truss member to the model.
+
+        The member is pinned at both ends and is not meshed. Truss members
+        may also be added to frame models.
+
+        :param node_i: Start node of the member
+        :type node_i: Node
+        :param node_j: End node of the member
+        :type node_j: Node
+        :param E: Young's modulus in ksi. Defaults to 29000.0.
+        :type E: float
+        :param A: Cross-sectional area in in^2. Defaults to A of ``shape``.
+        :type A: float | None
+        :param shape: AISC manual label (e.g., "L4x4x1/2", case-insensitive). Defaults to "W12x14".
+        :type shape: str
+        :returns: The created Truss instance
+        :rtype: Truss
+        :raises ValueError: If ``A`` is not given and ``shape`` is not in the
+            shapes table or does not define it
+
+        :Example:
+
+            >>> T1 = truss.members.addTruss(N1, N2, shape="HSS4x4x1/4")
+        """
+        _, _, A, _ = self.section_properties(shape, 0.0, 0.0, A, 0.0)
+
+        self.count += 1
+
+        start = time.perf_counter()
+        member = Truss(
+            self.nodes,
+            node_i,
+            node_j,
+            True,
+            True,
+            E,
+            0.0,
+            0.0,
+            A,
+            0.0,
+            0.0,
+            1,
+            "continuous",
             shape
         )
+        self.build_time += time.perf_counter() - start
 
         self.members[self.count] = member
         return member
@@ -1,10 +1,22 @@
 from dataclasses import dataclass, field, asdict
 
+import numpy as np
+
+from itertools import product
+from math import floor
+
 from .Coordinates import Coordinate
 from .Node import Node
 
 from typing import Any
 
+# Nodes closer than this in each direction, in feet, are the same node.
+NODE_TOLERANCE: float = 1e-6
+
+# Side in feet of the grid cells find_node hashes nodes into. Larger than
+# NODE_TOLERANCE, so a matching node is always in a neighbouring cell.
+GRID_CELL: float = 1e-3
+
 
 @dataclass(slots=True)
 class Nodes():
@@ -22,6 +34,12 @@ class Nodes():
     :type y: list[float]
     :ivar z: List of z-coordinates
     :type z: list[float]
+    :ivar grid: IDs of the nodes in each cell of side :data:`GRID_CELL`,
+        used by :meth:`find_node`
+    :type grid: dict[tuple[int, int, int], list[int]]
+    :ivar indexed: Number of nodes entered in ``grid``; nodes added since
+        are entered by the next :meth:`find_node`
+    :type indexed: int
     """
     plane: str | None = None
     count: int = 0
@@ -29,6 +47,9 @@ class Nodes():
     x: list[float] = field(default_factory=list[float])
     y: list[float] = field(default_factory=list[float])
     z: list[float] = field(default_factory=list[float])
+    grid: dict[tuple[int, int, int], list[int]] = field(
+        default_factory=dict[tuple[int, int, int], list[int]])
+    indexed: int = 0
 
     def properties(self) -> dict[str, Any]:
         """Return the dataclass properties as a dictionary.
@@ -38,6 +59,15 @@ class Nodes():
         """
         return asdict(self)
 
+    def coordinate_array(self) -> np.ndarray:
+        """Return the nodal coordinates as an (n, 3) array ordered by node ID.
+
+        :returns: Array of [x, y, z] coordinates in feet, row ``node_ID - 1``
+            holding the coordinates of node ``node_ID``
+        :rtype: numpy.ndarray
+        """
+        return np.column_stack((self.x, self.y, self.z)).astype(float).reshape(-1, 3)
+
     def add_node(self, x: float, y: float, z: float, mesh_node: bool = False) -> Node:
         """Add a node to the model at the specified coordinates.
 
@@ -87,18 +117,25 @@ class Nodes():
         :returns: The matching node object if found, None otherwise
         :rtype: Node | None
         """
-        # Define a floating point error tolerance.
-        pointError: float = 1*10**-6
-
-        # Iterate through the model nodes.
-        for node in self.nodes.values():
-            x_e: float = node.coordinates.x
-            y_e: float = node.coordinates.y
-            z_e: float = node.coordinates.z
-            if ((x_e - pointError) < x < (x_e + pointError) and (
-                y_e - pointError) < y < (y_e + pointError) and (
-                    z_e - pointError) < z < (z_e + pointError)):
-                return node
-            else:
-                continue
-        return None
+        # Enter the nodes added since the last search in the grid.
+        for node_ID in range(self.indexed+1, self.count+1):
+            x_e, y_e, z_e = self.nodes[node_ID].coordinates.coordinates
+            self.grid.setdefault(
+                (floor(x_e/GRID_CELL), floor(y_e/GRID_CELL), floor(z_e/GRID_CELL)), []
+            ).append(node_ID)
+        self.indexed = self.count
+
+        # Search the cell of the point and its neighbours, returning the
+        # first node added at the point.
+        i, j, k = floor(x/GRID_CELL), floor(y/GRID_CELL), floor(z/GRID_CELL)
+        found: int | None = None
+        for cell in product((i-1, i, i+1), (j-1, j, j+1), (k-1, k, k+1)):
+            for node_ID in self.grid.get(cell, ()):
+                x_e, y_e, z_e = self.nodes[node_ID].coordinates.coordinates
+                if ((x_e - NODE_TOLERANCE) < x < (x_e + NODE_TOLERANCE) and (
+                    y_e - NODE_TOLERANCE) < y < (y_e + NODE_TOLERANCE) and (
+                        z_e - NODE_TOLERANCE) < z < (z_e + NODE_TOLERANCE)):
+                    if found is None or node_ID < found:
+                        found = node_ID
+                    break
+        return None if found is None else self.nodes[found]
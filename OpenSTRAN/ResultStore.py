@@ -0,0 +1,242 @@
+from .Nodes import Nodes
+from .Members import Members
+from .Solver import Solver
+from .Submember import FORCE_KEYS
+
+import numpy as np
+
+import json
+import os
+from os import PathLike
+from typing import Self
+
+# Version of the on-disk layout written by ResultStore.create.
+FORMAT_VERSION: int = 1
+
+# Arrays making up a store, each saved as '<name>.npy' in the store directory.
+ARRAYS: tuple[str, ...] = (
+    'member_offsets',
+    'submember_nodes',
+    'submember_stations',
+    'submember_forces',
+    'node_displacements',
+    'node_reactions'
+)
+
+
+class ResultStore():
+    """Memory-mapped on-disk store of analysis results.
+
+    Submember end forces and nodal displacements and reactions are held in
+    ``.npy`` files inside a directory and opened with :func:`numpy.load` in
+    memory-mapped mode, so a query only reads the pages it touches. The
+    submembers of a member are stored contiguously, which makes a query for
+    one member a single slice. A store can be reopened in a later process
+    without solving again.
+
+    :ivar path: Store directory
+    :type path: str
+    :ivar member_offsets: (M+1,) array; the submembers of member ``k`` are
+        rows ``member_offsets[k-1]:member_offsets[k]``
+    :type member_offsets: numpy.ndarray
+    :ivar submember_nodes: (S, 2) memory-mapped array of i and j node IDs
+    :type submember_nodes: numpy.ndarray
+    :ivar submember_stations: (S, 2) memory-mapped array of the i and j end
+        distances from the member's i node in feet
+    :type submember_stations: numpy.ndarray
+    :ivar submember_forces: (S, 6, 2) memory-mapped array of end forces in
+        the order of :data:`FORCE_KEYS`
+    :type submember_forces: numpy.ndarray
+    :ivar node_displacements: (N, 6) memory-mapped array of
+        [Ux, Uy, Uz, φx, φy, φz] ordered by node ID
+    :type node_displacements: numpy.ndarray
+    :ivar node_reactions: (N, 6) memory-mapped array of
+        [Rx, Ry, Rz, Rmx, Rmy, Rmz] ordered by node ID
+    :type node_reactions: numpy.ndarray
+
+    :Example:
+
+        >>> store = ResultStore.create('frame.results', frame.nodes, frame.members, frame.solver)
+        >>> store = ResultStore.open('frame.results')
+        >>> store.member_forces(712, 'major axis moments')
+    """
+
+    def __init__(self, path: str | PathLike, mode: str = 'r') -> None:
+        """Open an existing store. Use :meth:`open` or :meth:`create` instead.
+
+        :param path: Store directory
+        :type path: str | PathLike
+        :param mode: Memory map mode, 'r' (read-only) or 'r+' (read/write)
+        :type mode: str
+        :raises ValueError: If the store was written by a newer version
+        """
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, 'meta.json'), encoding='utf-8') as stream:
+            meta = json.load(stream)
+        if meta['version'] > FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported result store version {meta['version']}."
+            )
+        for name in ARRAYS:
+            setattr(self, name, np.load(
+                os.path.join(self.path, name + '.npy'), mmap_mode=mode))
+        # Offsets are small and used by every query, so hold them in memory.
+        self.member_offsets = np.array(self.member_offsets)
+
+    @classmethod
+    def open(cls, path: str | PathLike) -> Self:
+        """Open a store written by :meth:`create` read-only.
+
+        :param path: Store directory
+        :type path: str | PathLike
+        :returns: The opened store
+        :rtype: Self
+        """
+        return cls(path)
+
+    @classmethod
+    def create(cls, path: str | PathLike, nodes: Nodes, members: Members, solver: Solver) -> Self:
+        """Write the results of a solved model to a new store.
+
+        Arrays are written member by member into memory-mapped files so no
+        second full copy of the results is built in memory.
+
+        :param path: Store directory, created if it does not exist
+        :type path: str | PathLike
+        :param nodes: Collection of nodes in the solved model
+        :type nodes: Nodes
+        :param members: Collection of members in the solved model
+        :type members: Members
+        :param solver: Solver holding the global displacement vector
+        :type solver: Solver
+        :returns: The store opened read-only
+        :rtype: Self
+        :raises ValueError: If the model has not been solved
+        """
+        if solver.global_displacement_vector is None:
+            raise ValueError("The model must be solved before storing results.")
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+
+        counts = [len(mbr.submembers) for mbr in members.members.values()]
+        offsets = np.zeros(len(counts)+1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        np.save(os.path.join(path, 'member_offsets.npy'), offsets)
+
+        def open_array(name: str, shape: tuple[int, ...], dtype: type) -> np.ndarray:
+            return np.lib.format.open_memmap(
+                os.path.join(path, name + '.npy'), mode='w+', dtype=dtype, shape=shape)
+
+        S = int(offsets[-1])
+        submember_nodes = open_array('submember_nodes', (S, 2), np.int64)
+        stations = open_array('submember_stations', (S, 2), np.float64)
+        forces = open_array(
+            'submember_forces', (S, len(FORCE_KEYS), 2), np.float64)
+        for k, mbr in enumerate(members.members.values()):
+            submbrs = list(mbr.submembers.values())
+            rows = slice(offsets[k], offsets[k+1])
+            submember_nodes[rows] = [
+                (s.node_i.node_ID, s.node_j.node_ID) for s in submbrs]
+            ends = np.cumsum([s.length for s in submbrs])
+            stations[rows, 0] = ends - [s.length for s in submbrs]
+            stations[rows, 1] = ends
+            forces[rows] = [[s.results[key] for key in FORCE_KEYS]
+                            for s in submbrs]
+        del submember_nodes, stations, forces
+
+        displacements = open_array(
+            'node_displacements', (nodes.count, 6), np.float64)
+        displacements[:] = np.asarray(
+            solver.global_displacement_vector).reshape(-1, 6)
+        reactions = open_array('node_reactions', (nodes.count, 6), np.float64)
+        reactions[:] = [
+            (n.Rx, n.Ry, n.Rz, n.Rmx, n.Rmy, n.Rmz) for n in nodes.nodes.values()]
+        del displacements, reactions
+
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as stream:
+            json.dump({
+                'version': FORMAT_VERSION,
+                'members': len(counts),
+                'submembers': S,
+                'nodes': nodes.count,
+                'force_keys': list(FORCE_KEYS)
+            }, stream)
+        return cls(path)
+
+    def rows(self, member_ID: int) -> slice:
+        """Return the submember rows of a member.
+
+        :param member_ID: Member ID as assigned by :meth:`Members.addMember`
+        :type member_ID: int
+        :returns: Slice into the submember arrays
+        :rtype: slice
+        :raises KeyError: If the member does not exist in the store
+        """
+        if not 1 <= member_ID < len(self.member_offsets):
+            raise KeyError(f"Member {member_ID} is not in the result store.")
+        return slice(int(self.member_offsets[member_ID-1]), int(self.member_offsets[member_ID]))
+
+    def member_forces(self, member_ID: int, force: str | None = None) -> np.ndarray:
+        """Return the end forces of every submember of a member.
+
+        :param member_ID: Member ID
+        :type member_ID: int
+        :param force: One of :data:`FORCE_KEYS`, e.g. 'major axis moments'.
+            Defaults to None for all forces.
+        :type force: str | None
+        :returns: (n, 2) array of i and j end values for ``force``, or an
+            (n, 6, 2) array of all forces
+        :rtype: numpy.ndarray
+        """
+        forces = self.submember_forces[self.rows(member_ID)]
+        if force is None:
+            return np.array(forces)
+        return np.array(forces[:, FORCE_KEYS.index(force)])
+
+    def member_stations(self, member_ID: int) -> np.ndarray:
+        """Return the i and j end stations of every submember of a member.
+
+        :param member_ID: Member ID
+        :type member_ID: int
+        :returns: (n, 2) array of distances from the member i node in feet
+        :rtype: numpy.ndarray
+        """
+        return np.array(self.submember_stations[self.rows(member_ID)])
+
+    def submember_result(self, member_ID: int, submember_ID: int) -> dict[str, list[float]]:
+        """Return the end forces of a single submember.
+
+        :param member_ID: Member ID
+        :type member_ID: int
+        :param submember_ID: Submember ID within the member, starting at 1
+        :type submember_ID: int
+        :returns: Mapping of force name to [i end, j end] as in ``SubMember.results``
+        :rtype: dict[str, list[float]]
+        :raises KeyError: If the submember does not exist in the store
+        """
+        rows = self.rows(member_ID)
+        if not 1 <= submember_ID <= rows.stop - rows.start:
+            raise KeyError(
+                f"Submember {submember_ID} of member {member_ID} is not in the result store.")
+        forces = self.submember_forces[rows.start + submember_ID - 1].tolist()
+        return dict(zip(FORCE_KEYS, forces))
+
+    def displacements(self, node_ID: int) -> np.ndarray:
+        """Return the displacements of a node.
+
+        :param node_ID: Node ID
+        :type node_ID: int
+        :returns: [Ux, Uy, Uz, φx, φy, φz]
+        :rtype: numpy.ndarray
+        """
+        return np.array(self.node_displacements[node_ID-1])
+
+    def reactions(self, node_ID: int) -> np.ndarray:
+        """Return the reactions of a node.
+
+        :param node_ID: Node ID
+        :type node_ID: int
+        :returns: [Rx, Ry, Rz, Rmx, Rmy, Rmz]
+        :rtype: numpy.ndarray
+        """
+        return np.array(self.node_reactions[node_ID-1])
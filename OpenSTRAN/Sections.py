@@ -0,0 +1,193 @@
+from .projectFiles.Database.Queries import QuerySteelDb
+
+import numpy as np
+
+import os
+from os import PathLike
+from typing import Any, Self
+
+# Environment variable naming a .npy snapshot to load instead of the database.
+SNAPSHOT_VARIABLE: str = 'OPENSTRAN_SECTION_TABLE'
+
+# Text columns of the AISC shapes table; every other column is numeric.
+TEXT_COLUMNS: tuple[str, ...] = ('Type', 'EDI_Std_Nomenclature', 'AISC_Manual_Label')
+
+
+class SectionTable():
+    """In-memory AISC shapes table backed by a NumPy structured array.
+
+    The table is read from ``Steel_Sections.db`` once and indexed by
+    ``AISC_Manual_Label`` (case-insensitive) and ``Type`` with dictionaries,
+    so a lookup is a hash probe with no SQL round trip. Missing numeric
+    values are stored as NaN.
+
+    :ivar records: Structured array with one field per database column
+    :type records: numpy.ndarray
+    :ivar label_index: Mapping of upper-case label to row
+    :type label_index: dict[str, int]
+    :ivar type_index: Mapping of shape type (e.g. 'W', 'HSS') to rows
+    :type type_index: dict[str, numpy.ndarray]
+
+    :Example:
+
+        >>> table = section_table()
+        >>> table.properties('W12x14')['Ix']
+        88.6
+    """
+
+    def __init__(self, records: np.ndarray) -> None:
+        """Index a structured array of section records.
+
+        :param records: Structured array with the database columns as fields
+        :type records: numpy.ndarray
+        """
+        self.records = records
+        self.label_index: dict[str, int] = {
+            label.upper(): i for i, label in enumerate(records['AISC_Manual_Label'].tolist())
+        }
+        types = records['Type']
+        self.type_index: dict[str, np.ndarray] = {
+            t: np.flatnonzero(types == t) for t in dict.fromkeys(types.tolist())
+        }
+
+    @classmethod
+    def from_database(cls, path: str | PathLike | None = None) -> Self:
+        """Read the complete shapes table from the SQLite database.
+
+        :param path: Database path. Defaults to the bundled ``Steel_Sections.db``.
+        :type path: str | PathLike | None
+        :returns: The indexed table
+        :rtype: Self
+        """
+        query = QuerySteelDb()
+        if path is not None:
+            query.path = os.fspath(path)
+        query.Connect()
+        query.cursor.execute(
+            """SELECT * FROM {Table}""".format(Table=query.table))
+        rows = query.cursor.fetchall()
+
+        width = max(
+            (len(row[i]) for row in rows for i in range(len(TEXT_COLUMNS)) if row[i]),
+            default=1
+        )
+        dtype = np.dtype([
+            (name, f'U{width}' if name in TEXT_COLUMNS else 'f8')
+            for name in query.headers
+        ])
+        records = np.array(
+            [tuple(np.nan if v is None else v for v in row) for row in rows],
+            dtype=dtype
+        )
+        return cls(records)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> Self:
+        """Load a snapshot written by :meth:`save`.
+
+        The snapshot is memory-mapped, so worker processes share the
+        operating system's page cache instead of each reading the database.
+
+        :param path: Snapshot path ending in '.npy'
+        :type path: str | PathLike
+        :returns: The indexed table
+        :rtype: Self
+        """
+        return cls(np.load(path, mmap_mode='r', allow_pickle=False))
+
+    def save(self, path: str | PathLike) -> None:
+        """Write the table to a .npy snapshot for fast loading with :meth:`load`.
+
+        :param path: Snapshot path ending in '.npy'
+        :type path: str | PathLike
+        :returns: None
+        :rtype: None
+        """
+        np.save(path, np.asarray(self.records), allow_pickle=False)
+
+    def __contains__(self, label: str) -> bool:
+        """Return True if ``label`` is in the table (case-insensitive)."""
+        return label.upper() in self.label_index
+
+    def row(self, label: str) -> np.void:
+        """Return the record of a section.
+
+        :param label: AISC manual label, e.g. 'W12X14' (case-insensitive)
+        :type label: str
+        :returns: The structured record
+        :rtype: numpy.void
+        :raises KeyError: If the label is not in the table
+        """
+        try:
+            return self.records[self.label_index[label.upper()]]
+        except KeyError:
+            raise KeyError(
+                f"Shape '{label}' not found in the AISC shapes database."
+            ) from None
+
+    def properties(self, label: str) -> dict[str, Any]:
+        """Return the properties of a section, omitting missing values.
+
+        :param label: AISC manual label (case-insensitive)
+        :type label: str
+        :returns: Mapping of column name to value
+        :rtype: dict[str, Any]
+        :raises KeyError: If the label is not in the table
+        """
+        record = self.row(label)
+        return {
+            name: value for name, value in zip(self.records.dtype.names, record.tolist())
+            if not (isinstance(value, float) and np.isnan(value))
+        }
+
+    def labels(self, shape_type: str) -> list[str]:
+        """Return the labels of every section of a type.
+
+        :param shape_type: Shape type, e.g. 'W', 'HSS' or '2L'
+        :type shape_type: str
+        :returns: Labels in database order
+        :rtype: list[str]
+        """
+        rows = self.type_index.get(shape_type, np.empty(0, dtype=np.intp))
+        return self.records['AISC_Manual_Label'][rows].tolist()
+
+
+_table: SectionTable | None = None
+
+
+def section_table() -> SectionTable:
+    """Return the shared section table, building it on first use.
+
+    If the ``OPENSTRAN_SECTION_TABLE`` environment variable names an existing
+    snapshot it is loaded instead of the database, which lets worker
+    processes start without reading and converting the database.
+
+    :returns: The shared table
+    :rtype: SectionTable
+    """
+    global _table
+    if _table is None:
+        snapshot = os.environ.get(SNAPSHOT_VARIABLE)
+        if snapshot and os.path.exists(snapshot):
+            _table = SectionTable.load(snapshot)
+        else:
+            _table = SectionTable.from_database()
+    return _table
+
+
+def use_section_table(path: str | PathLike) -> SectionTable:
+    """Make a snapshot the shared section table, writing it first if needed.
+
+    Call this in the parent process before starting workers, and in each
+    worker (or set ``OPENSTRAN_SECTION_TABLE``) to reuse the same snapshot.
+
+    :param path: Snapshot path ending in '.npy'
+    :type path: str | PathLike
+    :returns: The shared table
+    :rtype: SectionTable
+    """
+    global _table
+    if not os.path.exists(path):
+        section_table().save(path)
+    _table = SectionTable.load(path)
+    return _table
@@ -1,8 +1,29 @@
 from .Nodes import Nodes
 from .Members import Members
+from .Stats import SolveStats, sparsity
+from .Sparse import CSRMatrix, ElementOperator, assemble_triplets, reverse_cuthill_mckee
+from .Backends import BandedCholesky, DenseCholesky, PIVOT_TOLERANCE, PRECONDITIONERS, condition_estimate, conjugate_gradient, refine, sparse_direct
+from .Estimate import Estimate, estimate
+from .Substructure import SUBSTRUCTURES, partition, solve_substructures
+from .Elements import AXIS_TOLERANCE, active_dofs, node_dofs
+from .Analysis import AnalysisResult, recover_results
+from .Stability import DOF_NAMES, SingularStiffnessError, StabilityReport, UnstableModelError, check_stability
 
 import numpy as np
 
+from typing import Iterator
+
+# Phases of a solve, in the order run; 'stability' only if Solver.check is set.
+SOLVE_PHASES: tuple[str, ...] = (
+    'estimate', 'constraints', 'stability', 'assembly', 'reduction', 'solution', 'recovery'
+)
+
+# Solver attributes that configure a solve, copied by Solver.analyze.
+SOLVER_SETTINGS: tuple[str, ...] = (
+    'tol', 'maxiter', 'preconditioner', 'precision', 'workers', 'substructures',
+    'check', 'pivot_tolerance', 'max_condition'
+)
+
 
 class Solver():
     """Solver class for structural finite element analysis.
@@ -11,20 +32,100 @@ class Solver():
     the global stiffness matrix, applying boundary conditions, and solving for nodal
     displacements and member forces.
 
-    :ivar nDoF: Total number of degrees of freedom in the structure
+    :ivar nDoF: Total number of numbered degrees of freedom in the structure
     :type nDoF: int
-    :ivar pinDoF: List of pinned (rotational) degrees of freedom indices
-    :type pinDoF: list[int]
+    :ivar dofs: Nodal degrees of freedom that may be numbered: the in-plane
+        ones for planar models, translations only for truss models and all
+        six otherwise
+    :type dofs: tuple[int, ...]
+    :ivar dof_index: Position of each numbered degree of freedom in the
+        six-per-node global vectors. Only the active degrees of freedom of
+        :attr:`dofs` are numbered, see :func:`active_dofs`.
+    :type dof_index: numpy.ndarray | None
+    :ivar dof_number: Numbered degree of freedom of each six-per-node global
+        index, -1 for those that are not numbered
+    :type dof_number: numpy.ndarray | None
     :ivar restrainedDoF: List of restrained degrees of freedom indices
     :type restrainedDoF: list[int]
-    :ivar Kp: Primary stiffness matrix for the structure
-    :type Kp: numpy.ndarray | None
+    :ivar Kp: Primary stiffness matrix for the structure, sparse unless the
+        'dense' backend is used and an unassembled operator for 'matrix_free'
+    :type Kp: numpy.ndarray | CSRMatrix | ElementOperator | None
+    :ivar Ks: Structure stiffness matrix of the free degrees of freedom
+    :type Ks: numpy.ndarray | CSRMatrix | ElementOperator | None
+    :ivar freeDoF: Free degrees of freedom in the order of :attr:`Ks`
+    :type freeDoF: numpy.ndarray | None
     :ivar force_vector: Global force vector with applied loads
     :type force_vector: numpy.ndarray | None
-    :ivar global_displacement_vector: Global displacement vector at all nodes
+    :ivar global_displacement_vector: Global displacement vector at all nodes,
+        six entries per node whatever :attr:`dofs` are numbered
     :type global_displacement_vector: numpy.ndarray | None
-    :ivar global_force_vector: Global reaction force vector
+    :ivar global_force_vector: Global reaction force vector, six entries per node
     :type global_force_vector: numpy.ndarray | None
+    :ivar stats: Timings and sizes collected by the last solve
+    :type stats: SolveStats | None
+    :ivar estimate: Size and cost estimate of the last solve
+    :type estimate: Estimate | None
+    :ivar backend: Linear solver backend used by the last solve
+    :type backend: str
+    :ivar tol: Relative residual tolerance of the iterative backends
+    :type tol: float
+    :ivar maxiter: Iteration limit of the iterative backends, None for ten
+        times the number of free degrees of freedom
+    :type maxiter: int | None
+    :ivar preconditioner: Preconditioner of the 'iterative' backend, one of
+        'jacobi', 'block_jacobi' (a dense block per node) or
+        'incomplete_cholesky'
+    :type preconditioner: str
+    :ivar warm_start: True to start the iterative backends from the
+        displacements of the previous solve, if the model has the same nodes
+    :type warm_start: bool
+    :ivar precision: Factorization precision of the 'dense' and 'banded'
+        backends: 'double', or 'mixed' to factor in single precision and
+        refine the solution in double precision, falling back to a double
+        precision factor if refinement stalls
+    :type precision: str
+    :ivar workers: Threads used to assemble the stiffness matrix, None for a
+        serial assembly. The 'dense' backend assembles through element
+        triplets when set. Also the number of worker processes of the
+        'substructure' backend, and of threads building the element
+        matrices of a model read by :meth:`Model.load`.
+    :type workers: int | None
+    :ivar substructures: Number of substructures of the 'substructure'
+        backend
+    :type substructures: int
+    :ivar node_part: Substructure of each node, -1 for interface nodes, for
+        the 'substructure' backend
+    :type node_part: numpy.ndarray | None
+    :ivar check: True to check the model for disconnected, unsupported and
+        stiffness-free parts before assembling it, see :func:`check_stability`
+    :type check: bool
+    :ivar stability: Result of the check of the last solve
+    :type stability: StabilityReport | None
+    :ivar pivot_tolerance: Pivots of the 'dense' and 'banded' factorizations
+        below this fraction of their diagonal entry are reported in
+        :attr:`small_pivots`
+    :type pivot_tolerance: float
+    :ivar max_condition: Largest estimated condition number accepted from
+        the 'dense' and 'banded' factorizations, None to accept any
+    :type max_condition: float | None
+    :ivar small_pivots: Degrees of freedom with small pivots in the last
+        solve, as (node ID, direction, pivot over diagonal entry)
+    :type small_pivots: list[tuple[int, str, float]]
+    :ivar condition: Estimated 1-norm condition number of the structure
+        stiffness matrix of the last 'dense' or 'banded' solve
+    :type condition: float | None
+    :ivar result: Results of the last solve that did not write them into
+        the model, see :meth:`analyze`
+    :type result: AnalysisResult | None
+
+    :Example:
+
+        >>> frame.solver.preconditioner = 'incomplete_cholesky'
+        >>> frame.solver.tol = 1e-8
+        >>> frame.solve(backend='iterative')
+        >>> frame.solver.precision = 'mixed'
+        >>> frame.solve(backend='banded')
+        >>> frame.solver.stats.counters['refinement_steps']
     """
 
     def __init__(self) -> None:
@@ -34,15 +135,44 @@ class Solver():
         degrees of freedom tracking, and solution vectors.
         """
         self.nDoF: int = 0
-        self.pinDoF: list[int] = []
+        self.dofs: tuple[int, ...] = node_dofs()
+        self.dof_index: np.ndarray | None = None
+        self.dof_number: np.ndarray | None = None
         self.restrainedDoF: list[int] = []
-        self.Kp: np.ndarray | None = None
+        self.Kp: np.ndarray | CSRMatrix | ElementOperator | None = None
+        self.Ks: np.ndarray | CSRMatrix | ElementOperator | None = None
+        self.freeDoF: np.ndarray | None = None
+        self.node_rank: np.ndarray | None = None
         # self.restrainedIndex: list[int] = []
         self.force_vector: np.ndarray | None = None
         self.global_displacement_vector: np.ndarray | None = None
         self.global_force_vector: np.ndarray | None = None
-
-    def solve(self, nodes: Nodes, members: Members) -> None:
+        self.stats: SolveStats | None = None
+        self.estimate: Estimate | None = None
+        self.backend: str = 'dense'
+        self.tol: float = 1e-10
+        self.maxiter: int | None = None
+        self.preconditioner: str = 'jacobi'
+        self.warm_start: bool = True
+        self.precision: str = 'double'
+        self.workers: int | None = None
+        self.substructures: int = SUBSTRUCTURES
+        self.node_part: np.ndarray | None = None
+        self.check: bool = True
+        self.stability: StabilityReport | None = None
+        self.pivot_tolerance: float = PIVOT_TOLERANCE
+        self.max_condition: float | None = None
+        self.small_pivots: list[tuple[int, str, float]] = []
+        self.condition: float | None = None
+        self.result: AnalysisResult | None = None
+
+    def solve(
+        self,
+        nodes: Nodes,
+        members: Members,
+        backend: str = 'auto',
+        memory_budget: int | None = None
+    ) -> None:
         """Solve the structural system for displacements and member forces.
 
         This method performs a complete finite element analysis including:
@@ -53,82 +183,273 @@ class Solver():
         - Computation of member forces and reactions
         - Removal of equivalent nodal actions (distributed loads)
 
+        Each step is timed as a phase of :attr:`stats`. The model size is
+        estimated first (see :func:`estimate`) and the linear solver backend
+        chosen from it, so no matrix is allocated that would exceed the
+        memory budget.
+
         :param nodes: Collection of nodes in the structural model
         :type nodes: Nodes
         :param members: Collection of members in the structural model
         :type members: Members
+        :param backend: 'auto' to choose from the estimate, or one of 'dense'
+            (Cholesky factorization of the full matrix), 'banded' (block Cholesky after reverse
+            Cuthill-McKee ordering), 'sparse' (SciPy sparse LU),
+            'substructure' (static condensation of :attr:`substructures` on
+            :attr:`workers` processes, see :func:`solve_substructures`) or
+            'iterative' (preconditioned conjugate gradients, see
+            :attr:`preconditioner`) or 'matrix_free' (Jacobi preconditioned
+            conjugate gradients on an :class:`ElementOperator`, which never
+            assembles a stiffness matrix). Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: Memory budget in bytes. Defaults to
+            :func:`default_memory_budget`.
+        :type memory_budget: int | None
         :returns: None
         :rtype: None
+        :raises MemoryBudgetError: If the backend does not fit in the budget
+        :raises ValueError: If :attr:`preconditioner` or :attr:`precision`
+            is not recognized, or the preconditioner is not 'jacobi' for the
+            'matrix_free' backend
+        :raises UnstableModelError: If :attr:`check` is set and the model is
+            unstable
+        :raises SingularStiffnessError: If the 'dense' or 'banded' backend
+            finds the stiffness matrix singular, or its condition number
+            exceeds :attr:`max_condition`
         """
-        # Re-instantiate empty arrays for second-order analysis.
-        self.restrainedDoF = []
-
-        # Determine the total degrees of freedom for the model.
-        self.nDoF = nodes.count*6
+        for _ in self.steps(nodes, members, backend, memory_budget):
+            pass
 
-        # Determine the rotational restrained degrees of freedom.
-        for mbr in members.members.values():
+    def phases(self) -> tuple[str, ...]:
+        """Return the names of the phases :meth:`steps` runs, in order.
 
-            for submbr in mbr.submembers.values():
-
-                if submbr.i_release == False and submbr.j_release == False:
-                    continue
-
-                elif submbr.i_release == True and submbr.j_release == False:
-                    self.pinDoF.append(submbr.node_i.node_ID*6-1)
-                    self.pinDoF.append(submbr.node_i.node_ID*6)
-
-                elif submbr.i_release == False and submbr.j_release == True:
-                    self.pinDoF.append(submbr.node_j.node_ID*6-1)
-                    self.pinDoF.append(submbr.node_j.node_ID*6)
+        :returns: Phase names, as the keys of :attr:`SolveStats.phases`
+        :rtype: tuple[str, ...]
+        """
+        return tuple(
+            name for name in SOLVE_PHASES if name != 'stability' or self.check)
+
+    def steps(
+        self,
+        nodes: Nodes,
+        members: Members,
+        backend: str = 'auto',
+        memory_budget: int | None = None,
+        loads: np.ndarray | None = None,
+        write: bool = True
+    ) -> Iterator[str]:
+        """Solve the structural system one phase at a time.
+
+        Each ``next`` runs one phase of :meth:`solve`, which takes the same
+        arguments and raises the same errors, and returns its name. Closing
+        the generator between phases abandons the solve, leaving the model
+        partly solved.
 
-                elif submbr.i_release == True and submbr.j_release == True:
-                    self.pinDoF.append(submbr.node_i.node_ID*6-2)
-                    self.pinDoF.append(submbr.node_i.node_ID*6-1)
-                    self.pinDoF.append(submbr.node_i.node_ID*6)
-                    self.pinDoF.append(submbr.node_j.node_ID*6-2)
-                    self.pinDoF.append(submbr.node_j.node_ID*6-1)
-                    self.pinDoF.append(submbr.node_j.node_ID*6)
-
-        # Remove duplicates from the rotational restrained degrees of freedom.
-        # Duplicates may exist because a user could potentially define
-        # an i and j release on each side of a single node.
-        self.pinDoF = list(dict.fromkeys(self.pinDoF))
-
-        # Instantiate the primary stiffness matrix.
-        self.Kp = np.zeros([self.nDoF, self.nDoF])
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :param backend: See :meth:`solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: See :meth:`solve`. Defaults to None.
+        :type memory_budget: int | None
+        :param loads: (N, 6) nodal loads in global axes to solve for in place
+            of the model's loads, see :meth:`analyze`. Defaults to None.
+        :type loads: numpy.ndarray | None
+        :param write: True to write the results into the nodes and
+            submembers, False to only read the model and keep them in
+            :attr:`result`. Defaults to True.
+        :type write: bool
+        :returns: Generator of the names of :meth:`phases` as each completes
+        :rtype: Iterator[str]
+
+        :Example:
+
+            >>> for phase in frame.solver.steps(frame.nodes, frame.members):
+            ...     print(phase, frame.solver.stats.phases[phase])
+        """
+        if self.preconditioner not in PRECONDITIONERS:
+            raise ValueError(
+                f"Unknown preconditioner '{self.preconditioner}'; expected one "
+                f"of {', '.join(PRECONDITIONERS)}."
+            )
+        if self.precision not in ('double', 'mixed'):
+            raise ValueError(
+                f"Unknown precision '{self.precision}'; expected 'double' or 'mixed'."
+            )
+        self.stats = SolveStats()
 
-        # Instantiate a list of the restrained degrees of freedom.
-        for i, node in enumerate(nodes.nodes.items()):
-            if node[1].restraint == [0, 0, 0, 0, 0, 0]:
-                continue
+        with self.stats.phase('estimate'):
+            self.estimate = estimate(nodes, members, memory_budget, self.substructures)
+            self.backend = self.estimate.select(backend)
+        self.stats.counters['backend'] = self.backend
+        if self.backend == 'matrix_free' and self.preconditioner != 'jacobi':
+            raise ValueError(
+                "The 'matrix_free' backend supports the 'jacobi' preconditioner only."
+            )
+        yield 'estimate'
+
+        with self.stats.phase('constraints'):
+            self.build_constraints(nodes, members)
+        yield 'constraints'
+
+        if self.check:
+            with self.stats.phase('stability'):
+                self.stability = check_stability(
+                    nodes, members, self.dof_index, self.restrainedDoF)
+            if not self.stability.stable:
+                raise UnstableModelError(self.stability)
+            yield 'stability'
+
+        with self.stats.phase('assembly'):
+            self.assemble(nodes, members, loads)
+        yield 'assembly'
+
+        with self.stats.phase('reduction'):
+            reducedForceVector = self.reduce()
+        yield 'reduction'
+
+        with self.stats.phase('solution'):
+            self.solve_displacements(reducedForceVector)
+        yield 'solution'
+
+        with self.stats.phase('recovery'):
+            if write:
+                self.recover_forces(nodes, members)
             else:
-                for n, DoF in enumerate(node[1].restraint):
-                    if DoF == 1:
-                        self.restrainedDoF.append(i*6 + n)
+                self.reactions()
+                assert self.global_force_vector is not None
+                self.result = recover_results(
+                    nodes, members, self.global_displacement_vector,
+                    self.global_force_vector, loads is None, self.stats)
 
-        # Check pins to see if attached members contribute to stiffness.
-        for DoF in [x-1 for x in self.pinDoF]:
-            if (np.sum(self.Kp[DoF, :]) < 1*10**-6):
-                self.restrainedDoF.append(DoF)
+        self.record_stats(members)
+        yield 'recovery'
 
-        # Remove duplicates from restrained degrees of freedom.
-        self.restrainedDoF = list(dict.fromkeys(self.restrainedDoF))
+    def build_constraints(self, nodes: Nodes, members: Members) -> None:
+        """Number the degrees of freedom and collect the restrained ones.
 
-        # Sort the restrained degrees of freedom in ascending order.
-        self.restrainedDoF.sort()
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :returns: None
+        :rtype: None
+        """
+        self.number_dofs(nodes, members)
+
+        # Collect the numbered degrees of freedom restrained by supports, in
+        # ascending order. Rotations released at every member end are not
+        # numbered, so they need no restraint.
+        assert self.dof_index is not None
+        restraint = np.array([node.restraint for node in nodes.nodes.values()],
+                             dtype=bool).reshape(-1)
+        self.restrainedDoF = np.flatnonzero(restraint[self.dof_index]).tolist()
+
+    def number_dofs(self, nodes: Nodes, members: Members) -> None:
+        """Number the active degrees of freedom of a model.
+
+        Planar models number the in-plane and truss models the translational
+        degrees of freedom only (see :func:`node_dofs`). Of these, the ones
+        no element is stiff in, such as the rotations of a node where every
+        member end is released, are left out (see :func:`active_dofs`), so
+        they never enter the stiffness matrix. Numbering follows the nodes
+        and then the six nodal degrees of freedom.
+
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :returns: None
+        :rtype: None
+        """
+        self.dofs = node_dofs(members.truss, nodes.plane)
+        active = active_dofs(
+            members.connectivity(), members.releases(), nodes.count, self.dofs,
+            members.axis_cosines())
+        self.dof_index = np.flatnonzero(active)
+        self.nDoF = len(self.dof_index)
+        self.dof_number = np.full(6*nodes.count, -1, dtype=np.int64)
+        self.dof_number[self.dof_index] = np.arange(self.nDoF)
+
+    def assemble(self, nodes: Nodes, members: Members, loads: np.ndarray | None = None) -> None:
+        """Assemble the global force vector and primary stiffness matrix.
 
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :param loads: (N, 6) nodal loads in global axes, None for the loads
+            of the nodes. Defaults to None.
+        :type loads: numpy.ndarray | None
+        :returns: None
+        :rtype: None
+        :raises ValueError: If ``loads`` does not have six entries per node
+        """
         # Instantiate the force vector.
-        self.force_vector = np.zeros((self.nDoF, 1))
-        for i, node in enumerate(nodes.nodes.items()):
-            self.force_vector[i*6][0] = node[1].Fx
-            self.force_vector[i*6 + 1][0] = node[1].Fy
-            self.force_vector[i*6 + 2][0] = node[1].Fz
-            self.force_vector[i*6 + 3][0] = node[1].Mx
-            self.force_vector[i*6 + 4][0] = node[1].My
-            self.force_vector[i*6 + 5][0] = node[1].Mz
+        self.force_vector = np.zeros((nodes.count*6, 1))
+        if loads is not None:
+            if np.size(loads) != nodes.count*6:
+                raise ValueError(
+                    f"Expected six loads for each of {nodes.count} nodes, "
+                    f"got {np.size(loads)} values."
+                )
+            self.force_vector[:, 0] = np.ravel(loads)
+        else:
+            for i, node in enumerate(nodes.nodes.items()):
+                self.force_vector[i*6][0] = node[1].Fx
+                self.force_vector[i*6 + 1][0] = node[1].Fy
+                self.force_vector[i*6 + 2][0] = node[1].Fz
+                self.force_vector[i*6 + 3][0] = node[1].Mx
+                self.force_vector[i*6 + 4][0] = node[1].My
+                self.force_vector[i*6 + 5][0] = node[1].Mz
+        # Only some nodal degrees of freedom are numbered.
+        assert self.dof_number is not None
+        partial = self.nDoF < len(self.dof_number)
+        if partial:
+            self.force_vector = self.force_vector[self.dof_index]
+
+        # The matrix-free backend keeps the element matrices only.
+        if self.backend == 'matrix_free':
+            self.Kp = ElementOperator(members, self.numbering(), self.nDoF)
+            self.node_rank = None
+            return
+
+        # Sparse backends, and every backend when only some nodal degrees of
+        # freedom are numbered or the assembly is parallel, sum element
+        # triplets into a CSR matrix.
+        parallel = self.workers is not None and self.workers > 1
+        if self.backend != 'dense' or partial or parallel:
+            rows, cols, data = assemble_triplets(members, self.dofs, self.workers)
+            assert self.stats is not None
+            self.stats.counters['workers'] = self.workers or 1
+            if partial:
+                # Released ends not along global X leave zero entries on the
+                # global x rotation, which is then not numbered.
+                numbering = self.numbering()
+                numbered = (numbering[rows] >= 0) & (numbering[cols] >= 0)
+                stiff = np.abs(data) > AXIS_TOLERANCE*np.max(np.abs(data), initial=0.0)
+                self.number(np.r_[rows[stiff & ~numbered], cols[stiff & ~numbered]])
+                rows, cols, data = rows[numbered], cols[numbered], data[numbered]
+                rows, cols = self.number(rows), self.number(cols)
+            self.Kp = CSRMatrix.from_triplets(
+                rows, cols, data, (self.nDoF, self.nDoF))
+            self.node_rank = None
+            self.node_part = None
+            if self.backend in ('banded', 'substructure'):
+                connectivity = members.connectivity()
+                order = reverse_cuthill_mckee(connectivity, nodes.count)
+                self.node_rank = np.empty(nodes.count, dtype=np.int64)
+                self.node_rank[order] = np.arange(nodes.count)
+                if self.backend == 'substructure':
+                    self.node_part = partition(
+                        connectivity, nodes.count, self.substructures, order)
+            elif self.backend == 'dense':
+                self.Kp = self.Kp.to_dense()
+            return
 
         # Construct the primary stiffness matrix for the structure.
+        self.Kp = np.zeros([self.nDoF, self.nDoF])
         for mbr in members.members.values():
             for submbr in mbr.submembers.values():
                 node_ID_i = submbr.node_i.node_ID
@@ -139,6 +460,53 @@ class Solver():
                 self.AddMemberToKp(node_ID_i, node_ID_j,
                                    i_release, j_release, KG)
 
+    def numbering(self) -> np.ndarray:
+        """Return the numbered degree of freedom of each six-per-node global index.
+
+        :returns: Index into :attr:`Kp` and :attr:`force_vector`, -1 for
+            degrees of freedom that are not numbered
+        :rtype: numpy.ndarray
+        """
+        assert self.dof_number is not None
+        return self.dof_number
+
+    def number(self, index: np.ndarray) -> np.ndarray:
+        """Map six-per-node global indices to the numbered degrees of freedom.
+
+        :param index: Indices into the six-per-node global vectors
+        :type index: numpy.ndarray
+        :returns: Indices into :attr:`Kp` and :attr:`force_vector`
+        :rtype: numpy.ndarray
+        :raises ValueError: If an index is not a numbered degree of freedom
+        """
+        numbered = self.numbering()[index]
+        if np.any(numbered < 0):
+            raise ValueError(
+                "A member has stiffness in a degree of freedom that is not "
+                "numbered in this model."
+            )
+        return numbered
+
+    def reduce(self) -> np.ndarray:
+        """Remove the restrained degrees of freedom from the stiffness matrix and force vector.
+
+        :returns: Force vector of the unrestrained degrees of freedom
+        :rtype: numpy.ndarray
+        """
+        assert self.force_vector is not None
+        self.freeDoF = np.setdiff1d(
+            np.arange(self.nDoF), np.array(self.restrainedDoF, dtype=np.int64))
+
+        if isinstance(self.Kp, (CSRMatrix, ElementOperator)):
+            # Number the free degrees of freedom node by node in reverse
+            # Cuthill-McKee order to narrow the band.
+            if self.node_rank is not None:
+                assert self.dof_index is not None
+                self.freeDoF = self.freeDoF[np.argsort(
+                    self.node_rank[self.dof_index[self.freeDoF]//6], kind='stable')]
+            self.Ks = self.Kp.submatrix(self.freeDoF)
+            return self.force_vector[self.freeDoF]
+
         # Impose the influence of supports to produce the structure stiffness matrix.
         self.Ks = np.delete(self.Kp, self.restrainedDoF, 0)
         self.Ks = np.delete(self.Ks, self.restrainedDoF, 1)
@@ -148,21 +516,222 @@ class Solver():
         reducedForceVector = np.delete(
             self.force_vector, self.restrainedDoF, 0)
 
-        U = np.linalg.solve(self.Ks, reducedForceVector)
-        self.global_displacement_vector = np.zeros([self.nDoF, 1])
-        assert self.global_displacement_vector is not None
-        index = 0
-        for i in range(self.nDoF):
-            if i in self.restrainedDoF:
-                continue
+        return reducedForceVector
+
+    def solve_displacements(self, reducedForceVector: np.ndarray) -> None:
+        """Solve the reduced system and expand it to the global displacement vector.
+
+        :param reducedForceVector: Force vector returned by :meth:`reduce`
+        :type reducedForceVector: numpy.ndarray
+        :returns: None
+        :rtype: None
+        """
+        assert self.stats is not None
+        self.small_pivots = []
+        self.condition = None
+        # Solve for unknown displacements.
+        if self.precision == 'mixed' and self.backend in ('dense', 'banded'):
+            U = self.refine(reducedForceVector)
+        elif self.backend in ('dense', 'banded'):
+            factor = self.factorize(np.float64)
+            self.stats.allocate('factor', factor)
+            U = factor.solve(reducedForceVector)
+            self.monitor(factor)
+        elif self.backend == 'sparse':
+            U = sparse_direct(self.Ks, reducedForceVector)
+        elif self.backend == 'substructure':
+            assert self.node_part is not None and self.freeDoF is not None
+            assert self.dof_index is not None
+            U, info = solve_substructures(
+                self.Ks, reducedForceVector,
+                self.node_part[self.dof_index[self.freeDoF]//6], self.workers)
+            self.stats.counters.update(info)
+        else:
+            U = self.iterate(reducedForceVector)
+
+        # Scatter the solution to the free degrees of freedom.
+        assert self.dof_index is not None and self.dof_number is not None
+        assert self.freeDoF is not None
+        self.global_displacement_vector = np.zeros([len(self.dof_number), 1])
+        self.global_displacement_vector[self.dof_index[self.freeDoF]] = \
+            np.asarray(U).reshape(-1, 1)
+
+    def refine(self, reducedForceVector: np.ndarray) -> np.ndarray:
+        """Solve the reduced system with a single precision factor.
+
+        The factor is refined to double precision accuracy with
+        :func:`refine`. If the factorization fails or refinement stalls, as
+        for an ill-conditioned model, the system is factored again in double
+        precision.
+
+        :param reducedForceVector: Force vector returned by :meth:`reduce`
+        :type reducedForceVector: numpy.ndarray
+        :returns: Displacements of the free degrees of freedom
+        :rtype: numpy.ndarray
+        """
+        assert self.stats is not None
+        K = self.Ks if self.backend == 'banded' else np.asarray(self.Ks)
+        U, history, converged = None, [], False
+        try:
+            factor = self.factorize(np.float32)
+        except np.linalg.LinAlgError:
+            pass
+        else:
+            self.stats.allocate('factor', factor)
+            U, history, converged = refine(K, reducedForceVector, factor)
+        self.stats.counters['refinement_steps'] = max(len(history) - 1, 0)
+        self.stats.counters['precision'] = 'mixed' if converged else 'double'
+        self.stats.residuals = history
+        if not converged:
+            factor = self.factorize(np.float64)
+            self.stats.allocate('factor', factor)
+            U = factor.solve(reducedForceVector)
+        self.monitor(factor)
+        return U
+
+    def factorize(self, dtype: type) -> BandedCholesky | DenseCholesky:
+        """Factor the structure stiffness matrix of the 'dense' or 'banded' backend.
+
+        If a double precision factorization fails, the matrix scaled to a
+        unit diagonal is factored again with its diagonal stiffened just
+        above rounding error, so the degrees of freedom without stiffness
+        show up as small pivots in the error.
+
+        :param dtype: Floating point type of the factor
+        :type dtype: type
+        :returns: The factor
+        :rtype: BandedCholesky | DenseCholesky
+        :raises SingularStiffnessError: If the matrix is not positive
+            definite in double precision
+        :raises numpy.linalg.LinAlgError: If it is not in single precision
+        """
+        Factor = BandedCholesky if self.backend == 'banded' else DenseCholesky
+        K = self.Ks if self.backend == 'banded' else np.asarray(self.Ks)
+        try:
+            return Factor(K, dtype=dtype)
+        except np.linalg.LinAlgError:
+            if dtype != np.float64:
+                raise
+        diagonal = np.ravel(K.diagonal())
+        scale = 1/np.sqrt(np.where(diagonal > 0, diagonal, 1.0))
+        n = np.arange(K.shape[0])
+        self.small_pivots = []
+        # The stiffening grows until the factorization succeeds, staying
+        # well below the pivot tolerance.
+        shift = len(n)*np.finfo(np.float64).eps
+        while shift < 0.01*self.pivot_tolerance:
+            if isinstance(K, CSRMatrix):
+                scaled = CSRMatrix.from_triplets(
+                    np.r_[K.rows, n], np.r_[K.indices, n],
+                    np.r_[K.data*scale[K.rows]*scale[K.indices], np.full(len(n), shift)],
+                    K.shape)
             else:
-                self.global_displacement_vector[i] = U[index]
-                index += 1
+                scaled = K*np.outer(scale, scale) + shift*np.eye(len(n))
+            try:
+                pivots = Factor(scaled, dtype=dtype).pivots
+            except np.linalg.LinAlgError:
+                shift *= 100
+                continue
+            # Pivots of the scaled matrix are relative to the diagonal.
+            self.small_pivots = self.locate_pivots(pivots, np.where(diagonal > 0, 1.0, 0.0))
+            break
+        raise SingularStiffnessError(self.small_pivots, np.inf)
+
+    def locate_pivots(
+        self,
+        pivots: np.ndarray,
+        diagonal: np.ndarray
+    ) -> list[tuple[int, str, float]]:
+        """Map the pivots below :attr:`pivot_tolerance` of their diagonal entry to nodes and directions.
+
+        :param pivots: (f,) pivot of each row of :attr:`Ks`
+        :type pivots: numpy.ndarray
+        :param diagonal: (f,) diagonal of :attr:`Ks`; rows without a positive
+            one have a ratio of zero
+        :type diagonal: numpy.ndarray
+        :returns: (node ID, direction, ratio) of each small pivot, smallest first
+        :rtype: list[tuple[int, str, float]]
+        """
+        assert self.freeDoF is not None and self.dof_index is not None
+        ratio = np.divide(pivots, diagonal, out=np.zeros(len(pivots)), where=diagonal > 0)
+        small = np.flatnonzero(~(ratio >= self.pivot_tolerance))
+        small = small[np.argsort(ratio[small], kind='stable')]
+        DoF = self.dof_index[self.freeDoF[small]]
+        return [
+            (int(g//6) + 1, DOF_NAMES[g % 6], float(r))
+            for g, r in zip(DoF, ratio[small])
+        ]
+
+    def monitor(self, factor: BandedCholesky | DenseCholesky) -> None:
+        """Check the pivots and estimate the condition number of a factorization.
+
+        Sets :attr:`small_pivots` and :attr:`condition`, also recorded as the
+        'small_pivots' and 'condition' counters of :attr:`stats`.
+
+        :param factor: Factor of :attr:`Ks`
+        :type factor: BandedCholesky | DenseCholesky
+        :returns: None
+        :rtype: None
+        :raises SingularStiffnessError: If the estimate exceeds
+            :attr:`max_condition`, or the reciprocal of the machine precision
+            so the displacements would be meaningless
+        """
+        assert self.stats is not None
+        K = self.Ks if self.backend == 'banded' else np.asarray(self.Ks)
+        self.small_pivots = self.locate_pivots(factor.pivots, np.ravel(K.diagonal()))
+        self.condition = condition_estimate(K, factor)
+        self.stats.counters['small_pivots'] = len(self.small_pivots)
+        self.stats.counters['condition'] = self.condition
+        limit = 1/np.finfo(np.float64).eps
+        if self.max_condition is not None:
+            limit = min(limit, self.max_condition)
+        if self.condition > limit:
+            raise SingularStiffnessError(self.small_pivots, self.condition)
+
+    def iterate(self, reducedForceVector: np.ndarray) -> np.ndarray:
+        """Solve the reduced system with preconditioned conjugate gradients.
+
+        The iteration starts from the previous displacements when
+        :attr:`warm_start` is set and the previous solve had the same nodes,
+        so re-analysis after a small change converges in fewer iterations.
+
+        :param reducedForceVector: Force vector returned by :meth:`reduce`
+        :type reducedForceVector: numpy.ndarray
+        :returns: Displacements of the free degrees of freedom
+        :rtype: numpy.ndarray
+        """
+        assert self.stats is not None and self.dof_index is not None
+        assert self.dof_number is not None
+        rows = self.dof_index[self.freeDoF]
+        previous = self.global_displacement_vector
+        x0 = None
+        if self.warm_start and previous is not None and \
+                len(previous) == len(self.dof_number):
+            x0 = np.ravel(previous)[rows]
+        preconditioner = PRECONDITIONERS[self.preconditioner](self.Ks, rows//6)
+        self.stats.allocate('preconditioner', preconditioner)
+        U, history = conjugate_gradient(
+            self.Ks, reducedForceVector, self.tol, self.maxiter, preconditioner, x0)
+        self.stats.counters['preconditioner'] = self.preconditioner
+        self.stats.counters['warm_start'] = x0 is not None
+        self.stats.counters['iterations'] = len(history) - 1
+        self.stats.counters['residual'] = history[-1]
+        self.stats.residuals = history
+        return U
+
+    def recover_forces(self, nodes: Nodes, members: Members) -> None:
+        """Compute reactions and member forces from the global displacements.
 
-        # Back-substitute displacements to calculate reaction forces.
-        self.global_force_vector = np.matmul(
-            self.Kp, self.global_displacement_vector)
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :returns: None
+        :rtype: None
+        """
+        self.reactions()
         assert self.global_force_vector is not None
+        assert self.global_displacement_vector is not None
 
         # Use nodal displacements to determine member forces.
         for mbr in members.members.values():
@@ -228,12 +797,12 @@ class Solver():
                         submbr.Kl, submbr.results['displacements'])
 
                     submbr.results['axial'] = [forces[0], forces[4]]
-                    submbr.results['transverse shear'] = [forces[1], forces[5]]
-                    submbr.results['shear'] = [forces[2], forces[6]]
+                    submbr.results['shear'] = [forces[1], forces[5]]
+                    submbr.results['transverse shear'] = [forces[2], forces[6]]
                     submbr.results['torsional moments'] = [
                         forces[3], forces[7]]
-                    submbr.results['major axis moments'] = [0, forces[8]]
-                    submbr.results['minor axis moments'] = [0, forces[9]]
+                    submbr.results['minor axis moments'] = [0, forces[8]]
+                    submbr.results['major axis moments'] = [0, forces[9]]
 
                 elif submbr.i_release == False and submbr.j_release == True:
                     ia = submbr.node_i.node_ID*6-6
@@ -260,18 +829,18 @@ class Solver():
                         submbr.Kl, submbr.results['displacements'])
 
                     submbr.results['axial'] = [forces[0], forces[6]]
-                    submbr.results['transverse shear'] = [forces[1], forces[7]]
-                    submbr.results['shear'] = [forces[2], forces[8]]
+                    submbr.results['shear'] = [forces[1], forces[7]]
+                    submbr.results['transverse shear'] = [forces[2], forces[8]]
                     submbr.results['torsional moments'] = [
                         forces[3], forces[9]]
-                    submbr.results['major axis moments'] = [forces[4], 0]
-                    submbr.results['minor axis moments'] = [forces[5], 0]
+                    submbr.results['minor axis moments'] = [forces[4], 0]
+                    submbr.results['major axis moments'] = [forces[5], 0]
 
                 elif submbr.i_release == True and submbr.j_release == True:
                     ia = submbr.node_i.node_ID*6-6
-                    ib = submbr.node_i.node_ID*6-3
+                    ib = submbr.node_i.node_ID*6-4
                     ja = submbr.node_j.node_ID*6-6
-                    jb = submbr.node_j.node_ID*6-3
+                    jb = submbr.node_j.node_ID*6-4
 
                     mbrDisplacements = np.array([
                         self.global_displacement_vector[ia, 0],
@@ -288,13 +857,19 @@ class Solver():
                         submbr.Kl, submbr.results['displacements'])
 
                     submbr.results['axial'] = [forces[0], forces[3]]
-                    submbr.results['transverse shear'] = [forces[1], forces[4]]
-                    submbr.results['shear'] = [forces[2], forces[5]]
+                    submbr.results['shear'] = [forces[1], forces[4]]
+                    submbr.results['transverse shear'] = [forces[2], forces[5]]
                     submbr.results['torsional moments'] = [0, 0]
                     submbr.results['major axis moments'] = [0, 0]
                     submbr.results['minor axis moments'] = [0, 0]
 
-        # Remove the influence of equivalent nodal actions.
+        # Remove the influence of equivalent nodal actions from the global
+        # force vector, once per node.
+        for node in nodes.nodes.values():
+            ia = node.node_ID*6-6
+            self.global_force_vector[ia:ia+6, 0] -= [
+                node.eFx, node.eFy, node.eFz, node.eMx, node.eMy, node.eMz]
+
         for mbr in members.members.values():
             for n, submbr in mbr.submembers.items():
 
@@ -304,34 +879,6 @@ class Solver():
                 ja = submbr.node_j.node_ID*6-6
                 jb = submbr.node_j.node_ID*6-1
 
-                # Remove influence of equivalent nodal actions from the global force vector.
-
-                self.global_force_vector[ia] = self.global_force_vector[ia] - \
-                    submbr.node_i.eFx
-                self.global_force_vector[ia +
-                                         1] = self.global_force_vector[ia+1] - submbr.node_i.eFy
-                self.global_force_vector[ia +
-                                         2] = self.global_force_vector[ia+2] - submbr.node_i.eFz
-                self.global_force_vector[ia +
-                                         3] = self.global_force_vector[ia+3] - submbr.node_i.eMx
-                self.global_force_vector[ia +
-                                         4] = self.global_force_vector[ia+4] - submbr.node_i.eMy
-                self.global_force_vector[ib] = self.global_force_vector[ib] - \
-                    submbr.node_i.eMz
-
-                self.global_force_vector[ja] = self.global_force_vector[ja] - \
-                    submbr.node_j.eFx
-                self.global_force_vector[ja +
-                                         1] = self.global_force_vector[ja+1] - submbr.node_j.eFy
-                self.global_force_vector[ja +
-                                         2] = self.global_force_vector[ja+2] - submbr.node_j.eFz
-                self.global_force_vector[ja +
-                                         3] = self.global_force_vector[ja+3] - submbr.node_j.eMx
-                self.global_force_vector[ja +
-                                         4] = self.global_force_vector[ja+4] - submbr.node_j.eMy
-                self.global_force_vector[jb] = self.global_force_vector[jb] - \
-                    submbr.node_j.eMz
-
                 # Remove influence of equivalent nodal actions from member forces.
 
                 submbr.results['axial'][0] = submbr.results['axial'][0] - \
@@ -372,7 +919,7 @@ class Solver():
                     submbr.node_i.Rmx = self.global_force_vector[ia+3][0]
                     submbr.node_i.Rmy = self.global_force_vector[ia+4][0]
                     submbr.node_i.Rmz = self.global_force_vector[ib][0]
-                elif submbr.node_j.mesh_node != True:
+                if submbr.node_j.mesh_node != True:
                     submbr.node_j.Rx = self.global_force_vector[ja][0]
                     submbr.node_j.Ry = self.global_force_vector[ja+1][0]
                     submbr.node_j.Rz = self.global_force_vector[ja+2][0]
@@ -380,6 +927,90 @@ class Solver():
                     submbr.node_j.Rmy = self.global_force_vector[ja+4][0]
                     submbr.node_j.Rmz = self.global_force_vector[jb][0]
 
+            # Internal force diagrams are gathered again from the new results.
+            mbr.diagram_cache.clear()
+
+    def reactions(self) -> None:
+        """Back-substitute the displacements into the global force vector.
+
+        :returns: None
+        :rtype: None
+        """
+        assert self.Kp is not None and self.global_displacement_vector is not None
+        assert self.dof_number is not None
+        if self.nDoF < len(self.dof_number):
+            self.global_force_vector = np.zeros_like(self.global_displacement_vector)
+            self.global_force_vector[self.dof_index] = \
+                self.Kp @ self.global_displacement_vector[self.dof_index]
+        else:
+            self.global_force_vector = self.Kp @ self.global_displacement_vector
+
+    def analyze(
+        self,
+        nodes: Nodes,
+        members: Members,
+        loads: np.ndarray | None = None,
+        backend: str = 'auto',
+        memory_budget: int | None = None
+    ) -> AnalysisResult:
+        """Solve a model without changing it or this solver.
+
+        The solve runs on a new :class:`Solver` with the settings of this
+        one (:data:`SOLVER_SETTINGS`) and only reads the nodes and members,
+        so it is re-entrant: several threads may analyze one model at once,
+        e.g. one per load case.
+
+        :param nodes: Collection of nodes in the structural model
+        :type nodes: Nodes
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :param loads: (N, 6) nodal loads in global axes ordered by node ID,
+            solved for in place of all the loads applied to the model. The
+            point and distributed loads on members are left out too, so the
+            results are those of ``loads`` alone. Defaults to None for the
+            model's loads.
+        :type loads: numpy.ndarray | None
+        :param backend: See :meth:`solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: See :meth:`solve`. Defaults to None.
+        :type memory_budget: int | None
+        :returns: Displacements, reactions and submember end forces
+        :rtype: AnalysisResult
+        :raises ValueError: If ``loads`` does not have six entries per node,
+            or as :meth:`solve`
+        """
+        solver = Solver()
+        for name in SOLVER_SETTINGS:
+            setattr(solver, name, getattr(self, name))
+        for _ in solver.steps(nodes, members, backend, memory_budget, loads, write=False):
+            pass
+        assert solver.result is not None
+        return solver.result
+
+    def record_stats(self, members: Members) -> None:
+        """Record problem sizes and array memory in :attr:`stats`.
+
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :returns: None
+        :rtype: None
+        """
+        assert self.stats is not None
+        connectivity = members.connectivity()
+        self.stats.nDoF = self.nDoF
+        self.stats.free_DoF = self.nDoF - len(self.restrainedDoF)
+        self.stats.elements = len(connectivity)
+        self.stats.nnz, self.stats.bandwidth = sparsity(
+            connectivity, len(self.dofs))
+        self.stats.allocate('Kp', self.Kp)
+        if isinstance(self.Kp, ElementOperator):
+            self.stats.counters['element_matrices'] = self.Kp.unique
+        self.stats.allocate('Ks', self.Ks)
+        self.stats.allocate('force_vector', self.force_vector)
+        self.stats.allocate(
+            'global_displacement_vector', self.global_displacement_vector)
+        self.stats.allocate('global_force_vector', self.global_force_vector)
+
     def AddMemberToKp(self, node_ID_i: int, node_ID_j: int, i_release: bool, j_release: bool, KG: np.ndarray) -> None:
         """Add member stiffness contributions to the global stiffness matrix.
 
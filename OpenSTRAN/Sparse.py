@@ -0,0 +1,419 @@
+from .Members import Members
+from .Elements import (
+    ELEMENT_DOF,
+    FRAME_DOFS,
+    element_dof_indices,
+    element_dof_positions,
+    element_rotation_matrices
+)
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from typing import Any, Iterator, Self
+
+
+@dataclass(slots=True)
+class CSRMatrix():
+    """Compressed sparse row matrix built from NumPy arrays only.
+
+    Row indices are kept alongside the CSR arrays so products can be formed
+    with :func:`numpy.bincount` without a Python loop.
+
+    :ivar indptr: (n+1,) row pointers into ``indices`` and ``data``
+    :type indptr: numpy.ndarray
+    :ivar indices: (nnz,) column index of each entry
+    :type indices: numpy.ndarray
+    :ivar data: (nnz,) value of each entry
+    :type data: numpy.ndarray
+    :ivar rows: (nnz,) row index of each entry
+    :type rows: numpy.ndarray
+    :ivar shape: Number of rows and columns
+    :type shape: tuple[int, int]
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    rows: np.ndarray
+    shape: tuple[int, int]
+
+    @classmethod
+    def from_triplets(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        data: np.ndarray,
+        shape: tuple[int, int]
+    ) -> Self:
+        """Build a matrix from (row, column, value) triplets, summing duplicates.
+
+        :param rows: Row index of each triplet
+        :type rows: numpy.ndarray
+        :param cols: Column index of each triplet
+        :type cols: numpy.ndarray
+        :param data: Value of each triplet
+        :type data: numpy.ndarray
+        :param shape: Number of rows and columns
+        :type shape: tuple[int, int]
+        :returns: The assembled matrix
+        :rtype: Self
+        """
+        key = np.asarray(rows, dtype=np.int64)*shape[1] + \
+            np.asarray(cols, dtype=np.int64)
+        order = np.argsort(key, kind='stable')
+        key = key[order]
+        first = np.flatnonzero(np.r_[len(key) > 0, key[1:] != key[:-1]])
+        values = np.add.reduceat(np.asarray(data, dtype=float)[order], first) \
+            if len(first) else np.zeros(0)
+        key = key[first]
+        rows, indices = np.divmod(key, shape[1])
+        indptr = np.zeros(shape[0]+1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, indices, values, rows, shape)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored entries."""
+        return len(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the index and value arrays."""
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes + self.rows.nbytes
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        """Return the product with a vector or a matrix of column vectors."""
+        x = np.asarray(x)
+        products = self.data.reshape((-1,) + (1,)*(x.ndim-1))*x[self.indices]
+        if x.ndim == 1:
+            return np.bincount(self.rows, weights=products, minlength=self.shape[0])
+        columns = products.reshape(len(products), -1)
+        return np.column_stack([
+            np.bincount(self.rows, weights=columns[:, k], minlength=self.shape[0])
+            for k in range(columns.shape[1])
+        ]).reshape((self.shape[0],) + x.shape[1:])
+
+    def diagonal(self) -> np.ndarray:
+        """Return the main diagonal."""
+        diagonal = np.zeros(min(self.shape))
+        on = self.rows == self.indices
+        diagonal[self.rows[on]] = self.data[on]
+        return diagonal
+
+    def submatrix(self, index: np.ndarray) -> Self:
+        """Return the rows and columns in ``index``, in that order.
+
+        :param index: Row and column indices to keep
+        :type index: numpy.ndarray
+        :returns: A square matrix of size ``len(index)``
+        :rtype: Self
+        """
+        new = np.full(self.shape[0], -1, dtype=np.int64)
+        new[index] = np.arange(len(index))
+        rows, cols = new[self.rows], new[self.indices]
+        keep = (rows >= 0) & (cols >= 0)
+        return type(self).from_triplets(
+            rows[keep], cols[keep], self.data[keep], (len(index), len(index)))
+
+    def bandwidth(self) -> int:
+        """Return the half bandwidth, max |i - j| over stored entries."""
+        if not self.nnz:
+            return 0
+        return int(np.max(np.abs(self.rows - self.indices)))
+
+    def to_dense(self) -> np.ndarray:
+        """Return the matrix as a dense array."""
+        dense = np.zeros(self.shape)
+        dense[self.rows, self.indices] = self.data
+        return dense
+
+    def to_scipy(self) -> Any:
+        """Return the matrix as a ``scipy.sparse.csr_matrix``. Requires SciPy."""
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+# Elements per chunk of a parallel assembly by assemble_triplets.
+ASSEMBLY_CHUNK: int = 4096
+
+
+def element_triplets(
+    node_i: np.ndarray,
+    node_j: np.ndarray,
+    matrices: np.ndarray,
+    i_release: bool,
+    j_release: bool,
+    keep: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the global stiffness triplets of a batch of elements.
+
+    :param node_i: (k,) array of i node IDs
+    :type node_i: numpy.ndarray
+    :param node_j: (k,) array of j node IDs
+    :type node_j: numpy.ndarray
+    :param matrices: (k, n, n) global element stiffness matrices
+    :type matrices: numpy.ndarray
+    :param i_release: Release flag at node i shared by the batch
+    :type i_release: bool
+    :param j_release: Release flag at node j shared by the batch
+    :type j_release: bool
+    :param keep: Element matrix rows to collect, as from
+        :func:`element_dof_positions`
+    :type keep: numpy.ndarray
+    :returns: Row indices, column indices and values
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    index = element_dof_indices(node_i, node_j, i_release, j_release)[:, keep]
+    n = len(keep)
+    return (
+        np.repeat(index, n, axis=1).ravel(),
+        np.tile(index, (1, n)).ravel(),
+        np.asarray(matrices, dtype=float)[:, keep[:, None], keep].ravel()
+    )
+
+
+def assemble_triplets(
+    members: Members,
+    dofs: tuple[int, ...] = FRAME_DOFS,
+    workers: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collect the global stiffness triplets of every submember.
+
+    Equivalent to :meth:`Solver.AddMemberToKp` for every submember, but
+    nothing is summed and no nDoF x nDoF matrix is allocated.
+
+    With ``workers`` the elements are split into chunks of
+    :data:`ASSEMBLY_CHUNK` whose triplets are built on a thread pool; NumPy
+    releases the GIL while copying, so chunks run concurrently. Partial
+    triplets are concatenated in element order, so the result is the same
+    as a serial assembly.
+
+    :param members: Collection of members in the structural model
+    :type members: Members
+    :param dofs: Nodal degrees of freedom to collect; entries acting on any
+        other are skipped. Defaults to all six.
+    :type dofs: tuple[int, ...]
+    :param workers: Number of threads, None or 1 to assemble serially.
+        Defaults to None.
+    :type workers: int | None
+    :returns: Row indices, column indices and values
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    groups: dict[tuple[bool, bool], tuple[list[int], list[int], list[np.ndarray]]] = {
+        case: ([], [], []) for case in ELEMENT_DOF}
+    for mbr in members.members.values():
+        for submbr in mbr.submembers.values():
+            node_i, node_j, matrices = groups[(submbr.i_release, submbr.j_release)]
+            node_i.append(submbr.node_i.node_ID)
+            node_j.append(submbr.node_j.node_ID)
+            matrices.append(submbr.Kg)
+
+    batches = []
+    for (i_release, j_release), (node_i, node_j, matrices) in groups.items():
+        keep = element_dof_positions(i_release, j_release, dofs)
+        step = ASSEMBLY_CHUNK if workers and workers > 1 else max(len(matrices), 1)
+        for start in range(0, len(matrices), step):
+            batches.append((
+                node_i[start:start+step],
+                node_j[start:start+step],
+                matrices[start:start+step],
+                i_release,
+                j_release,
+                keep
+            ))
+    if not batches:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0)
+    if workers and workers > 1 and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            triplets = list(executor.map(lambda batch: element_triplets(*batch), batches))
+    else:
+        triplets = [element_triplets(*batch) for batch in batches]
+    rows, cols, data = zip(*triplets)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(data)
+
+
+# Elements multiplied per batch by ElementOperator, which bounds the size of
+# its temporary arrays.
+OPERATOR_CHUNK: int = 1024
+
+
+class ElementOperator():
+    """Stiffness matrix applied element by element without being assembled.
+
+    ``K @ u`` gathers the displacements of every element, rotates them to
+    local axes, multiplies by the local stiffness matrix, rotates back and
+    scatter-adds the element forces. Elements with identical local matrices,
+    e.g. the submembers of one meshed member, share a single copy, so the
+    operator holds the distinct local matrices, a 3x3 rotation and the
+    degree of freedom indices per element, and never an nDoF x nDoF matrix.
+
+    :ivar shape: Number of rows and columns
+    :type shape: tuple[int, int]
+    :ivar lookup: Row of each six-per-node global index, -1 if it has none
+    :type lookup: numpy.ndarray
+    :ivar groups: Per release case: i release, j release, (k, n) global
+        indices, (k, 3, 3) rotations, (k,) local matrix of each element and
+        (g, n, n) distinct local matrices
+    :type groups: list[tuple]
+
+    :Example:
+
+        >>> K = ElementOperator(members, lookup, nDoF)
+        >>> f = K @ u
+    """
+
+    def __init__(self, members: Members, lookup: np.ndarray, size: int) -> None:
+        """Collect the element matrices of every submember.
+
+        :param members: Collection of members in the structural model
+        :type members: Members
+        :param lookup: Row of each six-per-node global index, -1 for degrees
+            of freedom that are not numbered
+        :type lookup: numpy.ndarray
+        :param size: Number of rows and columns
+        :type size: int
+        """
+        self.shape = (size, size)
+        self.lookup = lookup
+        self.groups: list[tuple] = []
+        cases: dict[tuple[bool, bool], tuple[list[int], list[int], list[np.ndarray], list[np.ndarray]]] = {
+            case: ([], [], [], []) for case in ELEMENT_DOF}
+        for mbr in members.members.values():
+            for submbr in mbr.submembers.values():
+                node_i, node_j, rotations, matrices = cases[(submbr.i_release, submbr.j_release)]
+                node_i.append(submbr.node_i.node_ID)
+                node_j.append(submbr.node_j.node_ID)
+                rotations.append(submbr.rotation_matrix[:3, :3])
+                matrices.append(submbr.Kl)
+        for (i_release, j_release), (node_i, node_j, rotations, matrices) in cases.items():
+            if not matrices:
+                continue
+            n = ELEMENT_DOF[(i_release, j_release)]
+            unique, group = np.unique(
+                np.asarray(matrices, dtype=float).reshape(len(matrices), -1),
+                axis=0, return_inverse=True)
+            self.groups.append((
+                i_release,
+                j_release,
+                element_dof_indices(node_i, node_j, i_release, j_release),
+                np.asarray(rotations, dtype=float),
+                group.ravel(),
+                unique.reshape(-1, n, n)
+            ))
+
+    @property
+    def unique(self) -> int:
+        """Number of distinct local element matrices held."""
+        return sum(len(Kl) for *_, Kl in self.groups)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the operator."""
+        return self.lookup.nbytes + sum(
+            index.nbytes + rotation.nbytes + group.nbytes + Kl.nbytes
+            for _, _, index, rotation, group, Kl in self.groups)
+
+    def submatrix(self, index: np.ndarray) -> Self:
+        """Return the operator restricted to the rows and columns in ``index``.
+
+        The element data is shared, not copied.
+
+        :param index: Row and column indices to keep, in their new order
+        :type index: numpy.ndarray
+        :returns: An operator of size ``len(index)``
+        :rtype: Self
+        """
+        new = np.full(self.shape[0], -1, dtype=np.int64)
+        new[index] = np.arange(len(index))
+        operator = object.__new__(type(self))
+        operator.shape = (len(index), len(index))
+        operator.lookup = np.where(self.lookup >= 0, new[self.lookup], -1)
+        operator.groups = self.groups
+        return operator
+
+    def batches(self) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield the rows, element rotation matrices and local matrices per batch.
+
+        Rows are -1 where an element degree of freedom has no row.
+        """
+        for i_release, j_release, index, rotation, group, Kl in self.groups:
+            for start in range(0, len(index), OPERATOR_CHUNK):
+                batch = slice(start, start + OPERATOR_CHUNK)
+                yield (
+                    self.lookup[index[batch]],
+                    element_rotation_matrices(rotation[batch], i_release, j_release),
+                    Kl[group[batch]]
+                )
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        """Return the product with a vector or a matrix of column vectors."""
+        x = np.asarray(x, dtype=float)
+        columns = x.reshape(len(x), -1)
+        y = np.zeros((self.shape[0], columns.shape[1]))
+        for rows, R, Kl in self.batches():
+            valid = rows >= 0
+            for k in range(columns.shape[1]):
+                u = np.where(valid, columns[:, k][np.where(valid, rows, 0)], 0.0)
+                local = np.einsum('kji,kj->ki', R, u)
+                f = np.einsum('kij,kj->ki', R, np.einsum('kij,kj->ki', Kl, local))
+                y[:, k] += np.bincount(rows[valid], weights=f[valid], minlength=self.shape[0])
+        return y.reshape((self.shape[0],) + x.shape[1:])
+
+    def diagonal(self) -> np.ndarray:
+        """Return the main diagonal."""
+        diagonal = np.zeros(self.shape[0])
+        for rows, R, Kl in self.batches():
+            valid = rows >= 0
+            d = np.einsum('kij,kjl,kil->ki', R, Kl, R)
+            diagonal += np.bincount(rows[valid], weights=d[valid], minlength=self.shape[0])
+        return diagonal
+
+
+def reverse_cuthill_mckee(connectivity: np.ndarray, count: int) -> np.ndarray:
+    """Order nodes to reduce the bandwidth of the stiffness matrix.
+
+    Breadth-first search from a minimum degree node of each connected
+    component, visiting neighbours by increasing degree, then reversed.
+
+    :param connectivity: (m, 2) array of zero-based node indices
+    :type connectivity: numpy.ndarray
+    :param count: Number of nodes
+    :type count: int
+    :returns: (count,) permutation; ``order[k]`` is the node placed k-th
+    :rtype: numpy.ndarray
+    """
+    pairs = np.asarray(connectivity, dtype=np.int64).reshape(-1, 2)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    source = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    target = np.concatenate((pairs[:, 1], pairs[:, 0]))
+    order = np.lexsort((target, source))
+    source, target = source[order], target[order]
+    indptr = np.zeros(count+1, dtype=np.int64)
+    np.cumsum(np.bincount(source, minlength=count), out=indptr[1:])
+    degree = np.diff(indptr)
+    adjacency = target.tolist()
+    pointers = indptr.tolist()
+    degrees = degree.tolist()
+
+    visited = [False]*count
+    result: list[int] = []
+    for start in np.argsort(degree, kind='stable').tolist():
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            neighbours = [n for n in adjacency[pointers[node]:pointers[node+1]]
+                          if not visited[n]]
+            neighbours = sorted(dict.fromkeys(neighbours), key=degrees.__getitem__)
+            for n in neighbours:
+                visited[n] = True
+            queue.extend(neighbours)
+        result.extend(queue)
+    return np.array(result[::-1], dtype=np.int64)
@@ -0,0 +1,265 @@
+from .Nodes import Nodes
+from .Members import Members
+from .Elements import ELEMENT_DOF, element_dof_indices
+
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+
+from typing import Any
+
+# Names of the six nodal degrees of freedom, as the Node attributes.
+DOF_NAMES: tuple[str, ...] = ('Ux', 'Uy', 'Uz', 'phi_x', 'phi_y', 'phi_z')
+
+# Diagonal stiffness below this fraction of the largest one counts as zero.
+ZERO_STIFFNESS: float = 1e-12
+
+# Offending nodes listed per problem in error messages.
+REPORTED_NODES: int = 10
+
+
+def components(connectivity: np.ndarray, count: int) -> np.ndarray:
+    """Label the connected components of a structure with union-find.
+
+    :param connectivity: (m, 2) array of zero-based node indices, as returned
+        by :meth:`Members.connectivity`
+    :type connectivity: numpy.ndarray
+    :param count: Number of nodes
+    :type count: int
+    :returns: (count,) component of each node, numbered in order of the
+        lowest node in each. Nodes without members are components of their own.
+    :rtype: numpy.ndarray
+    """
+    parent = list(range(count))
+
+    def root(n: int) -> int:
+        while parent[n] != n:
+            # Path halving
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+        return n
+
+    for i, j in np.asarray(connectivity, dtype=np.int64).reshape(-1, 2).tolist():
+        a, b = root(i), root(j)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+    roots = np.array([root(n) for n in range(count)], dtype=np.int64)
+    return np.unique(roots, return_inverse=True)[1].ravel()
+
+
+def rigid_body_modes(coordinates: np.ndarray) -> np.ndarray:
+    """Return the six rigid-body modes of a set of nodes.
+
+    Columns are translations along and rotations about global X, Y and Z,
+    the rotations about the centroid with translations scaled by the size of
+    the set so every column is of order one.
+
+    :param coordinates: (k, 3) node coordinates
+    :type coordinates: numpy.ndarray
+    :returns: (6k, 6) modes over the six-per-node degrees of freedom
+    :rtype: numpy.ndarray
+    """
+    r = coordinates - coordinates.mean(axis=0)
+    size = np.max(np.abs(r), initial=0.0)
+    r = r/size if size > 0 else r
+    modes = np.zeros((len(r), 6, 6))
+    modes[:, 0:3, 0:3] = np.eye(3)
+    modes[:, 3:6, 3:6] = np.eye(3)
+    for a in range(3):
+        modes[:, 0:3, 3+a] = np.cross(np.eye(3)[a], r)
+    return modes.reshape(-1, 6)
+
+
+@dataclass(slots=True)
+class StabilityReport():
+    """Connectivity and mechanism check of a model before it is solved.
+
+    :ivar components: Number of connected components
+    :type components: int
+    :ivar component: Component of each node, ordered by node ID
+    :type component: numpy.ndarray
+    :ivar zero_stiffness: Free degrees of freedom no member is stiff in, as
+        (node ID, direction) with directions from :data:`DOF_NAMES`
+    :type zero_stiffness: list[tuple[int, str]]
+    :ivar mechanisms: Number of rigid-body modes left free by the supports,
+        per component that has any
+    :type mechanisms: dict[int, int]
+
+    :Example:
+
+        >>> frame.solver.number_dofs(frame.nodes, frame.members)
+        >>> report = check_stability(frame.nodes, frame.members, frame.solver.dof_index, [])
+        >>> report.stable, report.nodes(0)
+    """
+    components: int = 0
+    component: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    zero_stiffness: list[tuple[int, str]] = field(default_factory=list[tuple[int, str]])
+    mechanisms: dict[int, int] = field(default_factory=dict[int, int])
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    @property
+    def stable(self) -> bool:
+        """True if no free degree of freedom or rigid-body mode is unresisted."""
+        return not self.zero_stiffness and not self.mechanisms
+
+    def nodes(self, component: int) -> list[int]:
+        """Return the IDs of the nodes of a component.
+
+        :param component: Component number
+        :type component: int
+        :returns: Node IDs, ascending
+        :rtype: list[int]
+        """
+        return (np.flatnonzero(self.component == component) + 1).tolist()
+
+    def message(self) -> str:
+        """Describe the instabilities found, naming the offending nodes."""
+        def listed(items: list[Any]) -> str:
+            more = len(items) - REPORTED_NODES
+            return ', '.join(map(str, items[:REPORTED_NODES])) + \
+                (f' and {more} more' if more > 0 else '')
+
+        problems = []
+        if self.zero_stiffness:
+            problems.append(
+                f"free degrees of freedom without stiffness (node, direction): "
+                f"{listed(self.zero_stiffness)}")
+        for k, modes in self.mechanisms.items():
+            problems.append(
+                f"{modes} rigid-body {'mode is' if modes == 1 else 'modes are'} not "
+                f"restrained in the part of the structure with nodes {listed(self.nodes(k))}")
+        return "The model is unstable: " + "; ".join(problems) + \
+            ". Add restraints or members, or remove end releases."
+
+
+class UnstableModelError(np.linalg.LinAlgError):
+    """Raised when a model is found to be unstable before it is factored.
+
+    :ivar report: The check that failed
+    :type report: StabilityReport
+    """
+
+    def __init__(self, report: StabilityReport) -> None:
+        super().__init__(report.message())
+        self.report = report
+
+
+class SingularStiffnessError(np.linalg.LinAlgError):
+    """Raised when the factorization finds a singular or ill-conditioned stiffness matrix.
+
+    :ivar pivots: Degrees of freedom with small relative pivots, as
+        (node ID, direction, pivot over diagonal entry)
+    :type pivots: list[tuple[int, str, float]]
+    :ivar condition: Estimated 1-norm condition number, infinite if the
+        matrix could not be factored
+    :type condition: float
+    """
+
+    def __init__(self, pivots: list[tuple[int, str, float]], condition: float) -> None:
+        more = len(pivots) - REPORTED_NODES
+        located = ', '.join(
+            f"({node}, {direction}): {ratio:.1e}" for node, direction, ratio in pivots[:REPORTED_NODES]
+        ) + (f' and {more} more' if more > 0 else '')
+        super().__init__(
+            "The structure stiffness matrix is "
+            + ("singular" if np.isinf(condition) else f"ill-conditioned (condition number {condition:.1e})")
+            + (f"; small relative pivots at (node, direction): {located}" if pivots else "")
+            + ". The model may be unstable or have members of very different stiffness."
+        )
+        self.pivots = pivots
+        self.condition = condition
+
+
+def check_stability(
+    nodes: Nodes,
+    members: Members,
+    dof_index: np.ndarray,
+    restrained: list[int] | np.ndarray
+) -> StabilityReport:
+    """Find disconnected, unsupported and stiffness-free parts of a model.
+
+    Runs in time linear in the model size without assembling or factoring
+    anything. Connected components are found with :func:`components`. The
+    stiffness matrix diagonal is summed from the submember matrices to find
+    free degrees of freedom no member is stiff in. The rigid-body modes of
+    each component (:func:`rigid_body_modes`) that are not prevented by the
+    nodal restraints are counted as mechanisms, over the numbered degrees
+    of freedom only; nodes without members have none and are skipped.
+
+    :param nodes: Collection of nodes in the structural model
+    :type nodes: Nodes
+    :param members: Collection of members in the structural model
+    :type members: Members
+    :param dof_index: Six-per-node global index of each numbered degree of
+        freedom, as :attr:`Solver.dof_index`
+    :type dof_index: numpy.ndarray
+    :param restrained: Restrained numbered degrees of freedom, positions in
+        ``dof_index``
+    :type restrained: list[int] | numpy.ndarray
+    :returns: The report
+    :rtype: StabilityReport
+    """
+    count = nodes.count
+    dof_index = np.asarray(dof_index, dtype=np.int64)
+    connectivity = members.connectivity()
+    label = components(connectivity, count)
+
+    # Diagonal of the global stiffness matrix, six entries per node.
+    groups: dict[tuple[bool, bool], tuple[list[int], list[int], list[np.ndarray]]] = {
+        case: ([], [], []) for case in ELEMENT_DOF}
+    for mbr in members.members.values():
+        for submbr in mbr.submembers.values():
+            node_i, node_j, diagonals = groups[(submbr.i_release, submbr.j_release)]
+            node_i.append(submbr.node_i.node_ID)
+            node_j.append(submbr.node_j.node_ID)
+            diagonals.append(np.abs(np.diagonal(submbr.Kg)))
+    diagonal = np.zeros(6*count)
+    for (i_release, j_release), (node_i, node_j, diagonals) in groups.items():
+        if node_i:
+            np.add.at(diagonal, element_dof_indices(node_i, node_j, i_release, j_release),
+                      np.array(diagonals))
+
+    # Free numbered degrees of freedom without stiffness.
+    free = np.ones(len(dof_index), dtype=bool)
+    free[np.asarray(restrained, dtype=np.int64)] = False
+    scale = np.max(diagonal, initial=0.0)
+    zero = dof_index[free & (diagonal[dof_index] <= ZERO_STIFFNESS*scale)]
+    zero_stiffness = [(int(g//6) + 1, DOF_NAMES[g % 6]) for g in zero]
+
+    # Rigid-body modes of each component left free by the supports.
+    coordinates = nodes.coordinate_array()
+    numbered = np.zeros(6*count, dtype=bool)
+    numbered[dof_index] = True
+    numbered = numbered.reshape(-1, 6)
+    support = np.array([node.restraint for node in nodes.nodes.values()],
+                       dtype=bool).reshape(-1, 6) & numbered
+    has_members = np.zeros(count, dtype=bool)
+    has_members[connectivity.ravel()] = True
+    mechanisms = {}
+    order = np.argsort(label, kind='stable')
+    bounds = np.searchsorted(label[order], np.arange(label.max(initial=-1) + 2))
+    for k in range(len(bounds) - 1):
+        group = order[bounds[k]:bounds[k+1]]
+        if not has_members[group[0]]:
+            continue
+        modes = rigid_body_modes(coordinates[group]).reshape(-1, 6, 6)
+        moving = modes[numbered[group]]
+        possible = np.linalg.matrix_rank(moving) if len(moving) else 0
+        held = modes[support[group]]
+        resisted = np.linalg.matrix_rank(held) if len(held) else 0
+        if resisted < possible:
+            mechanisms[k] = int(possible - resisted)
+
+    return StabilityReport(
+        components=int(label.max(initial=-1) + 1),
+        component=label,
+        zero_stiffness=zero_stiffness,
+        mechanisms=mechanisms
+    )
@@ -0,0 +1,188 @@
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+@dataclass(slots=True)
+class SolveStats():
+    """Timings and sizes collected during a single solve.
+
+    Phases are timed with :func:`time.perf_counter` and sizes are read from
+    arrays that already exist, so collecting statistics adds no measurable
+    cost to a solve.
+
+    :ivar phases: Wall time in seconds per phase, in the order run
+    :type phases: dict[str, float]
+    :ivar nDoF: Total number of degrees of freedom
+    :type nDoF: int
+    :ivar free_DoF: Number of unrestrained degrees of freedom solved for
+    :type free_DoF: int
+    :ivar elements: Number of submembers assembled
+    :type elements: int
+    :ivar nnz: Number of structurally nonzero entries of the stiffness matrix,
+        counted from node blocks
+    :type nnz: int
+    :ivar bandwidth: Half bandwidth of the stiffness matrix in node ID order
+    :type bandwidth: int
+    :ivar bytes: Bytes allocated per named array
+    :type bytes: dict[str, int]
+    :ivar counters: Additional solver specific values
+    :type counters: dict[str, Any]
+    :ivar residuals: Relative residual norm after each iteration of an
+        iterative solve, starting with the initial guess
+    :type residuals: list[float]
+
+    :Example:
+
+        >>> frame.solve()
+        >>> frame.solver.stats.phases['assembly']
+        >>> frame.solver.stats.to_json(indent=2)
+    """
+    phases: dict[str, float] = field(default_factory=dict[str, float])
+    nDoF: int = 0
+    free_DoF: int = 0
+    elements: int = 0
+    nnz: int = 0
+    bandwidth: int = 0
+    bytes: dict[str, int] = field(default_factory=dict[str, int])
+    counters: dict[str, Any] = field(default_factory=dict[str, Any])
+    residuals: list[float] = field(default_factory=list[float])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of code and add it to ``phases[name]``.
+
+        :param name: Phase name, e.g. 'assembly'
+        :type name: str
+
+        :Example:
+
+            >>> with stats.phase('assembly'):
+            ...     assemble()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + \
+                time.perf_counter() - start
+
+    def allocate(self, name: str, array: Any) -> None:
+        """Record the memory held by an array.
+
+        :param name: Array name, e.g. 'Kp'
+        :type name: str
+        :param array: Array or object with an ``nbytes`` attribute, or None to
+            record nothing
+        :type array: Any
+        :returns: None
+        :rtype: None
+        """
+        if array is not None:
+            self.bytes[name] = int(getattr(array, 'nbytes', None)
+                                   or np.asarray(array).nbytes)
+
+    @property
+    def total(self) -> float:
+        """Total wall time over all phases in seconds."""
+        return sum(self.phases.values())
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as plain Python values, including the total time.
+
+        :returns: JSON serializable dictionary
+        :rtype: dict[str, Any]
+        """
+        stats = self.properties()
+        stats['total'] = self.total
+        stats['counters'] = json.loads(json.dumps(stats['counters'], default=_plain))
+        return stats
+
+    def to_json(self, indent: int | None = None) -> str:
+        """Return the statistics as a JSON document.
+
+        :param indent: Indentation passed to :func:`json.dumps`. Defaults to None.
+        :type indent: int | None
+        :returns: JSON text
+        :rtype: str
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+@dataclass(slots=True, frozen=True)
+class SolveProgress():
+    """Progress event of a solve, emitted as each phase completes.
+
+    :ivar phase: Name of the completed phase, a key of :attr:`SolveStats.phases`
+    :type phase: str
+    :ivar completed: Number of phases completed, this one included
+    :type completed: int
+    :ivar total: Number of phases of the solve
+    :type total: int
+    :ivar seconds: Wall time of the phase in seconds
+    :type seconds: float
+    """
+    phase: str
+    completed: int
+    total: int
+    seconds: float
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the phases completed."""
+        return self.completed/self.total
+
+
+def sparsity(connectivity: np.ndarray, dofs: int = 6) -> tuple[int, int]:
+    """Count the structural nonzeros and half bandwidth of a stiffness matrix.
+
+    Every node touched by an element contributes a diagonal block and every
+    distinct pair of connected nodes two off-diagonal blocks, so the count is
+    an upper bound that ignores released rotations.
+
+    :param connectivity: (m, 2) array of zero-based node indices, as returned
+        by :meth:`Members.connectivity`
+    :type connectivity: numpy.ndarray
+    :param dofs: Degrees of freedom numbered per node. Defaults to 6.
+    :type dofs: int
+    :returns: Number of nonzeros and half bandwidth in node ID order
+    :rtype: tuple[int, int]
+    """
+    if len(connectivity) == 0:
+        return 0, 0
+    pairs = np.unique(np.sort(connectivity, axis=1), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    nodes = len(np.unique(connectivity))
+    nnz = dofs*dofs*(nodes + 2*len(pairs))
+    span = int(np.max(pairs[:, 1] - pairs[:, 0])) if len(pairs) else 0
+    return nnz, dofs*span + dofs - 1
+
+
+def _plain(value: Any) -> Any:
+    """Convert NumPy values to JSON serializable Python values."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
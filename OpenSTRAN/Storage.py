@@ -0,0 +1,291 @@
+from .Coordinates import Coordinate
+from .Node import Node
+from .Nodes import Nodes
+from .Member import Member
+from .Truss import Truss
+from .Members import Members
+from .Submember import SubMember, FORCE_KEYS
+from .Solver import Solver
+from .Elements import (
+    ELEMENT_DOF,
+    rotation_matrices,
+    element_matrices
+)
+
+import numpy as np
+
+import json
+from os import PathLike
+
+# Version of the .npz layout written by save_model.
+FORMAT_VERSION: int = 1
+
+# Node attributes stored column by column in groups of six.
+NODE_LOADS: tuple[str, ...] = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+NODE_ENAS: tuple[str, ...] = ('eFx', 'eFy', 'eFz', 'eMx', 'eMy', 'eMz')
+NODE_DISPLACEMENTS: tuple[str, ...] = (
+    'Ux', 'Uy', 'Uz', 'phi_x', 'phi_y', 'phi_z')
+NODE_REACTIONS: tuple[str, ...] = ('Rx', 'Ry', 'Rz', 'Rmx', 'Rmy', 'Rmz')
+
+# Section properties stored for members and submembers.
+SECTION_PROPERTIES: tuple[str, ...] = ('E', 'Ixx', 'Iyy', 'A', 'G', 'J')
+
+
+def save_model(nodes: Nodes, members: Members, solver: Solver, path: str | PathLike, compress: bool = False) -> None:
+    """Write a model to a columnar NumPy .npz archive.
+
+    Every node, member and submember attribute is stored as one array per
+    column so the archive can be restored in bulk by :func:`load_model`.
+
+    :param nodes: Collection of nodes in the structural model
+    :type nodes: Nodes
+    :param members: Collection of members in the structural model
+    :type members: Members
+    :param solver: Solver holding the latest global solution vectors
+    :type solver: Solver
+    :param path: Output file path, conventionally ending in '.npz'
+    :type path: str | PathLike
+    :param compress: True to zlib compress the archive
+    :type compress: bool
+    :returns: None
+    :rtype: None
+    """
+    node_list = list(nodes.nodes.values())
+    mbr_list = list(members.members.values())
+    submbrs = [s for mbr in mbr_list for s in mbr.submembers.values()]
+
+    def columns(objects: list, names: tuple[str, ...]) -> np.ndarray:
+        return np.array(
+            [[getattr(o, name) for name in names] for o in objects],
+            dtype=float
+        ).reshape(-1, len(names))
+
+    arrays: dict[str, np.ndarray] = {
+        'version': np.array(FORMAT_VERSION),
+        'plane': np.array(nodes.plane or ''),
+        'truss': np.array(members.truss),
+        'node_coordinates': nodes.coordinate_array(),
+        'node_mesh': np.array([n.mesh_node for n in node_list], dtype=bool),
+        'node_restraint': np.array(
+            [n.restraint for n in node_list], dtype=np.int8).reshape(-1, 6),
+        'node_loads': columns(node_list, NODE_LOADS),
+        'node_enas': columns(node_list, NODE_ENAS),
+        'node_displacements': columns(node_list, NODE_DISPLACEMENTS),
+        'node_reactions': columns(node_list, NODE_REACTIONS),
+        'member_nodes': np.array(
+            [(m.node_i.node_ID, m.node_j.node_ID) for m in mbr_list],
+            dtype=np.int64).reshape(-1, 2),
+        'member_releases': np.array(
+            [(m.i_release, m.j_release) for m in mbr_list],
+            dtype=bool).reshape(-1, 2),
+        'member_properties': columns(mbr_list, SECTION_PROPERTIES),
+        # Adaptive meshes are stored as a mesh of 0.
+        'member_mesh': np.array(
+            [0 if m.mesh == 'adaptive' else m.mesh for m in mbr_list], dtype=np.int64),
+        'member_refine': np.array([m.refine for m in mbr_list], dtype=np.int64),
+        'member_stations': np.array(
+            [json.dumps(m.stations) for m in mbr_list], dtype=str),
+        'member_truss': np.array(
+            [isinstance(m, Truss) for m in mbr_list], dtype=bool),
+        'member_bracing': np.array(
+            [json.dumps(m.bracing) for m in mbr_list], dtype=str),
+        'member_shape': np.array([m.shape for m in mbr_list], dtype=str),
+        'member_submembers': np.array(
+            [len(m.submembers) for m in mbr_list], dtype=np.int64),
+        'submember_nodes': np.array(
+            [(s.node_i.node_ID, s.node_j.node_ID) for s in submbrs],
+            dtype=np.int64).reshape(-1, 2),
+        'submember_releases': np.array(
+            [(s.i_release, s.j_release) for s in submbrs],
+            dtype=bool).reshape(-1, 2),
+        'submember_properties': columns(submbrs, SECTION_PROPERTIES),
+        # Rotations are stored as the parts of a split member keep the
+        # rotation of the member rather than that of their own end nodes.
+        'submember_rotation': np.array(
+            [s.rotation_matrix[0:3, 0:3] for s in submbrs],
+            dtype=float).reshape(-1, 3, 3),
+        'submember_enas': np.array(
+            [[s.ENAs[key] for key in FORCE_KEYS] for s in submbrs],
+            dtype=float).reshape(-1, len(FORCE_KEYS), 2),
+        # Span loads with the index of their submember in the first column.
+        'submember_loads': np.array(
+            [[k, *load] for k, s in enumerate(submbrs) for load in s.loads],
+            dtype=float).reshape(-1, 9),
+    }
+
+    # Results only exist once the model has been solved, and are not held
+    # in memory once written to a ResultStore. The solution vectors are
+    # saved only with the results, so a loaded model is solved or not.
+    if submbrs and len(submbrs[0].results['axial']) == 2:
+        arrays['submember_forces'] = np.array(
+            [[s.results[key] for key in FORCE_KEYS] for s in submbrs],
+            dtype=float).reshape(-1, len(FORCE_KEYS), 2)
+        # Element displacement vectors are padded to 12 entries with NaN.
+        displacements = np.full((len(submbrs), 12), np.nan)
+        for k, s in enumerate(submbrs):
+            d = np.ravel(s.results['displacements'])
+            displacements[k, :len(d)] = d
+        arrays['submember_displacements'] = displacements
+        if solver.global_displacement_vector is not None:
+            arrays['global_displacement_vector'] = solver.global_displacement_vector
+        if solver.global_force_vector is not None:
+            arrays['global_force_vector'] = solver.global_force_vector
+
+    if compress:
+        np.savez_compressed(path, **arrays)
+    else:
+        np.savez(path, **arrays)
+
+
+def load_model(nodes: Nodes, members: Members, solver: Solver, path: str | PathLike) -> None:
+    """Restore a model written by :func:`save_model` into empty collections.
+
+    Nodes are created without the coordinate search of :meth:`Nodes.add_node`,
+    members without meshing, and submember stiffness matrices are built in
+    vectorized batches per release case rather than one element at a time,
+    on :attr:`Solver.workers` threads when set (see :func:`element_matrices`).
+
+    :param nodes: Empty collection of nodes to populate
+    :type nodes: Nodes
+    :param members: Empty collection of members to populate
+    :type members: Members
+    :param solver: Solver to restore the global solution vectors to
+    :type solver: Solver
+    :param path: Path of the .npz archive
+    :type path: str | PathLike
+    :returns: None
+    :rtype: None
+    :raises ValueError: If the collections are not empty or the archive was
+        written by a newer version of the format
+    """
+    if nodes.count or members.count:
+        raise ValueError("A model can only be loaded into an empty model.")
+
+    with np.load(path, allow_pickle=False) as archive:
+        data = {key: archive[key] for key in archive.files}
+    if int(data['version']) > FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported model file version {int(data['version'])}."
+        )
+
+    # Restore the nodes in ID order.
+    xyz = data['node_coordinates']
+    restraints = data['node_restraint'].tolist()
+    values = np.hstack((
+        data['node_loads'],
+        data['node_enas'],
+        data['node_displacements'],
+        data['node_reactions']
+    )).tolist()
+    mesh_nodes = data['node_mesh'].tolist()
+    names = NODE_LOADS + NODE_ENAS + NODE_DISPLACEMENTS + NODE_REACTIONS
+    for k, (x, y, z) in enumerate(xyz.tolist()):
+        node = Node(
+            Coordinate(x, y, z),
+            k+1,
+            mesh_nodes[k],
+            plane=nodes.plane,
+            **dict(zip(names, values[k]))
+        )
+        # Restraints were saved after any plane defaults were applied.
+        node.restraint = restraints[k]
+        nodes.nodes[k+1] = node
+    nodes.count = len(xyz)
+    nodes.x = xyz[:, 0].tolist()
+    nodes.y = xyz[:, 1].tolist()
+    nodes.z = xyz[:, 2].tolist()
+    node_list = list(nodes.nodes.values())
+
+    # Build submember geometry and stiffness in batches per release case.
+    ends = data['submember_nodes'] - 1
+    releases = data['submember_releases']
+    properties = data['submember_properties']
+    d = xyz[ends[:, 1]] - xyz[ends[:, 0]]
+    lengths = np.sqrt(np.einsum('ij,ij->i', d, d))
+    rotation = data['submember_rotation'] if 'submember_rotation' in data \
+        else rotation_matrices(xyz[ends[:, 0]], xyz[ends[:, 1]])
+    ends_list = ends.tolist()
+    properties_list = properties.tolist()
+    lengths_list = lengths.tolist()
+    submbrs: list[SubMember | None] = [None]*len(ends)
+    for i_release, j_release in ELEMENT_DOF:
+        index = np.flatnonzero(
+            (releases[:, 0] == i_release) & (releases[:, 1] == j_release))
+        if len(index) == 0:
+            continue
+        R, Kl, Kg = element_matrices(
+            rotation[index], lengths[index], properties[index],
+            i_release, j_release, solver.workers)
+        for n, k in enumerate(index.tolist()):
+            submbrs[k] = SubMember.from_matrices(
+                node_list[ends_list[k][0]],
+                node_list[ends_list[k][1]],
+                i_release,
+                j_release,
+                *properties_list[k],
+                lengths_list[k],
+                R[n],
+                Kl[n],
+                Kg[n]
+            )
+
+    # Restore equivalent nodal actions and results.
+    enas = data['submember_enas'].tolist()
+    forces = data['submember_forces'].tolist() \
+        if 'submember_forces' in data else None
+    for k, submbr in enumerate(submbrs):
+        assert submbr is not None
+        submbr.ENAs = dict(zip(FORCE_KEYS, enas[k]))
+        if forces is not None:
+            submbr.results.update(zip(FORCE_KEYS, forces[k]))
+            n = ELEMENT_DOF[(submbr.i_release, submbr.j_release)]
+            submbr.results['displacements'] = \
+                data['submember_displacements'][k, :n].copy()
+    if 'submember_loads' in data:
+        for load in data['submember_loads'].tolist():
+            submbrs[int(load[0])].loads.append(load[1:])
+
+    # Restore the members, which own consecutive runs of submembers.
+    truss = data['member_truss'].tolist() if 'member_truss' in data \
+        else [False]*len(data['member_submembers'])
+    refine = data['member_refine'].tolist() if 'member_refine' in data \
+        else [1]*len(data['member_submembers'])
+    stations = data['member_stations'].tolist() if 'member_stations' in data \
+        else ['[]']*len(data['member_submembers'])
+    start = 0
+    for k, (count, (i, j), (i_release, j_release), properties, mesh, bracing, shape) in enumerate(zip(
+        data['member_submembers'].tolist(),
+        data['member_nodes'].tolist(),
+        data['member_releases'].tolist(),
+        data['member_properties'].tolist(),
+        data['member_mesh'].tolist(),
+        data['member_bracing'].tolist(),
+        data['member_shape'].tolist()
+    )):
+        cls = Truss if truss[k] else Member
+        members.members[k+1] = cls.from_submembers(
+            nodes,
+            node_list[i-1],
+            node_list[j-1],
+            i_release,
+            j_release,
+            *properties,
+            mesh or 'adaptive',
+            json.loads(bracing),
+            shape,
+            submbrs[start:start+count],
+            refine[k],
+            json.loads(stations[k])
+        )
+        start += count
+    members.count = len(data['member_submembers'])
+    if 'truss' in data:
+        members.truss = bool(data['truss'])
+
+    # Archives written before results could be offloaded to a ResultStore
+    # may hold the solution vectors without the results; load them unsolved.
+    if forces is not None and 'global_displacement_vector' in data:
+        solver.number_dofs(nodes, members)
+        solver.global_displacement_vector = data['global_displacement_vector']
+        if 'global_force_vector' in data:
+            solver.global_force_vector = data['global_force_vector']
@@ -6,8 +6,17 @@ from math import sqrt
 
 from dataclasses import dataclass, field, asdict
 
-from typing import Any
-
+from typing import Any, Self
+
+# Keys of the end force entries in SubMember.ENAs and SubMember.results.
+FORCE_KEYS: tuple[str, ...] = (
+    'axial',
+    'shear',
+    'transverse shear',
+    'torsional moments',
+    'minor axis moments',
+    'major axis moments'
+)
 
 @dataclass(slots=True)
 class SubMember():
@@ -46,6 +55,11 @@ class SubMember():
     :type Kl: numpy.ndarray
     :ivar Kg: Global stiffness matrix
     :type Kg: numpy.ndarray
+    :ivar loads: Span loads in local coordinates, one row per load of
+        ``[x1, x2, qx1, qy1, qz1, qx2, qy2, qz2]`` with positions in feet from
+        node i. Distributed loads vary linearly from q1 (kip/ft) at x1 to q2 at
+        x2; point loads have ``x1 == x2`` and forces (kips) in q1.
+    :type loads: list[list[float]]
     """
     node_i: Node
     node_j: Node
@@ -66,6 +80,7 @@ class SubMember():
     transformation_matrix: np.ndarray = field(init=False)
     Kl: np.ndarray = field(init=False)
     Kg: np.ndarray = field(init=False)
+    loads: list[list[float]] = field(default_factory=list[list[float]])
 
     def properties(self) -> dict[str, Any]:
         """Return all submember properties as a dictionary.
@@ -130,6 +145,60 @@ class SubMember():
         self.Kg = self.transformation_matrix.T.dot(
             self.Kl).dot(self.transformation_matrix)
 
+    @classmethod
+    def from_matrices(
+        cls,
+        node_i: Node,
+        node_j: Node,
+        i_release: bool,
+        j_release: bool,
+        E: float,
+        Ixx: float,
+        Iyy: float,
+        A: float,
+        G: float,
+        J: float,
+        length: float,
+        rotation_matrix: np.ndarray,
+        Kl: np.ndarray,
+        Kg: np.ndarray
+    ) -> Self:
+        """Create a submember from precomputed geometry and stiffness matrices.
+
+        Bypasses :meth:`__post_init__` so that matrices built in bulk (see
+        :mod:`OpenSTRAN.Elements`) are not recomputed element by element.
+
+        :param rotation_matrix: Element rotation matrix, see :meth:`build_rotation_matrix`
+        :type rotation_matrix: numpy.ndarray
+        :param Kl: Local stiffness matrix
+        :type Kl: numpy.ndarray
+        :param Kg: Global stiffness matrix
+        :type Kg: numpy.ndarray
+        :returns: A new SubMember with empty ENAs and results
+        :rtype: Self
+        """
+        submbr = object.__new__(cls)
+        submbr.node_i = node_i
+        submbr.node_j = node_j
+        submbr.i_release = i_release
+        submbr.j_release = j_release
+        submbr.E = E
+        submbr.Ixx = Ixx
+        submbr.Iyy = Iyy
+        submbr.A = A
+        submbr.G = G
+        submbr.J = J
+        submbr.ENAs = {key: [0, 0] for key in FORCE_KEYS}
+        submbr.results = {'displacements': []}
+        submbr.results.update({key: [] for key in FORCE_KEYS})
+        submbr.length = length
+        submbr.rotation_matrix = rotation_matrix
+        submbr.transformation_matrix = rotation_matrix.T
+        submbr.Kl = Kl
+        submbr.Kg = Kg
+        submbr.loads = []
+        return submbr
+
     def calculate_length(self, node_i: Node, node_j: Node) -> float:
         """
         Compute Euclidean length between two nodes.
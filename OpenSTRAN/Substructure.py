@@ -0,0 +1,164 @@
+from .Sparse import CSRMatrix, reverse_cuthill_mckee
+from .Backends import BandedCholesky
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+import multiprocessing
+from typing import Any
+
+# Number of substructures used by the 'substructure' backend by default.
+SUBSTRUCTURES: int = 4
+
+
+def partition(
+    connectivity: np.ndarray,
+    count: int,
+    parts: int = SUBSTRUCTURES,
+    order: np.ndarray | None = None
+) -> np.ndarray:
+    """Split the nodes of a structure into substructures and their interface.
+
+    Nodes are ordered by :func:`reverse_cuthill_mckee` over the member
+    connectivity and cut into ``parts`` runs of equal length, so each
+    substructure is a compact band of the structure. Every element joining
+    two substructures makes its node in the lower numbered one an interface
+    node, which leaves no element between the interiors of two substructures.
+
+    :param connectivity: (m, 2) array of zero-based node indices, as returned
+        by :meth:`Members.connectivity`
+    :type connectivity: numpy.ndarray
+    :param count: Number of nodes
+    :type count: int
+    :param parts: Number of substructures. Defaults to :data:`SUBSTRUCTURES`.
+    :type parts: int
+    :param order: Node order from :func:`reverse_cuthill_mckee`, computed
+        if None. Defaults to None.
+    :type order: numpy.ndarray | None
+    :returns: (count,) substructure of each node, -1 for interface nodes
+    :rtype: numpy.ndarray
+    :raises ValueError: If ``parts`` is less than 1
+    """
+    if parts < 1:
+        raise ValueError(f"Expected at least one substructure, got {parts}.")
+    if order is None:
+        order = reverse_cuthill_mckee(connectivity, count)
+    label = np.zeros(count, dtype=np.int64)
+    label[order] = np.arange(count)*parts//max(count, 1)
+    ends = np.asarray(connectivity, dtype=np.int64).reshape(-1, 2)
+    a, b = label[ends[:, 0]], label[ends[:, 1]]
+    cut = a != b
+    label[np.where(a < b, ends[:, 0], ends[:, 1])[cut]] = -1
+    return label
+
+
+def condense(
+    Kii: CSRMatrix,
+    Kib: np.ndarray,
+    fi: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Condense the interior of a substructure onto its interface.
+
+    Runs in a worker process. The interior matrix is factored with
+    :class:`BandedCholesky`, so its rows should be in a banded order.
+
+    :param Kii: Interior stiffness matrix
+    :type Kii: CSRMatrix
+    :param Kib: (i, b) dense coupling between the interior and the interface
+        degrees of freedom the substructure touches
+    :type Kib: numpy.ndarray
+    :param fi: (i,) interior forces
+    :type fi: numpy.ndarray
+    :returns: The Schur complement contribution ``Kbi Kii^-1 Kib``, the
+        condensed forces ``Kbi Kii^-1 fi``, and ``Kii^-1 Kib`` and
+        ``Kii^-1 fi`` to recover the interior displacements
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    Z = BandedCholesky(Kii).solve(np.column_stack((Kib, fi)))
+    X, y = Z[:, :-1], Z[:, -1]
+    return Kib.T @ X, Kib.T @ y, X, y
+
+
+def solve_substructures(
+    K: CSRMatrix,
+    b: np.ndarray,
+    part: np.ndarray,
+    workers: int | None = None
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """Solve ``K x = b`` by static condensation of substructures.
+
+    Each substructure's interior is condensed onto the interface by
+    :func:`condense`, on a pool of ``workers`` processes. The sum of the
+    Schur complements, an interface matrix of the size of the interface, is
+    solved in this process, then the interior displacements of every
+    substructure are recovered on a thread pool. Workers are spawned, so a
+    script solving with ``workers`` must guard its entry point with
+    ``if __name__ == '__main__':``.
+
+    :param K: Symmetric positive definite matrix
+    :type K: CSRMatrix
+    :param b: Right-hand side vector
+    :type b: numpy.ndarray
+    :param part: (n,) substructure of each row, -1 for interface rows. Rows
+        of a substructure should be in a banded order.
+    :type part: numpy.ndarray
+    :param workers: Number of worker processes, None or 1 to condense in
+        this process. Defaults to None.
+    :type workers: int | None
+    :returns: The solution with the shape of ``b``, and the number of
+        substructures and interface degrees of freedom
+    :rtype: tuple[numpy.ndarray, dict[str, Any]]
+    :raises numpy.linalg.LinAlgError: If the matrix is not positive definite
+    """
+    shape = np.shape(b)
+    b = np.ravel(b).astype(float)
+    part = np.asarray(part, dtype=np.int64)
+    interface = np.flatnonzero(part < 0)
+    local = np.full(len(part), -1, dtype=np.int64)
+    local[interface] = np.arange(len(interface))
+
+    # Split the matrix entries by the substructure of their row and column.
+    row_part, col_part = part[K.rows], part[K.indices]
+    substructures, tasks = [], []
+    for p in np.unique(part[part >= 0]).tolist():
+        rows = np.flatnonzero(part == p)
+        position = np.full(len(part), -1, dtype=np.int64)
+        position[rows] = np.arange(len(rows))
+        inner = (row_part == p) & (col_part == p)
+        Kii = CSRMatrix.from_triplets(
+            position[K.rows[inner]], position[K.indices[inner]],
+            K.data[inner], (len(rows), len(rows)))
+        coupled = (row_part == p) & (col_part < 0)
+        columns, index = np.unique(local[K.indices[coupled]], return_inverse=True)
+        Kib = np.zeros((len(rows), len(columns)))
+        np.add.at(Kib, (position[K.rows[coupled]], index.ravel()), K.data[coupled])
+        substructures.append((rows, columns))
+        tasks.append((Kii, Kib, b[rows]))
+
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            condensed = list(executor.map(condense, *zip(*tasks)))
+    else:
+        condensed = [condense(*task) for task in tasks]
+
+    # Assemble and solve the interface problem.
+    S = K.submatrix(interface).to_dense()
+    g = b[interface].copy()
+    for (_, columns), (Sp, gp, _, _) in zip(substructures, condensed):
+        S[np.ix_(columns, columns)] -= Sp
+        g[columns] -= gp
+    x = np.zeros(len(part))
+    x[interface] = np.linalg.solve(S, g) if len(interface) else g
+
+    ub = x[interface]
+
+    def recover(k: int) -> None:
+        (rows, columns), (_, _, X, y) = substructures[k], condensed[k]
+        x[rows] = y - X @ ub[columns]
+
+    with ThreadPoolExecutor(max_workers=max(workers or 1, 1)) as executor:
+        list(executor.map(recover, range(len(substructures))))
+    info = {'substructures': len(substructures), 'interface_DoF': len(interface)}
+    return x.reshape(shape), info
@@ -0,0 +1,63 @@
+from .Member import Member
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Truss(Member):
+    """
+    Represents an axial-only member pinned at both ends.
+
+    A truss member is a single element between its two nodes: no mesh nodes
+    are added and both ends are released, so its stiffness only couples the
+    translations of its nodes. Loads are applied at the nodes.
+
+    Section properties other than ``E`` and ``A`` do not contribute to the
+    stiffness and are kept only for reference.
+
+    :Example:
+
+        >>> truss = OpenSTRAN.Model(truss=True)
+        >>> T1 = truss.members.addTruss(N1, N2, shape="L4x4x1/2")
+    """
+
+    def __post_init__(self) -> None:
+        """Initialize the truss member as a single pinned submember.
+
+        :returns: None
+        :rtype: None
+        """
+        self.length = self.calculate_length(self.node_i, self.node_j)
+        self.i_release = True
+        self.j_release = True
+        self.mesh = 1
+        self.add_submember(
+            self.node_i,
+            self.node_j,
+            True,
+            True,
+            self.E,
+            self.Ixx,
+            self.Iyy,
+            self.A,
+            self.G,
+            self.J
+        )
+
+    def add_point_load(self, mag: float, direction: str, location: float) -> None:
+        """Not supported; truss members are loaded at their nodes.
+
+        :raises ValueError: Always
+        """
+        raise ValueError(
+            "Truss members carry axial force only; apply loads to their nodes."
+        )
+
+    def add_distributed_load(self, Mag1: float, Mag2: float, direction: str, loc1: float, loc2: float):
+        """Not supported; truss members are loaded at their nodes.
+
+        :raises ValueError: Always
+        """
+        raise ValueError(
+            "Truss members carry axial force only; apply loads to their nodes."
+        )
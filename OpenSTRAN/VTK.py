@@ -0,0 +1,478 @@
+from .Nodes import Nodes
+from .Members import Members
+from .Solver import Solver
+from .Submember import FORCE_KEYS
+
+import numpy as np
+
+import os
+import zlib
+from os import PathLike
+from typing import BinaryIO, Iterable, Mapping
+
+# Number of array rows converted and written per call when streaming.
+CHUNK_ROWS: int = 65536
+
+# Uncompressed size of each zlib block in VTK XML appended data.
+ZLIB_BLOCK_BYTES: int = 1 << 20
+
+# VTK cell type identifier for a two node line.
+VTK_LINE: int = 3
+
+
+def vtk_name(name: str) -> str:
+    """Return a VTK safe array name (array names may not contain whitespace).
+
+    :param name: Array name, e.g. 'major axis moments'
+    :type name: str
+    :returns: Name with whitespace replaced by underscores
+    :rtype: str
+    """
+    return '_'.join(name.split())
+
+
+def point_arrays(nodes: Nodes, solver: Solver | None = None) -> dict[str, np.ndarray]:
+    """Collect nodal loads and results as arrays ordered by node ID.
+
+    :param nodes: Collection of nodes in the structural model
+    :type nodes: Nodes
+    :param solver: Solver holding the latest global displacement vector. When
+        None or unsolved, displacements and rotations are omitted.
+    :type solver: Solver | None
+    :returns: Mapping of array name to an (n, 3) array
+    :rtype: dict[str, numpy.ndarray]
+    """
+    node_list = list(nodes.nodes.values())
+    arrays: dict[str, np.ndarray] = {
+        'applied_forces': np.array(
+            [(n.Fx, n.Fy, n.Fz) for n in node_list], dtype=float).reshape(-1, 3),
+        'applied_moments': np.array(
+            [(n.Mx, n.My, n.Mz) for n in node_list], dtype=float).reshape(-1, 3),
+    }
+    if solver is not None and solver.global_displacement_vector is not None:
+        U = np.asarray(solver.global_displacement_vector).reshape(-1, 6)
+        arrays['displacements'] = U[:, 0:3]
+        arrays['rotations'] = U[:, 3:6]
+        arrays['reactions'] = np.array(
+            [(n.Rx, n.Ry, n.Rz) for n in node_list], dtype=float).reshape(-1, 3)
+        arrays['reaction_moments'] = np.array(
+            [(n.Rmx, n.Rmy, n.Rmz) for n in node_list], dtype=float).reshape(-1, 3)
+    return arrays
+
+
+def cell_arrays(members: Members) -> dict[str, np.ndarray]:
+    """Collect submember end forces as arrays ordered like :meth:`Members.connectivity`.
+
+    Each force is split into an ``_i`` and ``_j`` scalar. The j end value is
+    negated so both ends follow the diagram sign convention used by
+    :meth:`Model.maxMbrForces`.
+
+    :param members: Collection of members in the structural model
+    :type members: Members
+    :returns: Mapping of array name to an (m,) array. Empty if unsolved.
+    :rtype: dict[str, numpy.ndarray]
+    """
+    submbrs = [
+        submbr for mbr in members.members.values()
+        for submbr in mbr.submembers.values()
+    ]
+    if not submbrs or len(submbrs[0].results['axial']) == 0:
+        return {}
+    arrays: dict[str, np.ndarray] = {}
+    for key in FORCE_KEYS:
+        forces = np.array(
+            [submbr.results[key] for submbr in submbrs], dtype=float)
+        arrays[vtk_name(key) + '_i'] = forces[:, 0]
+        arrays[vtk_name(key) + '_j'] = -forces[:, 1]
+    return arrays
+
+
+class LegacyVTKWriter():
+    """Streaming writer for binary legacy VTK unstructured grids.
+
+    Arrays are converted to big-endian in blocks of ``chunk_rows`` rows and
+    written straight to the file, so memory overhead is bounded by the chunk
+    size regardless of model size.
+
+    :ivar chunk_rows: Number of array rows converted per write
+    :type chunk_rows: int
+
+    :Example:
+
+        >>> writer = LegacyVTKWriter()
+        >>> writer.write('frame.vtk', points, cells, {'displacements': U})
+    """
+
+    def __init__(self, chunk_rows: int = CHUNK_ROWS) -> None:
+        """Initialize the writer.
+
+        :param chunk_rows: Number of array rows converted per write
+        :type chunk_rows: int
+        """
+        self.chunk_rows = chunk_rows
+
+    def write(
+        self,
+        path: str | PathLike,
+        points: np.ndarray,
+        cells: np.ndarray,
+        point_data: Mapping[str, np.ndarray] | None = None,
+        cell_data: Mapping[str, np.ndarray] | None = None,
+        title: str = 'OpenSTRAN model'
+    ) -> None:
+        """Write an unstructured grid of line cells.
+
+        :param path: Output file path, conventionally ending in '.vtk'
+        :type path: str | PathLike
+        :param points: (n, 3) array of point coordinates
+        :type points: numpy.ndarray
+        :param cells: (m, 2) array of zero-based point indices
+        :type cells: numpy.ndarray
+        :param point_data: Mapping of name to (n,) or (n, k) arrays
+        :type point_data: Mapping[str, numpy.ndarray] | None
+        :param cell_data: Mapping of name to (m,) or (m, k) arrays
+        :type cell_data: Mapping[str, numpy.ndarray] | None
+        :param title: Header line, truncated to 255 characters
+        :type title: str
+        :raises ValueError: If a data array does not match the point or cell count
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        n = len(points)
+        m = len(cells)
+
+        with open(path, 'wb') as stream:
+            self.write_text(stream, '# vtk DataFile Version 3.0')
+            self.write_text(stream, title.replace('\n', ' ')[:255])
+            self.write_text(stream, 'BINARY')
+            self.write_text(stream, 'DATASET UNSTRUCTURED_GRID')
+
+            self.write_text(stream, f'POINTS {n} double')
+            self.write_array(stream, points, '>f8')
+
+            # Each line cell is stored as [2, i, j].
+            self.write_text(stream, f'CELLS {m} {3*m}')
+            for start in range(0, m, self.chunk_rows):
+                block = cells[start:start+self.chunk_rows]
+                counts = np.full((len(block), 1), 2, dtype=np.int64)
+                stream.write(np.hstack((counts, block)).astype('>i4').tobytes())
+            stream.write(b'\n')
+            self.write_text(stream, f'CELL_TYPES {m}')
+            for start in range(0, m, self.chunk_rows):
+                stream.write(np.full(min(self.chunk_rows, m-start),
+                             VTK_LINE, dtype='>i4').tobytes())
+            stream.write(b'\n')
+
+            if point_data:
+                self.write_text(stream, f'POINT_DATA {n}')
+                self.write_attributes(stream, point_data, n)
+            if cell_data:
+                self.write_text(stream, f'CELL_DATA {m}')
+                self.write_attributes(stream, cell_data, m)
+
+    def write_attributes(self, stream: BinaryIO, data: Mapping[str, np.ndarray], count: int) -> None:
+        """Write point or cell attributes as SCALARS, VECTORS or FIELD arrays.
+
+        One component arrays are written as SCALARS, three component arrays
+        as VECTORS and any other width as a FIELD array.
+
+        :param stream: Open binary file
+        :type stream: BinaryIO
+        :param data: Mapping of name to (count,) or (count, k) arrays
+        :type data: Mapping[str, numpy.ndarray]
+        :param count: Expected number of tuples per array
+        :type count: int
+        :raises ValueError: If an array does not contain ``count`` tuples
+        """
+        fields: list[tuple[str, np.ndarray]] = []
+        for name, values in data.items():
+            values = np.asarray(values, dtype=float)
+            values = values.reshape(len(values), -1) if values.ndim else values
+            if values.ndim == 0 or len(values) != count:
+                raise ValueError(
+                    f"Array '{name}' must have {count} tuples to be written."
+                )
+            if values.shape[1] == 1:
+                self.write_text(
+                    stream, f'SCALARS {vtk_name(name)} double 1')
+                self.write_text(stream, 'LOOKUP_TABLE default')
+                self.write_array(stream, values, '>f8')
+            elif values.shape[1] == 3:
+                self.write_text(stream, f'VECTORS {vtk_name(name)} double')
+                self.write_array(stream, values, '>f8')
+            else:
+                fields.append((name, values))
+        if fields:
+            self.write_text(stream, f'FIELD FieldData {len(fields)}')
+            for name, values in fields:
+                self.write_text(
+                    stream, f'{vtk_name(name)} {values.shape[1]} {count} double')
+                self.write_array(stream, values, '>f8')
+
+    def write_array(self, stream: BinaryIO, values: np.ndarray, dtype: str) -> None:
+        """Stream an array to file in ``chunk_rows`` sized blocks.
+
+        :param stream: Open binary file
+        :type stream: BinaryIO
+        :param values: Array to write, row-major
+        :type values: numpy.ndarray
+        :param dtype: Big-endian numpy dtype string, e.g. '>f8'
+        :type dtype: str
+        """
+        for start in range(0, len(values), self.chunk_rows):
+            block = values[start:start+self.chunk_rows]
+            stream.write(np.ascontiguousarray(block, dtype=dtype).tobytes())
+        stream.write(b'\n')
+
+    def write_text(self, stream: BinaryIO, line: str) -> None:
+        """Write a single ASCII header line.
+
+        :param stream: Open binary file
+        :type stream: BinaryIO
+        :param line: Line without the trailing newline
+        :type line: str
+        """
+        stream.write(line.encode('ascii') + b'\n')
+
+
+class XMLVTKWriter():
+    """Writer for VTK XML unstructured grids (.vtu) and collections (.pvd).
+
+    Arrays are stored as appended raw binary data taken directly from the
+    array buffers, optionally split into zlib compressed blocks. The
+    geometry (points, connectivity, offsets and types) of a collection is
+    encoded once and the same bytes are appended to every step file.
+
+    :ivar compress: True to zlib compress the appended arrays
+    :type compress: bool
+    :ivar level: zlib compression level (1 fastest to 9 smallest)
+    :type level: int
+
+    :Example:
+
+        >>> writer = XMLVTKWriter(compress=True)
+        >>> writer.write_pvd('cases.pvd', points, cells, [(0, U0, {}), (1, U1, {})])
+    """
+
+    def __init__(self, compress: bool = False, level: int = 1) -> None:
+        """Initialize the writer.
+
+        :param compress: True to zlib compress the appended arrays
+        :type compress: bool
+        :param level: zlib compression level (1 fastest to 9 smallest)
+        :type level: int
+        """
+        self.compress = compress
+        self.level = level
+
+    def write_pvd(
+        self,
+        path: str | PathLike,
+        points: np.ndarray,
+        cells: np.ndarray,
+        steps: Iterable[tuple[float, Mapping[str, np.ndarray], Mapping[str, np.ndarray]]]
+    ) -> list[str]:
+        """Write a .pvd collection referencing one .vtu file per step.
+
+        Step files are written next to the collection as
+        ``<name>_0000.vtu``, ``<name>_0001.vtu``, ... and referenced by
+        relative path so the output directory can be moved as a whole.
+
+        :param path: Collection file path, conventionally ending in '.pvd'
+        :type path: str | PathLike
+        :param points: (n, 3) array of point coordinates
+        :type points: numpy.ndarray
+        :param cells: (m, 2) array of zero-based point indices
+        :type cells: numpy.ndarray
+        :param steps: Iterable of (timestep, point_data, cell_data) tuples. The
+            timestep is the value ParaView shows on its time slider, e.g. a
+            load case index, P-Delta iteration or mode number.
+        :type steps: Iterable[tuple[float, Mapping, Mapping]]
+        :returns: Paths of the written .vtu files
+        :rtype: list[str]
+        """
+        path = os.fspath(path)
+        directory, name = os.path.split(path)
+        stem = os.path.splitext(name)[0]
+        geometry = self.encode_geometry(points, cells)
+
+        files: list[str] = []
+        entries: list[str] = []
+        for i, (timestep, point_data, cell_data) in enumerate(steps):
+            file = f'{stem}_{i:04d}.vtu'
+            self.write_vtu(os.path.join(directory, file), points, cells,
+                           point_data, cell_data, geometry)
+            files.append(os.path.join(directory, file))
+            entries.append(
+                f'    <DataSet timestep="{timestep}" group="" part="0" file="{file}"/>\n')
+
+        with open(path, 'w', encoding='ascii') as stream:
+            stream.write('<?xml version="1.0"?>\n')
+            stream.write(
+                '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">\n')
+            stream.write('  <Collection>\n')
+            stream.writelines(entries)
+            stream.write('  </Collection>\n')
+            stream.write('</VTKFile>\n')
+        return files
+
+    def write_vtu(
+        self,
+        path: str | PathLike,
+        points: np.ndarray,
+        cells: np.ndarray,
+        point_data: Mapping[str, np.ndarray] | None = None,
+        cell_data: Mapping[str, np.ndarray] | None = None,
+        geometry: list[tuple[str, str, int, list[bytes | memoryview]]] | None = None
+    ) -> None:
+        """Write a single .vtu unstructured grid of line cells.
+
+        :param path: Output file path, conventionally ending in '.vtu'
+        :type path: str | PathLike
+        :param points: (n, 3) array of point coordinates
+        :type points: numpy.ndarray
+        :param cells: (m, 2) array of zero-based point indices
+        :type cells: numpy.ndarray
+        :param point_data: Mapping of name to (n,) or (n, k) arrays
+        :type point_data: Mapping[str, numpy.ndarray] | None
+        :param cell_data: Mapping of name to (m,) or (m, k) arrays
+        :type cell_data: Mapping[str, numpy.ndarray] | None
+        :param geometry: Pre-encoded geometry from :meth:`encode_geometry`,
+            reused across the steps of a collection
+        :type geometry: list | None
+        :raises ValueError: If a data array does not match the point or cell count
+        """
+        n = len(np.asarray(points).reshape(-1, 3))
+        m = len(np.asarray(cells).reshape(-1, 2))
+        if geometry is None:
+            geometry = self.encode_geometry(points, cells)
+        point_blocks = self.encode_attributes(point_data or {}, n)
+        cell_blocks = self.encode_attributes(cell_data or {}, m)
+
+        offset = 0
+        xml: list[str] = []
+
+        def data_array(name: str, vtk_type: str, components: int, size: int) -> str:
+            nonlocal offset
+            tag = (f'<DataArray type="{vtk_type}" Name="{name}" '
+                   f'NumberOfComponents="{components}" format="appended" '
+                   f'offset="{offset}"/>')
+            offset += size
+            return tag
+
+        def size(blocks: list[bytes | memoryview]) -> int:
+            return sum(memoryview(block).nbytes for block in blocks)
+
+        header = ('<VTKFile type="UnstructuredGrid" version="1.0" '
+                  'byte_order="LittleEndian" header_type="UInt64"')
+        if self.compress:
+            header += ' compressor="vtkZLibDataCompressor"'
+        xml.append('<?xml version="1.0"?>')
+        xml.append(header + '>')
+        xml.append('  <UnstructuredGrid>')
+        xml.append(f'    <Piece NumberOfPoints="{n}" NumberOfCells="{m}">')
+        xml.append('      <PointData>')
+        for name, components, blocks in point_blocks:
+            xml.append('        ' + data_array(name,
+                       'Float64', components, size(blocks)))
+        xml.append('      </PointData>')
+        xml.append('      <CellData>')
+        for name, components, blocks in cell_blocks:
+            xml.append('        ' + data_array(name,
+                       'Float64', components, size(blocks)))
+        xml.append('      </CellData>')
+        xml.append('      <Points>')
+        name, vtk_type, components, blocks = geometry[0]
+        xml.append('        ' + data_array(name,
+                   vtk_type, components, size(blocks)))
+        xml.append('      </Points>')
+        xml.append('      <Cells>')
+        for name, vtk_type, components, blocks in geometry[1:]:
+            xml.append('        ' + data_array(name,
+                       vtk_type, components, size(blocks)))
+        xml.append('      </Cells>')
+        xml.append('    </Piece>')
+        xml.append('  </UnstructuredGrid>')
+        xml.append('  <AppendedData encoding="raw">')
+
+        with open(path, 'wb') as stream:
+            stream.write(('\n'.join(xml) + '\n   _').encode('ascii'))
+            for _, _, blocks in point_blocks + cell_blocks:
+                stream.writelines(blocks)
+            for _, _, _, blocks in geometry:
+                stream.writelines(blocks)
+            stream.write(b'\n  </AppendedData>\n</VTKFile>\n')
+
+    def encode_geometry(self, points: np.ndarray, cells: np.ndarray) -> list[tuple[str, str, int, list[bytes | memoryview]]]:
+        """Encode points and line cell topology as appended data blocks.
+
+        :param points: (n, 3) array of point coordinates
+        :type points: numpy.ndarray
+        :param cells: (m, 2) array of zero-based point indices
+        :type cells: numpy.ndarray
+        :returns: List of (name, VTK type, components, blocks) for the points,
+            connectivity, offsets and types arrays, in that order
+        :rtype: list[tuple[str, str, int, list[bytes | memoryview]]]
+        """
+        points = np.asarray(points, dtype='<f8').reshape(-1, 3)
+        cells = np.asarray(cells, dtype='<i8').reshape(-1, 2)
+        m = len(cells)
+        return [
+            ('Points', 'Float64', 3, self.encode(points)),
+            ('connectivity', 'Int64', 1, self.encode(cells)),
+            ('offsets', 'Int64', 1, self.encode(
+                np.arange(2, 2*m+1, 2, dtype='<i8'))),
+            ('types', 'UInt8', 1, self.encode(
+                np.full(m, VTK_LINE, dtype=np.uint8))),
+        ]
+
+    def encode_attributes(self, data: Mapping[str, np.ndarray], count: int) -> list[tuple[str, int, list[bytes | memoryview]]]:
+        """Encode point or cell attribute arrays as appended data blocks.
+
+        :param data: Mapping of name to (count,) or (count, k) arrays
+        :type data: Mapping[str, numpy.ndarray]
+        :param count: Expected number of tuples per array
+        :type count: int
+        :returns: List of (name, components, blocks) tuples
+        :rtype: list[tuple[str, int, list[bytes | memoryview]]]
+        :raises ValueError: If an array does not contain ``count`` tuples
+        """
+        encoded: list[tuple[str, int, list[bytes | memoryview]]] = []
+        for name, values in data.items():
+            values = np.asarray(values, dtype='<f8')
+            if values.ndim == 0 or len(values) != count:
+                raise ValueError(
+                    f"Array '{name}' must have {count} tuples to be written."
+                )
+            values = values.reshape(count, -1)
+            encoded.append(
+                (vtk_name(name), values.shape[1], self.encode(values)))
+        return encoded
+
+    def encode(self, values: np.ndarray) -> list[bytes | memoryview]:
+        """Encode an array as a VTK appended data block with a UInt64 header.
+
+        Uncompressed arrays are returned as a view of the array buffer so
+        no per-value formatting or copy is made. Compressed arrays are split
+        into ``ZLIB_BLOCK_BYTES`` blocks compressed independently.
+
+        :param values: Little-endian array to encode
+        :type values: numpy.ndarray
+        :returns: Header and data buffers to be written in order
+        :rtype: list[bytes | memoryview]
+        """
+        # Viewed as bytes through NumPy, as memoryview.cast rejects empty arrays
+        raw = memoryview(np.ascontiguousarray(values).reshape(-1).view(np.uint8))
+        if not self.compress:
+            return [np.array([raw.nbytes], dtype='<u8').tobytes(), raw]
+
+        blocks = [
+            zlib.compress(raw[start:start+ZLIB_BLOCK_BYTES], self.level)
+            for start in range(0, raw.nbytes, ZLIB_BLOCK_BYTES)
+        ]
+        last = raw.nbytes - ZLIB_BLOCK_BYTES*(len(blocks)-1) if blocks else 0
+        header = np.array(
+            [len(blocks), ZLIB_BLOCK_BYTES, last] + [len(b) for b in blocks],
+            dtype='<u8'
+        )
+        return [header.tobytes()] + blocks
@@ -0,0 +1,12 @@
+"""Scaling benchmarks for OpenSTRAN.
+
+Generates parametric models (continuous beams, 2D and 3D moment frames and
+space trusses) at several sizes and mesh densities, and measures model
+build time, solve time and peak memory for each. Results are written as
+JSON or CSV so they can be compared between versions.
+
+Run from the command line with ``python -m OpenSTRAN.benchmarks``.
+"""
+
+from .models import MODELS, continuous_beam, frame_2d, frame_3d, space_truss
+from .runner import SUITES, Case, measure, run, write_csv, write_json
@@ -0,0 +1,190 @@
+from ..model import Model
+
+from typing import Callable
+
+# Global Y is vertical in every generated model.
+FIXED: list[int] = [1, 1, 1, 1, 1, 1]
+PINNED: list[int] = [1, 1, 1, 0, 0, 0]
+
+
+def continuous_beam(spans: int = 10, span_length: float = 20.0, mesh: int | str = 10) -> Model:
+    """Generate a continuous beam along global X on pinned supports.
+
+    Every span carries a uniform load of -1 kip/ft in global Y. The first
+    support also restrains torsion so the model is stable.
+
+    :param spans: Number of spans
+    :type spans: int
+    :param span_length: Span length in feet
+    :type span_length: float
+    :param mesh: Number of submembers per span, or 'adaptive'
+    :type mesh: int | str
+    :returns: The generated model
+    :rtype: Model
+    """
+    model = Model()
+    supports = [model.nodes.add_node(k*span_length, 0, 0)
+                for k in range(spans+1)]
+    for k, node in enumerate(supports):
+        node.restraint = [1, 1, 1, 1, 0, 0] if k == 0 else [0, 1, 1, 0, 0, 0]
+    for node_i, node_j in zip(supports, supports[1:]):
+        mbr = model.members.addMember(node_i, node_j, mesh=mesh)
+        mbr.add_distributed_load(-1, -1, 'Y', 0, 100)
+    return model
+
+
+def frame_2d(
+    bays: int = 3,
+    stories: int = 3,
+    bay_width: float = 20.0,
+    story_height: float = 12.0,
+    mesh: int | str = 4
+) -> Model:
+    """Generate a multi-bay, multi-story moment frame in the global XY plane.
+
+    Column bases are fixed. Beams carry -1 kip/ft in global Y and every
+    beam-column joint carries a 1 kip lateral load in global X.
+
+    :param bays: Number of bays
+    :type bays: int
+    :param stories: Number of stories
+    :type stories: int
+    :param bay_width: Bay width in feet
+    :type bay_width: float
+    :param story_height: Story height in feet
+    :type story_height: float
+    :param mesh: Number of submembers per beam and column, or 'adaptive'
+    :type mesh: int | str
+    :returns: The generated model
+    :rtype: Model
+    """
+    model = Model(plane='xy')
+    grid = [[model.nodes.add_node(i*bay_width, k*story_height, 0)
+             for i in range(bays+1)] for k in range(stories+1)]
+    for node in grid[0]:
+        node.restraint = FIXED
+    for k in range(1, stories+1):
+        for i in range(bays+1):
+            model.members.addMember(grid[k-1][i], grid[k][i], mesh=mesh)
+            grid[k][i].add_load(1, 'force', 'X')
+        for i in range(bays):
+            beam = model.members.addMember(grid[k][i], grid[k][i+1], mesh=mesh)
+            beam.add_distributed_load(-1, -1, 'Y', 0, 100)
+    return model
+
+
+def frame_3d(
+    bays_x: int = 3,
+    bays_z: int = 3,
+    stories: int = 3,
+    bay_width: float = 20.0,
+    story_height: float = 12.0,
+    mesh: int | str = 4
+) -> Model:
+    """Generate a multi-bay, multi-story space frame.
+
+    Column bases are fixed. Beams run in both global X and Z, carry
+    -1 kip/ft in global Y, and every joint carries a 1 kip lateral load in
+    global X and Z.
+
+    :param bays_x: Number of bays in global X
+    :type bays_x: int
+    :param bays_z: Number of bays in global Z
+    :type bays_z: int
+    :param stories: Number of stories
+    :type stories: int
+    :param bay_width: Bay width in feet
+    :type bay_width: float
+    :param story_height: Story height in feet
+    :type story_height: float
+    :param mesh: Number of submembers per beam and column, or 'adaptive'
+    :type mesh: int | str
+    :returns: The generated model
+    :rtype: Model
+    """
+    model = Model()
+    grid = [[[model.nodes.add_node(i*bay_width, k*story_height, j*bay_width)
+              for j in range(bays_z+1)] for i in range(bays_x+1)]
+            for k in range(stories+1)]
+    for row in grid[0]:
+        for node in row:
+            node.restraint = FIXED
+    for k in range(1, stories+1):
+        for i in range(bays_x+1):
+            for j in range(bays_z+1):
+                model.members.addMember(grid[k-1][i][j], grid[k][i][j], mesh=mesh)
+                grid[k][i][j].add_load(1, 'force', 'X')
+                grid[k][i][j].add_load(1, 'force', 'Z')
+                if i < bays_x:
+                    beam = model.members.addMember(
+                        grid[k][i][j], grid[k][i+1][j], mesh=mesh)
+                    beam.add_distributed_load(-1, -1, 'Y', 0, 100)
+                if j < bays_z:
+                    beam = model.members.addMember(
+                        grid[k][i][j], grid[k][i][j+1], mesh=mesh)
+                    beam.add_distributed_load(-1, -1, 'Y', 0, 100)
+    return model
+
+
+def space_truss(
+    bays_x: int = 4,
+    bays_z: int = 4,
+    bay_width: float = 10.0,
+    depth: float = 5.0
+) -> Model:
+    """Generate a pin-jointed double-layer grid space truss.
+
+    The top layer is a square grid at ``y = depth`` and the bottom layer a
+    grid offset by half a bay at ``y = 0``. Each bottom node is braced to the
+    four top nodes around it. The top perimeter nodes are pinned and every
+    top node carries a -1 kip load in global Y.
+
+    :param bays_x: Number of top grid bays in global X
+    :type bays_x: int
+    :param bays_z: Number of top grid bays in global Z
+    :type bays_z: int
+    :param bay_width: Grid spacing in feet
+    :type bay_width: float
+    :param depth: Distance between the layers in feet
+    :type depth: float
+    :returns: The generated model
+    :rtype: Model
+    """
+    model = Model(truss=True)
+    top = [[model.nodes.add_node(i*bay_width, depth, j*bay_width)
+            for j in range(bays_z+1)] for i in range(bays_x+1)]
+    bottom = [[model.nodes.add_node((i+0.5)*bay_width, 0, (j+0.5)*bay_width)
+               for j in range(bays_z)] for i in range(bays_x)]
+
+    def brace(node_i, node_j) -> None:
+        model.members.addTruss(node_i, node_j)
+
+    for i in range(bays_x+1):
+        for j in range(bays_z+1):
+            node = top[i][j]
+            node.add_load(-1, 'force', 'Y')
+            if i in (0, bays_x) or j in (0, bays_z):
+                node.restraint = PINNED
+            if i < bays_x:
+                brace(node, top[i+1][j])
+            if j < bays_z:
+                brace(node, top[i][j+1])
+    for i in range(bays_x):
+        for j in range(bays_z):
+            node = bottom[i][j]
+            if i+1 < bays_x:
+                brace(node, bottom[i+1][j])
+            if j+1 < bays_z:
+                brace(node, bottom[i][j+1])
+            for a, b in ((0, 0), (1, 0), (0, 1), (1, 1)):
+                brace(node, top[i+a][j+b])
+    return model
+
+
+# Model generators by name, as used by the benchmark runner.
+MODELS: dict[str, Callable[..., Model]] = {
+    'continuous_beam': continuous_beam,
+    'frame_2d': frame_2d,
+    'frame_3d': frame_3d,
+    'space_truss': space_truss,
+}
@@ -0,0 +1,240 @@
+from .. import __version__
+from .models import MODELS
+
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+
+import argparse
+import csv
+import gc
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Sequence, TextIO
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+@dataclass(slots=True)
+class Case():
+    """A generated model at one size.
+
+    :ivar model: Generator name, a key of :data:`MODELS`
+    :type model: str
+    :ivar parameters: Keyword arguments passed to the generator
+    :type parameters: dict[str, Any]
+    """
+    model: str
+    parameters: dict[str, Any] = field(default_factory=dict[str, Any])
+
+    def properties(self) -> dict[str, Any]:
+        """Return the dataclass properties as a dictionary.
+
+        :returns: Dictionary of this instance's fields
+        :rtype: dict[str, Any]
+        """
+        return asdict(self)
+
+
+def _sizes(model: str, name: str, values: Sequence[int], **parameters: Any) -> list[Case]:
+    """Build one case per value of a scaling parameter."""
+    return [Case(model, {name: v, **parameters}) for v in values]
+
+
+# Named benchmark suites. Every suite scales each model family over several
+# sizes and, for beams, several mesh densities.
+SUITES: dict[str, list[Case]] = {
+    'small': [
+        *_sizes('continuous_beam', 'spans', (5, 10, 20), mesh=10),
+        *_sizes('frame_2d', 'stories', (2, 4, 8), bays=3),
+        *_sizes('frame_3d', 'stories', (1, 2, 3), bays_x=2, bays_z=2),
+        *_sizes('space_truss', 'bays_x', (2, 4, 6), bays_z=4),
+    ],
+    'default': [
+        *_sizes('continuous_beam', 'spans', (10, 20, 40), mesh=4),
+        *_sizes('continuous_beam', 'spans', (10, 20, 40), mesh=10),
+        *_sizes('continuous_beam', 'spans', (10, 20, 40), mesh=20),
+        *_sizes('frame_2d', 'stories', (2, 4, 8, 16), bays=4),
+        *_sizes('frame_3d', 'stories', (1, 2, 4, 6), bays_x=3, bays_z=3),
+        *_sizes('space_truss', 'bays_x', (4, 8, 12), bays_z=8),
+    ],
+}
+
+
+def _peak_rss() -> int | None:
+    """Return the peak resident set size of this process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == 'darwin' else peak*1024
+
+
+def measure(case: Case) -> dict[str, Any]:
+    """Build and solve one case and return its measurements.
+
+    Peak memory is the peak resident set size of the process, so cases
+    should be measured in a fresh process (see :func:`run`) for it to
+    belong to a single case.
+
+    :param case: The case to measure
+    :type case: Case
+    :returns: Record with the case, model sizes, build and solve wall times,
+        peak memory in bytes and the solver's per-phase statistics
+    :rtype: dict[str, Any]
+    """
+    gc.collect()
+    baseline = _peak_rss()
+
+    start = time.perf_counter()
+    model = MODELS[case.model](**case.parameters)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.solve()
+    solve_time = time.perf_counter() - start
+
+    stats = model.solver.stats
+    assert stats is not None
+    return {
+        'model': case.model,
+        'parameters': dict(case.parameters),
+        'nodes': model.nodes.count,
+        'members': model.members.count,
+        'submembers': stats.elements,
+        'nDoF': stats.nDoF,
+        'free_DoF': stats.free_DoF,
+        'build_time': build_time,
+        'solve_time': solve_time,
+        'baseline_memory': baseline,
+        'peak_memory': _peak_rss(),
+        'stats': stats.to_dict(),
+    }
+
+
+def run(cases: Sequence[Case], isolate: bool = True) -> list[dict[str, Any]]:
+    """Measure a sequence of cases.
+
+    :param cases: Cases to measure, in order
+    :type cases: Sequence[Case]
+    :param isolate: True to measure each case in a fresh worker process so
+        that peak memory and allocator state are not shared between cases.
+        Defaults to True.
+    :type isolate: bool
+    :returns: One record per case as returned by :func:`measure`
+    :rtype: list[dict[str, Any]]
+
+    :Example:
+
+        >>> from OpenSTRAN.benchmarks import SUITES, run
+        >>> records = run(SUITES['small'])
+    """
+    if not isolate:
+        return [measure(case) for case in cases]
+    records = []
+    context = multiprocessing.get_context('spawn')
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            records.append(executor.submit(measure, case).result())
+    return records
+
+
+def environment() -> dict[str, Any]:
+    """Describe the machine and library versions a benchmark ran with.
+
+    :returns: Platform, Python, NumPy and OpenSTRAN versions
+    :rtype: dict[str, Any]
+    """
+    return {
+        'openstran': __version__,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': multiprocessing.cpu_count(),
+    }
+
+
+# Flat columns written by write_csv; phase times are appended per record.
+CSV_COLUMNS: tuple[str, ...] = (
+    'model', 'parameters', 'nodes', 'members', 'submembers', 'nDoF',
+    'free_DoF', 'build_time', 'solve_time', 'baseline_memory', 'peak_memory'
+)
+
+
+def write_json(records: list[dict[str, Any]], stream: TextIO) -> None:
+    """Write benchmark records and the environment as one JSON document.
+
+    :param records: Records returned by :func:`run`
+    :type records: list[dict[str, Any]]
+    :param stream: Text stream to write to
+    :type stream: TextIO
+    :returns: None
+    :rtype: None
+    """
+    json.dump({'environment': environment(), 'results': records}, stream, indent=2)
+    stream.write('\n')
+
+
+def write_csv(records: list[dict[str, Any]], stream: TextIO) -> None:
+    """Write benchmark records as CSV, one row per case.
+
+    Generator parameters are written as JSON and each solver phase as a
+    ``phase:<name>`` column.
+
+    :param records: Records returned by :func:`run`
+    :type records: list[dict[str, Any]]
+    :param stream: Text stream to write to
+    :type stream: TextIO
+    :returns: None
+    :rtype: None
+    """
+    phases = list(dict.fromkeys(
+        name for record in records for name in record['stats']['phases']))
+    writer = csv.writer(stream)
+    writer.writerow([*CSV_COLUMNS, *(f'phase:{name}' for name in phases)])
+    for record in records:
+        row = [record[column] for column in CSV_COLUMNS]
+        row[1] = json.dumps(record['parameters'], sort_keys=True)
+        row += [record['stats']['phases'].get(name) for name in phases]
+        writer.writerow(row)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point, ``python -m OpenSTRAN.benchmarks``.
+
+    :param argv: Arguments, defaults to ``sys.argv[1:]``
+    :type argv: Sequence[str] | None
+    :returns: Process exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m OpenSTRAN.benchmarks',
+        description='Measure OpenSTRAN build and solve scaling on generated models.')
+    parser.add_argument('--suite', choices=sorted(SUITES), default='small')
+    parser.add_argument('--model', action='append', choices=sorted(MODELS),
+                        help='only run these model families (repeatable)')
+    parser.add_argument('--format', choices=('json', 'csv'), default='json')
+    parser.add_argument('--output', '-o', help='output file, default stdout')
+    parser.add_argument('--no-isolate', action='store_true',
+                        help='run every case in this process')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in SUITES[args.suite]
+             if not args.model or case.model in args.model]
+    records = run(cases, isolate=not args.no_isolate)
+
+    write = write_json if args.format == 'json' else write_csv
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as stream:
+            write(records, stream)
+    else:
+        write(records, sys.stdout)
+    return 0
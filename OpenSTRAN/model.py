@@ -3,6 +3,19 @@ import numpy as np
 from .Nodes import Nodes
 from .Members import Members
 from .Solver import Solver
+from .Estimate import Estimate, estimate
+from .VTK import LegacyVTKWriter, XMLVTKWriter, point_arrays, cell_arrays
+from .Storage import save_model, load_model
+from .ResultStore import ResultStore
+from .Submember import FORCE_KEYS
+from .Elements import node_dofs
+from .Stats import SolveProgress
+from .Analysis import AnalysisResult
+
+import asyncio
+from concurrent.futures import Executor
+from os import PathLike
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Self
 
 
 class Model():
@@ -15,35 +28,54 @@ class Model():
     engineering applications.
 
     :param plane: Constrains the model to a two-dimensional plane. Valid values are 'xy',
-        'yz', or 'xz'. If None, the model is fully three-dimensional.
+        'yz', or 'zx'. Planar models are solved for the two in-plane translations
+        and the in-plane rotation of each node only; out-of-plane loads and
+        restraints are ignored. If None, the model is fully three-dimensional.
     :type plane: str | None
+    :param truss: True for a pin-jointed truss model. Members are added with
+        :meth:`Members.addTruss` and only nodal translations are solved for.
+    :type truss: bool
     :ivar nodes: Collection of nodes in the structure
     :type nodes: Nodes
     :ivar members: Collection of members (elements) in the structure
     :type members: Members
     :ivar solver: Solver instance for performing structural analysis
     :type solver: Solver
+    :ivar results: Memory-mapped result store of the last solve, if results
+        were spilled to disk
+    :type results: ResultStore | None
 
     :Example:
 
         >>> import OpenSTRAN
         >>> frame_2d = OpenSTRAN.Model(plane='xy')
         >>> frame_3d = OpenSTRAN.Model()
+        >>> truss = OpenSTRAN.Model(truss=True)
     """
 
-    def __init__(self, plane: str | None = None) -> None:
+    def __init__(self, plane: str | None = None, truss: bool = False) -> None:
         """
         Initialize a structural model.
 
-        :param plane: Plane constraint for 2D models ('xy', 'yz', or 'xz').
+        :param plane: Plane constraint for 2D models ('xy', 'yz', or 'zx').
             Defaults to None for 3D models.
         :type plane: str | None
+        :param truss: True for a truss model. Defaults to False.
+        :type truss: bool
+        :raises ValueError: If ``plane`` is not recognized
         """
+        node_dofs(truss, plane)
         self.nodes = Nodes(plane)
-        self.members = Members(self.nodes)
+        self.members = Members(self.nodes, truss=truss)
         self.solver = Solver()
-
-    def solve(self) -> None:
+        self.results: ResultStore | None = None
+
+    def solve(
+        self,
+        store: str | PathLike | None = None,
+        backend: str = 'auto',
+        memory_budget: int | None = None
+    ) -> None:
         """Solve the structural system and compute reactions and member forces.
 
         This method performs a complete finite element analysis including:
@@ -52,12 +84,250 @@ class Model():
         - Calculation of nodal reactions at restrained DOFs
         - Determination of member forces and local extrema
 
+        Timings and sizes of every phase, including the time spent meshing
+        members as they were added, are available afterwards as
+        ``self.solver.stats``.
+
+        :param store: Directory to spill results to. When given, submember end
+            forces and nodal displacements and reactions are written to a
+            memory-mapped :class:`ResultStore` available as :attr:`results`,
+            and the per-submember results are released from memory.
+        :type store: str | PathLike | None
+        :param backend: Linear solver backend, 'auto' to choose from
+            :meth:`estimate`. See :meth:`Solver.solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: Memory budget in bytes. Defaults to half of the
+            physical memory or the ``OPENSTRAN_MEMORY_BUDGET`` variable.
+        :type memory_budget: int | None
         :returns: None
         :rtype: None
+        :raises MemoryBudgetError: If the solve would exceed the memory budget
+        :raises UnstableModelError: If the model is unstable, see :attr:`Solver.check`
+        :raises SingularStiffnessError: If the stiffness matrix is singular or
+            too ill-conditioned, see :attr:`Solver.max_condition`
+        """
+        for _ in self.steps(store, backend, memory_budget):
+            pass
+
+    def steps(
+        self,
+        store: str | PathLike | None = None,
+        backend: str = 'auto',
+        memory_budget: int | None = None
+    ) -> Iterator[SolveProgress]:
+        """Solve the model one phase at a time.
+
+        Each ``next`` runs one phase of :meth:`solve`, which takes the same
+        arguments and raises the same errors: the phases of
+        :meth:`Solver.steps`, then 'extrema' and, with ``store``, 'store'.
+        Members are meshed as they are added, so the 'meshing' time in the
+        statistics is not a phase of its own. Closing the generator between
+        phases abandons the solve, leaving the model partly solved.
+
+        :param store: See :meth:`solve`. Defaults to None.
+        :type store: str | PathLike | None
+        :param backend: See :meth:`solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: See :meth:`solve`. Defaults to None.
+        :type memory_budget: int | None
+        :returns: Generator of a progress event as each phase completes
+        :rtype: Iterator[SolveProgress]
+
+        :Example:
+
+            >>> for progress in frame.steps():
+            ...     print(f"{progress.phase}: {progress.fraction:.0%}")
+        """
+        names = self.solver.phases() + ('extrema',) + (('store',) if store is not None else ())
+        completed = 0
+
+        def progress(phase: str) -> SolveProgress:
+            nonlocal completed
+            completed += 1
+            assert self.solver.stats is not None
+            return SolveProgress(
+                phase, completed, len(names), self.solver.stats.phases[phase])
+
+        for phase in self.solver.steps(self.nodes, self.members, backend, memory_budget):
+            yield progress(phase)
+        stats = self.solver.stats
+        assert stats is not None
+        stats.phases = {'meshing': self.members.mesh_time, **stats.phases}
+
+        with stats.phase('extrema'):
+            self.maxReactions()
+            self.maxMbrForces()
+        yield progress('extrema')
+        if store is not None:
+            with stats.phase('store'):
+                self.results = ResultStore.create(
+                    store, self.nodes, self.members, self.solver)
+                for mbr in self.members.members.values():
+                    for submbr in mbr.submembers.values():
+                        submbr.results = {'displacements': []}
+                        submbr.results.update({key: [] for key in FORCE_KEYS})
+                    mbr.diagram_cache.clear()
+                    mbr.spilled = True
+            yield progress('store')
+
+    async def solve_async(
+        self,
+        store: str | PathLike | None = None,
+        backend: str = 'auto',
+        memory_budget: int | None = None,
+        executor: Executor | None = None
+    ) -> AsyncIterator[SolveProgress]:
+        """Solve the model in an executor without blocking the event loop.
+
+        Runs the phases of :meth:`steps` one at a time in ``executor`` and
+        yields a progress event as each completes. Cancelling the awaiting
+        task, or leaving the ``async for`` early, abandons the solve between
+        phases: a phase already running finishes in its worker, which is
+        never killed, and the rest are skipped, leaving the model partly
+        solved. Errors of a phase are raised from the ``async for``.
+
+        Several models may be solved at once, but not the same model twice.
+
+        :param store: See :meth:`solve`. Defaults to None.
+        :type store: str | PathLike | None
+        :param backend: See :meth:`solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: See :meth:`solve`. Defaults to None.
+        :type memory_budget: int | None
+        :param executor: Executor to run the phases in, None for the event
+            loop's default thread pool. Defaults to None.
+        :type executor: concurrent.futures.Executor | None
+        :returns: Asynchronous generator of a progress event per phase
+        :rtype: AsyncIterator[SolveProgress]
+
+        :Example:
+
+            >>> async for progress in frame.solve_async():
+            ...     await websocket.send_json(progress.properties())
         """
-        self.solver.solve(self.nodes, self.members)
-        self.maxReactions()
-        self.maxMbrForces()
+        loop = asyncio.get_running_loop()
+        steps = self.steps(store, backend, memory_budget)
+        future: asyncio.Future[SolveProgress | None] | None = None
+        try:
+            while True:
+                future = loop.run_in_executor(executor, next, steps, None)
+                # Shielded so a cancellation waits for the phase in the worker.
+                progress = await asyncio.shield(future)
+                if progress is None:
+                    return
+                yield progress
+        finally:
+            if future is None or future.done():
+                steps.close()
+            else:
+                future.add_done_callback(lambda _: steps.close())
+
+    def analyze(
+        self,
+        loads: np.ndarray | None = None,
+        backend: str = 'auto',
+        memory_budget: int | None = None
+    ) -> AnalysisResult:
+        """Solve the model without changing it and return the results.
+
+        Unlike :meth:`solve`, nothing is written to the nodes, members or
+        :attr:`solver`, whose settings are used, so several threads may
+        analyze one model at once, e.g. for different load cases. See
+        :meth:`Solver.analyze`.
+
+        :param loads: (N, 6) nodal loads [Fx, Fy, Fz, Mx, My, Mz] in global
+            axes ordered by node ID, solved for in place of all the loads
+            applied to the model. The point and distributed loads on members
+            are left out too, so the results are those of ``loads`` alone.
+            Defaults to None for the model's loads.
+        :type loads: numpy.ndarray | None
+        :param backend: Linear solver backend, see :meth:`solve`. Defaults to 'auto'.
+        :type backend: str
+        :param memory_budget: Memory budget in bytes, see :meth:`solve`.
+            Defaults to None.
+        :type memory_budget: int | None
+        :returns: Displacements, reactions and submember end forces
+        :rtype: AnalysisResult
+        :raises ValueError: If ``loads`` does not have six entries per node
+        :raises MemoryBudgetError: If the solve would exceed the memory budget
+        :raises UnstableModelError: If the model is unstable, see :attr:`Solver.check`
+        :raises SingularStiffnessError: If the stiffness matrix is singular or
+            too ill-conditioned, see :attr:`Solver.max_condition`
+
+        :Example:
+
+            >>> wind = np.zeros((frame.nodes.count, 6))
+            >>> wind[[3, 7], 0] = 12.5
+            >>> with ThreadPoolExecutor() as executor:
+            ...     gravity, lateral = executor.map(frame.analyze, [None, wind])
+            >>> lateral.node_displacements[7, 0]
+        """
+        return self.solver.analyze(self.nodes, self.members, loads, backend, memory_budget)
+
+    def estimate(self, memory_budget: int | None = None) -> Estimate:
+        """Predict the size and cost of solving the model without assembling it.
+
+        :param memory_budget: Memory budget in bytes to select a backend
+            against. Defaults to that used by :meth:`solve`.
+        :type memory_budget: int | None
+        :returns: Degrees of freedom, memory and flops per backend, and the
+            backend :meth:`solve` would select
+        :rtype: Estimate
+
+        :Example:
+
+            >>> frame.estimate().backend
+            'banded'
+        """
+        return estimate(self.nodes, self.members, memory_budget)
+
+    def save(self, path: str | PathLike, compress: bool = False) -> None:
+        """Save the model geometry, loads and results to a binary .npz file.
+
+        Nodes, members and submembers are stored column by column (coordinates,
+        connectivity, section properties, releases, loads, equivalent nodal
+        actions and results) so that :meth:`load` can rebuild the model in
+        bulk instead of replaying every ``add_node``/``addMember`` call.
+        Results written to a :class:`ResultStore` by ``solve(store=...)`` are
+        not saved again; the model is saved unsolved and the results stay in
+        the store.
+
+        :param path: Output file path, conventionally ending in '.npz'
+        :type path: str | PathLike
+        :param compress: True to zlib compress the file
+        :type compress: bool
+        :returns: None
+        :rtype: None
+
+        :Example:
+
+            >>> frame.save('frame.npz')
+            >>> frame = OpenSTRAN.Model.load('frame.npz')
+        """
+        save_model(self.nodes, self.members, self.solver, path, compress)
+
+    @classmethod
+    def load(cls, path: str | PathLike, workers: int | None = None) -> Self:
+        """Load a model saved with :meth:`save`.
+
+        :param path: Path of the .npz file
+        :type path: str | PathLike
+        :param workers: Threads building the element matrices, kept as
+            :attr:`Solver.workers` of the loaded model. Defaults to None.
+        :type workers: int | None
+        :returns: The restored model, including results if it had been solved
+        :rtype: Self
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            plane = str(archive['plane']) or None
+            truss = bool(archive['truss']) if 'truss' in archive.files else False
+        model = cls(plane, truss)
+        model.solver.workers = workers
+        load_model(model.nodes, model.members, model.solver, path)
+        if model.solver.global_displacement_vector is not None:
+            model.maxReactions()
+            model.maxMbrForces()
+        return model
 
     def maxReactions(self) -> None:
         """Calculate maximum reaction forces and moments at restrained nodes.
@@ -85,7 +355,7 @@ class Model():
         Rmz: list[float] = []
 
         for node in self.nodes.nodes.values():
-            if node.mesh_node != False:
+            if node.mesh_node == False:
                 Rx.append(node.Rx)
                 Ry.append(node.Ry)
                 Rz.append(node.Rz)
@@ -105,7 +375,9 @@ class Model():
 
         Computes the maximum values for all member internal forces (axial, shear, torsion,
         and bending moments) and identifies their local maxima and minima distributions
-        along members.
+        along members. The maximum values also include the diagrams of members with
+        span loads (see :meth:`Member.diagram`), so extrema between mesh nodes are
+        found however coarse the mesh.
 
         :returns: None
         :rtype: None
@@ -141,27 +413,34 @@ class Model():
                 Myy.append(submbr.results['minor axis moments'][0])
                 Myy.append(submbr.results['minor axis moments'][1]*-1)
 
-        self.axial_max = abs(max(axial, key=lambda x: abs(x)))
+        # Internal forces between the nodes of members with span loads
+        spans: dict[str, list[float]] = {key: [] for key in FORCE_KEYS}
+        for mbr in self.members.members.values():
+            if any(submbr.loads for submbr in mbr.submembers.values()):
+                for key in FORCE_KEYS:
+                    spans[key].extend(mbr.diagram(key)[1].tolist())
+
+        self.axial_max = abs(max(axial + spans['axial'], key=lambda x: abs(x)))
         self.axial_maxima = self.localMaxima(axial)
         self.axial_minima = self.localMinima(axial)
 
-        self.torque_max = abs(max(torque, key=lambda x: abs(x)))
+        self.torque_max = abs(max(torque + spans['torsional moments'], key=lambda x: abs(x)))
         self.torque_maxima = self.localMaxima(torque)
         self.torque_minima = self.localMinima(torque)
 
-        self.Vy_max = abs(max(Vy, key=lambda x: abs(x)))
+        self.Vy_max = abs(max(Vy + spans['shear'], key=lambda x: abs(x)))
         self.Vy_maxima = self.localMaxima(Vy)
         self.Vy_minima = self.localMinima(Vy)
 
-        self.Vz_max = abs(max(Vz, key=lambda x: abs(x)))
+        self.Vz_max = abs(max(Vz + spans['transverse shear'], key=lambda x: abs(x)))
         self.Vz_maxima = self.localMaxima(Vz)
         self.Vz_minima = self.localMinima(Vz)
 
-        self.Mzz_max = abs(max(Mzz, key=lambda x: abs(x)))
+        self.Mzz_max = abs(max(Mzz + spans['major axis moments'], key=lambda x: abs(x)))
         self.Mzz_maxima = self.localMaxima(Mzz)
         self.Mzz_minima = self.localMinima(Mzz)
 
-        self.Myy_max = abs(max(Myy, key=lambda x: abs(x)))
+        self.Myy_max = abs(max(Myy + spans['minor axis moments'], key=lambda x: abs(x)))
         self.Myy_maxima = self.localMaxima(Myy)
         self.Myy_minima = self.localMinima(Myy)
 
@@ -262,3 +541,103 @@ class Model():
                 print(f'\t\tMx = {node.Mx:.2f} kip-ft')
                 print(f'\t\tMy = {node.My:.2f} kip-ft')
                 print(f'\t\tMz = {node.Mz:.2f} kip-ft')
+
+    def result_arrays(self) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """Return a snapshot of the current loads and results as arrays.
+
+        Collecting a snapshot after each analysis (load case, combination,
+        P-Delta iteration, ...) provides the steps exported by :meth:`to_pvd`.
+
+        :returns: Tuple of (point data ordered by node ID, cell data ordered
+            like :meth:`Members.connectivity`)
+        :rtype: tuple[dict[str, numpy.ndarray], dict[str, numpy.ndarray]]
+        """
+        points = point_arrays(self.nodes, self.solver)
+        cells = cell_arrays(self.members)
+        # Copy so later solves do not modify a stored snapshot.
+        return (
+            {k: np.array(v) for k, v in points.items()},
+            {k: np.array(v) for k, v in cells.items()}
+        )
+
+    def to_vtk(
+        self,
+        path: str | PathLike,
+        point_data: Mapping[str, np.ndarray] | None = None,
+        cell_data: Mapping[str, np.ndarray] | None = None
+    ) -> None:
+        """Export the model and its results to a binary legacy VTK file.
+
+        Nodes are written as points and submembers as line cells. Point data
+        holds applied loads and, once solved, displacements, rotations and
+        reactions. Cell data holds the submember end forces split into
+        ``_i`` and ``_j`` scalars. The file can be opened directly in ParaView.
+
+        :param path: Output file path, conventionally ending in '.vtk'
+        :type path: str | PathLike
+        :param point_data: Additional nodal arrays to write, e.g. results of
+            individual load cases, keyed by name and ordered by node ID
+        :type point_data: Mapping[str, numpy.ndarray] | None
+        :param cell_data: Additional submember arrays to write, ordered like
+            :meth:`Members.connectivity`
+        :type cell_data: Mapping[str, numpy.ndarray] | None
+        :returns: None
+        :rtype: None
+
+        :Example:
+
+            >>> frame.solve()
+            >>> frame.to_vtk('frame.vtk')
+        """
+        points, cells = self.result_arrays()
+        points.update(point_data or {})
+        cells.update(cell_data or {})
+        LegacyVTKWriter().write(
+            path,
+            self.nodes.coordinate_array(),
+            self.members.connectivity(),
+            points,
+            cells
+        )
+
+    def to_pvd(
+        self,
+        path: str | PathLike,
+        steps: Iterable[tuple[float, Mapping[str, np.ndarray], Mapping[str, np.ndarray]]] | None = None,
+        compress: bool = False
+    ) -> list[str]:
+        """Export a series of results as a ParaView collection of .vtu files.
+
+        Each step is written to its own .vtu file using appended raw binary
+        data, optionally zlib compressed, and listed in the .pvd collection
+        with its timestep. The geometry is encoded once and reused for every
+        step.
+
+        :param path: Collection file path, conventionally ending in '.pvd'
+        :type path: str | PathLike
+        :param steps: Iterable of (timestep, point_data, cell_data) tuples,
+            e.g. built from :meth:`result_arrays` after each load case or
+            iteration. Defaults to a single step holding the current results.
+        :type steps: Iterable[tuple[float, Mapping, Mapping]] | None
+        :param compress: True to zlib compress the appended data
+        :type compress: bool
+        :returns: Paths of the written .vtu files
+        :rtype: list[str]
+
+        :Example:
+
+            >>> steps = []
+            >>> for i, load in enumerate(loads):
+            ...     apply(load)
+            ...     frame.solve()
+            ...     steps.append((i, *frame.result_arrays()))
+            >>> frame.to_pvd('cases.pvd', steps, compress=True)
+        """
+        if steps is None:
+            steps = [(0, *self.result_arrays())]
+        return XMLVTKWriter(compress=compress).write_pvd(
+            path,
+            self.nodes.coordinate_array(),
+            self.members.connectivity(),
+            steps
+        )
@@ -1,14 +1,24 @@
 import os
 import sqlite3
+import threading
+from functools import lru_cache
+
+# Maximum number of labels bound to a single IN (...) query. SQLite limits
+# the number of host parameters per statement (999 in older builds).
+MAX_PARAMETERS = 900
 
 class QuerySteelDb():
+	# Read-only connections are opened once per thread and shared by every
+	# instance, since sqlite3 connections may not cross threads.
+	pool = threading.local()
+
 	def __init__(self):
 		self.path = os.path.join(os.path.dirname(__file__),'Steel_Sections.db')
 		self.table = 'AISC_SSDB_V15'
 		self.headers = [
 		'Type', 'EDI_Std_Nomenclature', 'AISC_Manual_Label', 'T_F', 'W', 'A', 'd', 'ddet',
 		'Ht', 'h1', 'OD', 'bf', 'bfdet', 'B1', 'b2', 'ID', 'tw', 'twdet', 'twdet_over_2',
-		'tf', 'tfdet', 't1', 'tnom', 'tdes', 'kdes', 'kdet', 'k1', 'x', 'y', 'eo', 'xp', 
+		'tf', 'tfdet', 't1', 'tnom', 'tdes', 'kdes', 'kdet', 'k1', 'x', 'y', 'eo', 'xp',
 		'yp', 'bf_over_2tf', 'b_over_t', 'b_over_tdes', 'h_over_tw', 'h_over_tdes', 'D_over_t',
 		'Ix', 'Zx', 'Sx', 'rx', 'Iy', 'Zy', 'Sy', 'ry', 'Iz', 'rz', 'Sz', 'J', 'Cw', 'C', 'Wno',
 		'Sw1', 'Sw2', 'Sw3', 'Qf', 'Qw', 'ro', 'H', 'tana', 'Iw', 'zA', 'zB', 'zC', 'wA', 'wB',
@@ -28,15 +38,24 @@ class QuerySteelDb():
 		self.records = []
 
 	def Connect(self):
-		self.connection = sqlite3.connect(self.path)
+		# Reuse this thread's read-only connection, opening it on first use.
+		if not hasattr(self.pool, 'connections'):
+			self.pool.connections = {}
+		self.connection = self.pool.connections.get(self.path)
+		if self.connection is None:
+			self.connection = sqlite3.connect(
+				'file:{path}?mode=ro'.format(path=self.path), uri=True)
+			self.pool.connections[self.path] = self.connection
 		self.cursor = self.connection.cursor()
 
 	def Disconnect(self):
-		self.connection.commit()
-		self.connection.close()
+		# Close this thread's pooled connection. The next query reopens it.
+		connection = getattr(self.pool, 'connections', {}).pop(self.path, None)
+		if connection is not None:
+			connection.close()
 
 	def FormatRecords(self, records, Query):
-		if Query in ['Get_AISC_Manual_Labels','Get_AISC_Manual_Types']:
+		if Query in ['Get_AISC_Manual_Labels','Get_AISC_Manual_Types','Get_Shapes']:
 			for i, record in enumerate(records):
 				records[i] = record[0]
 			return(records)
@@ -45,7 +64,7 @@ class QuerySteelDb():
 
 
 	def ReturnRecords(self, records, Query):
-		if records == None:
+		if not records:
 			return('No Records Found')
 		else:
 			return(self.FormatRecords(records, Query))
@@ -56,7 +75,6 @@ class QuerySteelDb():
 		self.cursor.execute(self.sql_select_query)
 		self.records = self.cursor.fetchall()
 		return(self.ReturnRecords(self.records, 'Get_AISC_Manual_Types'))
-		self.Disconnect()
 
 	def Get_AISC_Manual_Labels(self, Type):
 		self.Connect()
@@ -64,20 +82,48 @@ class QuerySteelDb():
 		self.cursor.execute(self.sql_select_query, (Type,))
 		self.records = self.cursor.fetchall()
 		return(self.ReturnRecords(self.records, 'Get_AISC_Manual_Labels'))
-		self.Disconnect()
 
 	def Get_Section_Properties(self, AISC_Manual_Label):
+		# Copy the cached record so callers cannot modify the cache.
+		properties = self.CachedSectionProperties(AISC_Manual_Label)
+		if isinstance(properties, dict):
+			return({k: list(v) for k, v in properties.items()})
+		return(properties)
+
+	def CachedSectionProperties(self, AISC_Manual_Label):
+		return(cached_section_properties(self.path, self.table, AISC_Manual_Label))
+
+	def get_many(self, labels):
+		# Resolve many labels with one IN (...) query per MAX_PARAMETERS labels.
+		# Returns {label: properties} for the labels found in the database.
+		labels = list(dict.fromkeys(labels))
+		results = {}
 		self.Connect()
-		self.sql_select_query = """SELECT * FROM {Table} WHERE AISC_Manual_Label = ?""".format(Table=self.table)
-		self.cursor.execute(self.sql_select_query, (AISC_Manual_Label,))
-		self.records = self.cursor.fetchall()
-		return(self.ReturnRecords(self.records, 'Get_Section_Properties'))
-		self.Disconnect()
+		for start in range(0, len(labels), MAX_PARAMETERS):
+			chunk = labels[start:start+MAX_PARAMETERS]
+			self.sql_select_query = """SELECT * FROM {Table} WHERE AISC_Manual_Label IN ({Parameters})""".format(
+				Table=self.table, Parameters=','.join('?'*len(chunk)))
+			self.cursor.execute(self.sql_select_query, chunk)
+			for record in self.cursor.fetchall():
+				results[record[2]] = self.FormatRecords([record], 'Get_Section_Properties')
+		return(results)
 
 	def Get_Shapes(self, Type, Label):
 		self.Connect()
-		self.sql_select_query = """SELECT AIC_Manual_Label FROM {Table} WHERE Type = ? AND AISC_Manual_Label LIKE ?""".format(Table=self.table)
-		self.cursor.execute(self.sql_select_query, (Type,), ('%'+Label+'%',))
+		self.sql_select_query = """SELECT AISC_Manual_Label FROM {Table} WHERE Type = ? AND AISC_Manual_Label LIKE ?""".format(Table=self.table)
+		self.cursor.execute(self.sql_select_query, (Type, '%'+Label+'%'))
 		self.records = self.cursor.fetchall()
 		return(self.ReturnRecords(self.records, 'Get_Shapes'))
-		self.Disconnect()
+
+
+@lru_cache(maxsize=4096)
+def cached_section_properties(path, table, AISC_Manual_Label):
+	# Shared across instances and threads; keyed by database and label.
+	query = QuerySteelDb()
+	query.path = path
+	query.table = table
+	query.Connect()
+	query.sql_select_query = """SELECT * FROM {Table} WHERE AISC_Manual_Label = ?""".format(Table=table)
+	query.cursor.execute(query.sql_select_query, (AISC_Manual_Label,))
+	query.records = query.cursor.fetchall()
+	return(query.ReturnRecords(query.records, 'Get_Section_Properties'))
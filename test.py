@@ -10,8 +10,8 @@ N1 = simpleBeam.nodes.add_node(0, 0, 0)  # (X [ft], Y [ft], Z[ft])
 # create a node 10 feet away from the origin along the global X axis.
 N2 = simpleBeam.nodes.add_node(10, 0, 0)  # (X [ft], Y [ft], Z[ft])
 
-# restrain the nodes from translation.
-N1.restraint = [1, 1, 1, 0, 0, 0]  # [Ux, Uy, Uz, φx, φy, φz] -> pinned node
+# restrain the nodes from translation and N1 from twisting about the member.
+N1.restraint = [1, 1, 1, 1, 0, 0]  # [Ux, Uy, Uz, φx, φy, φz] -> pinned node, restrained against twisting
 N2.restraint = [1, 1, 1, 0, 0, 0]  # [Ux, Uy, Uz, φx, φy, φz] -> pinned node
 
 # define a member between nodes N1 and N2.
@@ -29,5 +29,8 @@ stop = time.time()
 
 print(f"time to run: {stop-start:2f} seconds")
 
+# print the time spent in each phase of the solve and the problem size.
+print(simpleBeam.solver.stats.to_json(indent=2))
+
 # print the nodal reactions to the terminal.
 # simpleBeam.reactions()
@@ -0,0 +1,55 @@
+from OpenSTRAN.model import Model
+
+import pytest
+
+
+def simple_beam(mesh: int | str = 10, span: float = 20.0):
+    """A simply supported beam along X, returning the model, supports and member."""
+    frame = Model(plane='xy')
+    N1 = frame.nodes.add_node(0, 0, 0)
+    N2 = frame.nodes.add_node(span, 0, 0)
+    N1.restraint = [1, 1, 1, 1, 0, 0]
+    N2.restraint = [0, 1, 1, 0, 0, 0]
+    M1 = frame.members.addMember(N1, N2, mesh=mesh)
+    return frame, N1, N2, M1
+
+
+def test_uniform_load_moment_and_deflection() -> None:
+    """A uniform load gives wL^2/8 at midspan and a deflection of 5wL^4/384EI."""
+    w, L = 1.0, 20.0
+    frame, _, _, M1 = simple_beam(span=L)
+    M1.add_distributed_load(-w, -w, 'Y', 0, 100)
+
+    frame.solve()
+
+    _, moments = M1.diagram('major axis moments')
+    assert -moments.min() == pytest.approx(w*L**2/8*12)
+    delta, _ = M1.max_deflection()
+    assert delta == pytest.approx(5*(w/12)*(L*12)**4/(384*M1.E*M1.Ixx))
+
+
+def test_point_load_moment() -> None:
+    """A point load P at a from one support gives Pab/L under the load."""
+    P, L, a = 10.0, 20.0, 6.0
+    frame, N1, N2, M1 = simple_beam(span=L)
+    M1.add_point_load(-P, 'Y', 100*a/L)
+
+    frame.solve()
+
+    x, moments = M1.diagram('major axis moments', [100*a/L])
+    assert x[0] == pytest.approx(a)
+    assert -moments[0] == pytest.approx(P*a*(L-a)/L*12)
+    assert N1.Ry == pytest.approx(P*(L-a)/L)
+    assert N2.Ry == pytest.approx(P*a/L)
+
+
+@pytest.mark.parametrize('mesh', [1, 5, 'adaptive'])
+def test_reactions_do_not_depend_on_mesh(mesh: int | str) -> None:
+    """Support reactions of a uniformly loaded beam are exact on any mesh."""
+    frame, N1, N2, M1 = simple_beam(mesh=mesh, span=10.0)
+    M1.add_distributed_load(-1.0, -1.0, 'Y', 0, 100)
+
+    frame.solve()
+
+    assert N1.Ry == pytest.approx(5.0)
+    assert N2.Ry == pytest.approx(5.0)
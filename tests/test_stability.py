@@ -0,0 +1,45 @@
+from OpenSTRAN.model import Model
+
+import pytest
+
+
+@pytest.mark.parametrize('plane, axis', [('xy', 0), ('zx', 0), ('yz', 1)])
+def test_hinged_beam_in_every_plane(plane: str, axis: int) -> None:
+    """A beam with a hinge at its pinned end solves in every plane."""
+    frame = Model(plane=plane)
+    coordinates = [[0.0, 0.0, 0.0] for _ in range(3)]
+    for k, point in enumerate(coordinates):
+        point[axis] = 10.0*k
+    N1, N2, N3 = [frame.nodes.add_node(*point) for point in coordinates]
+    N1.restraint = [1, 1, 1, 1, 1, 1]
+    N3.restraint = [1, 1, 1, 0, 0, 0]
+    M1 = frame.members.addMember(N1, N2, mesh=2)
+    frame.members.addMember(N2, N3, mesh=2, j_release=True)
+    direction = 'Y' if plane == 'xy' else 'Z'
+    M1.add_point_load(-1.0, direction, 50)
+
+    frame.solve()
+
+    reaction = 'Ry' if plane == 'xy' else 'Rz'
+    assert getattr(N1, reaction) + getattr(N3, reaction) == pytest.approx(1.0)
+    assert getattr(N3, reaction) == pytest.approx(0.0859375)
+
+
+def test_pinned_column_base() -> None:
+    """A column pinned at its base by an end release is not a mechanism."""
+    frame = Model()
+    N1 = frame.nodes.add_node(0, 0, 0)
+    N2 = frame.nodes.add_node(0, 12, 0)
+    N3 = frame.nodes.add_node(10, 12, 0)
+    N4 = frame.nodes.add_node(10, 0, 0)
+    N1.restraint = [1, 1, 1, 0, 0, 0]
+    N4.restraint = [1, 1, 1, 1, 1, 1]
+    frame.members.addMember(N1, N2, i_release=True)
+    frame.members.addMember(N2, N3)
+    frame.members.addMember(N4, N3)
+    N2.Fx = 10.0
+
+    frame.solve()
+
+    assert N1.Rx + N4.Rx == pytest.approx(-10.0)
+    assert N1.Rmz == 0.0
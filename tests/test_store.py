@@ -0,0 +1,22 @@
+from OpenSTRAN.model import Model
+
+from pathlib import Path
+
+import pytest
+
+
+def test_diagram_after_spilling_results(tmp_path: Path) -> None:
+    """Diagrams of a model solved into a ResultStore point to the store."""
+    frame = Model(plane='xy')
+    N1 = frame.nodes.add_node(0, 0, 0)
+    N2 = frame.nodes.add_node(20, 0, 0)
+    N1.restraint = [1, 1, 1, 1, 0, 0]
+    N2.restraint = [0, 1, 1, 0, 0, 0]
+    M1 = frame.members.addMember(N1, N2, mesh=4)
+    M1.add_distributed_load(-1.0, -1.0, 'Y', 0, 100)
+
+    frame.solve(store=tmp_path)
+
+    with pytest.raises(ValueError, match='Model.results'):
+        M1.diagram('major axis moments')
+    assert frame.results.member_forces(1, 'major axis moments')[1, 1] == pytest.approx(600.0)
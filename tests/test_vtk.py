@@ -0,0 +1,18 @@
+from OpenSTRAN.model import Model
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_pvd_of_model_without_members(tmp_path: Path, compress: bool) -> None:
+    """Models with nodes but no members export empty cell arrays."""
+    frame = Model()
+    frame.nodes.add_node(0, 0, 0)
+    frame.nodes.add_node(10, 0, 0)
+
+    frame.to_pvd(tmp_path / 'frame.pvd', compress=compress)
+
+    assert (tmp_path / 'frame.pvd').exists()
+    assert list(tmp_path.glob('frame_*.vtu'))